@@ -10,7 +10,6 @@ setup(
         'pandas',
         'numba',
         'scipy',
-        'fastdtw'
     ],
     description='A collection of TradingView indicators implemented in Python',
     author='Author',
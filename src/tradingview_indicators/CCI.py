@@ -2,16 +2,62 @@ from typing import Literal
 
 import pandas as pd
 import numpy as np
+from numba import njit
 from .errors_exceptions import InvalidArgumentError
-from .moving_average import ema, sema, rma
+from .moving_average import (
+    ema,
+    sema,
+    rma,
+    SmaState,
+    EmaState,
+    RmaState,
+    SemaState,
+)
+from .rolling_sum import rolling_mean_numba
 
 
+@njit
+def rolling_mad_numba(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the rolling mean absolute deviation (MAD) of the input
+    array around the window mean using Numba.
+
+    The window means come from the compensated rolling sum engine and
+    the deviations are summed in place, so no window is copied.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The number of periods to include in the window.
+
+    Returns:
+    --------
+    np.ndarray
+        The rolling MAD values, with NaN for the first `length - 1`
+        values and for windows containing NaN.
+    """
+    means = rolling_mean_numba(source, length)
+    mad = np.full(len(source), np.nan)
+    for i in range(length - 1, len(source)):
+        mean = means[i]
+        if np.isnan(mean):
+            continue
+
+        deviation_sum = 0.0
+        for j in range(i - length + 1, i + 1):
+            deviation_sum += abs(source[j] - mean)
+        mad[i] = deviation_sum / length
+    return mad
+
 def ccc(
     source: pd.Series,
     length: int = 20,
     constant: float = 0.015,
     method: Literal['sma', 'ema', 'dema', 'tema', 'rma'] = 'sma',
-) -> pd.DataFrame:
+    cci_only: bool = False,
+) -> pd.DataFrame | pd.Series:
     """
     Calculate Commodity Channel Index (CCI)  of the input time series
     data.
@@ -29,25 +75,27 @@ def ccc(
     method : str, optional
         The method to use for the moving average calculation.
         (default: "sma")
+    cci_only : bool, optional
+        Whether to return only the CCI values as a Series.
+        (default: False)
+
     Returns:
     --------
-    pd.DataFrame
-        The calculated CCI data as a DataFrame.
+    pd.DataFrame or pd.Series
+        The calculated CCI data as a DataFrame, or the CCI Series if
+        `cci_only` is True.
 
     Raises:
     -------
     InvalidArgumentError
         If the method is not 'sma', 'ema', 'sema', or 'rma'.
     """
-    source_arr = np.array(source)
+    source_arr = np.asarray(source, dtype=np.float64)
+    index = source.index[length - 1 :]
 
     match method:
         case "sma":
-            ma = np.convolve(
-                source_arr,
-                np.ones(length) / length,
-                mode="valid"
-            )
+            ma = rolling_mean_numba(source_arr, length)[length - 1 :]
         case "ema":
             ma = ema(source, length)
         case "dema":
@@ -61,19 +109,200 @@ def ccc(
             "Method must be 'sma', 'ema', 'sema', or 'rma'."
         )
 
-    window = np.lib.stride_tricks.sliding_window_view(
-        source_arr,
-        length,
+    if isinstance(ma, pd.Series):
+        ma = ma.reindex(index).to_numpy()
+
+    mad = rolling_mad_numba(source_arr, length)[length - 1 :]
+    cci = (source_arr[length - 1 :] - ma) / (constant * mad)
+
+    if cci_only:
+        return pd.Series(cci, index=index, name="CCI")
+
+    return pd.DataFrame(
+        {"source": source[length - 1 :], "mad": mad, "ma": ma, "CCI": cci},
+        index=index,
     )
 
-    mean_window = np.mean(window, axis=1)
-    abs_diff = np.abs(window - mean_window[:, np.newaxis])
-    mad = np.mean(abs_diff, axis=1)
 
-    df = pd.DataFrame()
-    df["source"] = source[length - 1 :]
-    df["mad"] = mad
-    df["ma"] = ma
-    df["CCI"] = (df["source"] - df["ma"])  / (constant * df["mad"])
+class CciState:
+    """
+    Stateful Commodity Channel Index (CCI) updater.
+
+    Keeps the last `length` values in a ring buffer next to the state
+    of the moving average, and consumes one value at a time in
+    O(length).
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the CCI calculation.
+    constant : float
+        The constant factor for CCI calculation.
+    method : str
+        The method to use for the moving average calculation.
+    ma_state : SmaState, EmaState, RmaState or SemaState
+        The state of the moving average.
+    window : np.ndarray
+        The ring buffer of the last `length` values.
+    count : int
+        The number of values consumed.
+    value : float
+        The last calculated CCI value (NaN during the warm-up).
+    """
+    def __init__(
+        self,
+        length: int = 20,
+        constant: float = 0.015,
+        method: Literal['sma', 'ema', 'dema', 'tema', 'rma'] = 'sma',
+    ) -> None:
+        """
+        Initialize an empty CCI state.
+
+        Parameters:
+        -----------
+        length : int, optional
+            The number of periods to include in the CCI calculation
+            (default: 20)
+        constant : float, optional
+            The constant factor for CCI calculation.
+            (default: 0.015)
+        method : str, optional
+            The method to use for the moving average calculation.
+            (default: "sma")
+        """
+        if length < 1:
+            raise ValueError("length must be a positive integer")
+
+        match method:
+            case "sma":
+                self.ma_state = SmaState(length)
+            case "ema":
+                self.ma_state = EmaState(length)
+            case "dema":
+                self.ma_state = SemaState(length, 2)
+            case "tema":
+                self.ma_state = SemaState(length, 3)
+            case "rma":
+                self.ma_state = RmaState(length)
+            case _:
+                raise InvalidArgumentError(
+                "Method must be 'sma', 'ema', 'sema', or 'rma'."
+            )
+
+        self.length = length
+        self.constant = constant
+        self.method = method
+        self.window = np.full(length, np.nan)
+        self.count = 0
+        self.value = np.nan
+
+    @classmethod
+    def from_source(
+        cls,
+        source: pd.Series,
+        length: int = 20,
+        constant: float = 0.015,
+        method: Literal['sma', 'ema', 'dema', 'tema', 'rma'] = 'sma',
+    ) -> "CciState":
+        """
+        Create a CCI state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int, optional
+            The number of periods to include in the CCI calculation
+            (default: 20)
+        constant : float, optional
+            The constant factor for CCI calculation.
+            (default: 0.015)
+        method : str, optional
+            The method to use for the moving average calculation.
+            (default: "sma")
+
+        Returns:
+        --------
+        CciState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length, constant, method)
+        ma_class = type(state.ma_state)
+        if isinstance(state.ma_state, SemaState):
+            state.ma_state = ma_class.from_source(
+                source, length, state.ma_state.smooth
+            )
+        else:
+            state.ma_state = ma_class.from_source(source, length)
+
+        last_values = source.to_numpy(dtype=np.float64)[-length:]
+        state.count = len(source)
+        for offset, value in enumerate(last_values):
+            position = (state.count - len(last_values) + offset) % length
+            state.window[position] = value
 
-    return df
+        if state.count >= length:
+            cci = ccc(source, length, constant, method, cci_only=True)
+            state.value = float(cci.iloc[-1])
+        return state
+
+    def update(self, value: float) -> float:
+        """
+        Consume a new value and return the updated CCI.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        float
+            The updated CCI value.
+        """
+        self.window[self.count % self.length] = value
+        self.count += 1
+        ma = self.ma_state.update(value)
+
+        if self.count < self.length:
+            return self.value
+
+        mad = np.mean(np.abs(self.window - np.mean(self.window)))
+        self.value = (value - ma) / (self.constant * mad)
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "constant": self.constant,
+            "method": self.method,
+            "ma_state": self.ma_state.snapshot(),
+            "window": self.window.copy(),
+            "count": self.count,
+            "value": self.value,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(
+            snapshot["length"], snapshot["constant"], snapshot["method"]
+        )
+        self.ma_state.restore(snapshot["ma_state"])
+        self.window = snapshot["window"].copy()
+        self.count = snapshot["count"]
+        self.value = snapshot["value"]
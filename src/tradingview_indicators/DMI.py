@@ -1,6 +1,166 @@
 import pandas as pd
 import numpy as np
-from .moving_average import rma
+from numba import njit
+from .atr import true_range_numba
+
+
+@njit
+def _directional_movement(
+    high: np.ndarray,
+    low: np.ndarray,
+    i: int,
+) -> tuple[float, float]:
+    """
+    Return the Positive and Negative Directional Movement of a bar.
+    """
+    up = high[i] - high[i - 1]
+    down = low[i - 1] - low[i]
+    plus_dm = up if up > down and up > 0 else 0.0
+    minus_dm = down if down > up and down > 0 else 0.0
+    return plus_dm, minus_dm
+
+@njit
+def _is_valid_bar(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    i: int,
+) -> bool:
+    """
+    Check if a bar and the previous one have all the values needed for
+    its True Range and Directional Movement.
+    """
+    return not (
+        np.isnan(high[i]) or np.isnan(low[i])
+        or np.isnan(high[i - 1]) or np.isnan(low[i - 1])
+        or np.isnan(close[i - 1])
+    )
+
+@njit(error_model="numpy")
+def dmi_numba(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    true_range: np.ndarray,
+    adx_smoothing: int,
+    di_length: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the Directional Movement Index (DMI) using Numba.
+
+    The Directional Movement, the RMAs, the DIs and the ADX are
+    calculated in a single loop. Bars missing a value are skipped, like
+    the NaN values dropped by the `rma` calls.
+
+    Parameters:
+    -----------
+    high : np.ndarray
+        The high prices.
+    low : np.ndarray
+        The low prices.
+    close : np.ndarray
+        The close prices.
+    true_range : np.ndarray
+        The True Range values, from `true_range_numba`.
+    adx_smoothing : int
+        The smoothing period for calculating the ADX.
+    di_length : int
+        The length of the directional movement indicator (DI) period.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        The +DI, -DI and ADX values, and the masks of the bars with a
+        DI and with an ADX value.
+    """
+    n_rows = len(high)
+    plus_values = np.full(n_rows, np.nan)
+    minus_values = np.full(n_rows, np.nan)
+    adx_values = np.full(n_rows, np.nan)
+    is_di = np.zeros(n_rows, dtype=np.bool_)
+    is_adx = np.zeros(n_rows, dtype=np.bool_)
+
+    # The RMA seeds are the means of the first `di_length` values.
+    first_tr = np.empty(di_length)
+    first_plus = np.empty(di_length)
+    first_minus = np.empty(di_length)
+    n_first = 0
+    for i in range(1, n_rows):
+        if n_first == di_length:
+            break
+        if _is_valid_bar(high, low, close, i):
+            plus_dm, minus_dm = _directional_movement(high, low, i)
+            first_tr[n_first] = true_range[i]
+            first_plus[n_first] = plus_dm
+            first_minus[n_first] = minus_dm
+            n_first += 1
+
+    if n_first < di_length:
+        return plus_values, minus_values, adx_values, is_di, is_adx
+
+    di_alpha = 1 / di_length
+    adx_alpha = 1 / adx_smoothing
+    smoothed_tr = np.mean(first_tr)
+    smoothed_plus = np.mean(first_plus)
+    smoothed_minus = np.mean(first_minus)
+    smoothed_ratio = 0.0
+    pending_rows = np.empty(adx_smoothing, dtype=np.int64)
+    n_di = 0
+    for i in range(1, n_rows):
+        if not _is_valid_bar(high, low, close, i):
+            continue
+
+        if n_di > 0:
+            plus_dm, minus_dm = _directional_movement(high, low, i)
+            smoothed_tr = (
+                di_alpha * true_range[i] + (1 - di_alpha) * smoothed_tr
+            )
+            smoothed_plus = (
+                di_alpha * plus_dm + (1 - di_alpha) * smoothed_plus
+            )
+            smoothed_minus = (
+                di_alpha * minus_dm + (1 - di_alpha) * smoothed_minus
+            )
+
+        plus = 100 * smoothed_plus / smoothed_tr
+        minus = 100 * smoothed_minus / smoothed_tr
+        plus_values[i] = plus
+        minus_values[i] = minus
+        is_di[i] = True
+        n_di += 1
+
+        di_sum = plus + minus
+        ratio = abs(plus - minus) / (di_sum if di_sum != 0 else 1.0)
+
+        # The ADX seed is the mean of the first `adx_smoothing` ratios,
+        # so those bars wait until it is known.
+        if n_di <= adx_smoothing:
+            adx_values[i] = ratio
+            pending_rows[n_di - 1] = i
+            if n_di < adx_smoothing:
+                continue
+
+            smoothed_ratio = np.mean(adx_values[pending_rows])
+            for k in range(adx_smoothing):
+                row = pending_rows[k]
+                if k > 0:
+                    smoothed_ratio = (
+                        adx_alpha * adx_values[row]
+                        + (1 - adx_alpha) * smoothed_ratio
+                    )
+                adx_values[row] = 100 * smoothed_ratio
+                is_adx[row] = True
+            continue
+
+        smoothed_ratio = (
+            adx_alpha * ratio + (1 - adx_alpha) * smoothed_ratio
+        )
+        adx_values[i] = 100 * smoothed_ratio
+        is_adx[i] = True
+
+    if n_di < adx_smoothing:
+        adx_values[:] = np.nan
+    return plus_values, minus_values, adx_values, is_di, is_adx
 
 
 class DMI:
@@ -104,6 +264,50 @@ class DMI:
         else:
             self.low = dataframe[low]
 
+        self._true_range = None
+        self._results = {}
+
+    def _true_range_values(self) -> np.ndarray:
+        """
+        Return the True Range values, calculating them on the first
+        call only. They are shared by every set of DMI parameters.
+        """
+        if self._true_range is None:
+            self._true_range = true_range_numba(
+                self.high.to_numpy(dtype=np.float64),
+                self.low.to_numpy(dtype=np.float64),
+                self.close.to_numpy(dtype=np.float64),
+            )
+        return self._true_range
+
+    def _dmi(self, adx_smoothing: int, di_length: int) -> dict:
+        """
+        Return the DMI results for the given parameters, calculating
+        them on the first call only.
+        """
+        key = (adx_smoothing, di_length)
+        if key in self._results:
+            return self._results[key]
+
+        plus, minus, adx, is_di, is_adx = dmi_numba(
+            self.high.to_numpy(dtype=np.float64),
+            self.low.to_numpy(dtype=np.float64),
+            self.close.to_numpy(dtype=np.float64),
+            self._true_range_values(),
+            adx_smoothing,
+            di_length,
+        )
+        index = self.high.index
+        plus = pd.Series(plus[is_di], index=index[is_di], name="DI+")
+        minus = pd.Series(minus[is_di], index=index[is_di], name="DI-")
+        self._results[key] = {
+            "ADX": pd.Series(adx[is_adx], index=index[is_adx], name="ADX"),
+            "DI+": plus,
+            "DI-": minus,
+            "DI_Delta": (plus - minus).rename("DI_Delta"),
+            "DI_Ratio": (plus / minus).rename("DI_Ratio"),
+        }
+        return self._results[key]
 
     def true_range(self) -> pd.Series:
         """
@@ -117,14 +321,12 @@ class DMI:
         Returns:
         --------
         pd.Series
-            The True Range (TR) values.
+            The True Range (TR) values. The first value is NaN, as
+            there is no previous close.
         """
-        true_range = np.maximum(
-            self.high - self.low,
-            abs(self.high - self.close.shift()),
-            abs(self.low - self.close.shift())
-        )
-        return true_range
+        true_range = self._true_range_values().copy()
+        true_range[:1] = np.nan
+        return pd.Series(true_range, index=self.high.index)
 
     def adx(
         self,
@@ -135,6 +337,10 @@ class DMI:
         Calculate the Average Directional Index (ADX) and related
         directional movement values.
 
+        The results are cached per `adx_smoothing` and `di_length`, so
+        later calls with the same parameters, including the ones of
+        `di_difference` and `dmi`, do not calculate them again.
+
         Parameters:
         -----------
         adx_smoothing : int, optional
@@ -150,26 +356,8 @@ class DMI:
             A tuple containing the ADX, Positive Directional Movement
             (+DI), and Negative Directional Movement (-DI) values.
         """
-        trur = rma(self.true_range().dropna(), di_length)
-
-        up = self.high.diff().dropna()
-        down = -self.low.diff().dropna()
-
-        plusDM = up.where((up > down) & (up > 0), 0)
-        minusDM = down.where((down > up) & (down > 0), 0)
-
-        plus = 100 * rma(plusDM, di_length) / trur
-        minus = 100 * rma(minusDM, di_length) / trur
-
-        sumDM = plus + minus
-        subDM = abs(plus - minus)
-
-        adx = 100 * rma(subDM / sumDM.where(sumDM != 0, 1), adx_smoothing)
-
-        plus = plus.rename("DI+")
-        minus = minus.rename("DI-")
-        adx = adx.rename("ADX")
-        return adx, plus, minus
+        results = self._dmi(adx_smoothing, di_length)
+        return results["ADX"], results["DI+"], results["DI-"]
 
     def di_difference(
         self,
@@ -196,7 +384,38 @@ class DMI:
             A tuple containing the difference between +DI and -DI and
             the ratio of +DI to -DI.
         """
-        _, plus, minus = self.adx(adx_smoothing, di_length)
-        di_delta = (plus - minus).rename("DI_Delta")
-        di_ratio = (plus / minus).rename("DI_Ratio")
-        return di_delta, di_ratio
+        results = self._dmi(adx_smoothing, di_length)
+        return results["DI_Delta"], results["DI_Ratio"]
+
+    def dmi(
+        self,
+        adx_smoothing: int = 14,
+        di_length: int = 14,
+    ) -> pd.DataFrame:
+        """
+        Calculate the ADX, the DIs and their difference and ratio
+        together.
+
+        Parameters:
+        -----------
+        adx_smoothing : int, optional
+            The smoothing period for calculating the ADX.
+            (default: 14)
+        di_length : int, optional
+            The length of the directional movement indicator (DI) period.
+            (default: 14)
+
+        Returns:
+        --------
+        pd.DataFrame
+            The "ADX", "DI+", "DI-", "DI_Delta" and "DI_Ratio" columns,
+            with NaN where the ADX has no value yet.
+        """
+        results = self._dmi(adx_smoothing, di_length)
+        return pd.concat(
+            [
+                results[column]
+                for column in ("ADX", "DI+", "DI-", "DI_Delta", "DI_Ratio")
+            ],
+            axis=1,
+        )
@@ -1,6 +1,17 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Literal
+import numpy as np
 import pandas as pd
-from .moving_average import sma, ema, sema, rma
+from .moving_average import (
+    sma,
+    ema,
+    sema,
+    rma,
+    ema_grid,
+    rma_grid,
+    sema_grid,
+)
 from .utils import DynamicTimeWarping
 
 def MACD(
@@ -103,3 +114,210 @@ def MACD(
     )
 
     return macd_df
+
+
+def _moving_average(
+    source: pd.Series,
+    length: int,
+    method: Literal["sma", "ema", "dema", "tema", "rma"],
+) -> pd.Series:
+    """
+    Calculate one of the MACD moving averages.
+    """
+    match method:
+        case "sma":
+            return sma(source, length)
+        case "ema":
+            return ema(source, length)
+        case "dema":
+            return sema(source, length, 2)
+        case "tema":
+            return sema(source, length, 3)
+        case "rma":
+            return rma(source, length)
+        case _:
+            raise ValueError(f"'{method}' is not a valid method.")
+
+
+def _signal_grid(
+    macd: np.ndarray,
+    signal_lengths: list[int],
+    signal_method: Literal["sma", "ema", "dema", "tema", "rma"],
+) -> np.ndarray:
+    """
+    Calculate the signal line of one MACD series for every signal
+    length, with NaN where the signal moving average has no value.
+    """
+    match signal_method:
+        case "ema":
+            return ema_grid(macd, signal_lengths)
+        case "rma":
+            return rma_grid(macd, signal_lengths)
+        case "dema":
+            return sema_grid(macd, signal_lengths, 2)
+        case "tema":
+            return sema_grid(macd, signal_lengths, 3)
+        case "sma":
+            macd_series = pd.Series(macd)
+            return np.column_stack([
+                sma(macd_series, length).reindex(macd_series.index)
+                for length in signal_lengths
+            ])
+        case _:
+            raise ValueError(f"'{signal_method}' is not a valid method.")
+
+
+def _signal_block(
+    macd_values: np.ndarray,
+    signal_lengths: list[int],
+    signal_method: Literal["sma", "ema", "dema", "tema", "rma"],
+) -> np.ndarray:
+    """
+    Calculate the signal lines of every MACD column for the given
+    signal lengths.
+
+    Returns a (n_bars, n_pairs, n_signals) array.
+    """
+    n_rows, n_pairs = macd_values.shape
+    signal_values = np.full((n_rows, n_pairs, len(signal_lengths)), np.nan)
+    for pair in range(n_pairs):
+        is_valid = ~np.isnan(macd_values[:, pair])
+        if is_valid.any():
+            signal_values[is_valid, pair] = _signal_grid(
+                macd_values[is_valid, pair], signal_lengths, signal_method
+            )
+    return signal_values
+
+
+def macd_grid(
+    source: pd.Series,
+    fast_lengths: list[int],
+    slow_lengths: list[int],
+    signal_lengths: list[int],
+    diff_method: Literal["absolute", "ratio"] = "absolute",
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    signal_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    n_jobs: int | None = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    Calculate the MACD for every combination of fast, slow and signal
+    lengths.
+
+    Each distinct source moving average is calculated once and shared
+    by every combination that uses it. The values of each combination
+    match `MACD` with the same parameters.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The input time series data for calculating MACD.
+    fast_lengths : list[int]
+        The fast moving average lengths.
+    slow_lengths : list[int]
+        The slow moving average lengths.
+    signal_lengths : list[int]
+        The signal line moving average lengths.
+    diff_method : Literal["absolute", "ratio"], optional
+        The method to compare the moving averages.
+        (default: "absolute")
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for calculating the source moving averages.
+        (default: "ema")
+    signal_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for calculating the signal lines.
+        (default: "ema")
+    n_jobs : int, optional
+        The number of worker processes to split the signal lengths
+        across. If not provided, everything runs in this process.
+        The workers are spawned, so scripts using them need an
+        `if __name__ == "__main__":` guard.
+
+    Returns:
+    --------
+    dict[str, pd.DataFrame]
+        A dict with the "macd" block, with (fast_length, slow_length)
+        columns, and the "signal" and "histogram" blocks, with
+        (fast_length, slow_length, signal_length) columns. Every block
+        is aligned to the source index.
+
+    Raises:
+    -------
+    ValueError
+        If an invalid method is provided.
+    """
+    if isinstance(source, pd.DataFrame):
+        raise TypeError("source can't be a DataFrame")
+    if diff_method not in ("absolute", "ratio"):
+        raise ValueError("diff_method must be 'absolute' or 'ratio'")
+
+    source_mas = {
+        length: _moving_average(source, length, ma_method)
+        .reindex(source.index)
+        .to_numpy(dtype=np.float64)
+        for length in sorted(set(fast_lengths) | set(slow_lengths))
+    }
+
+    pairs = [(fast, slow) for fast in fast_lengths for slow in slow_lengths]
+    macd_values = np.empty((len(source), len(pairs)))
+    for idx, (fast, slow) in enumerate(pairs):
+        if diff_method == "absolute":
+            macd_values[:, idx] = source_mas[fast] - source_mas[slow]
+        else:
+            macd_values[:, idx] = source_mas[fast] / source_mas[slow]
+
+    signal_lengths = list(signal_lengths)
+    if n_jobs is None or n_jobs < 2 or len(signal_lengths) < 2:
+        signal_values = _signal_block(macd_values, signal_lengths, signal_method)
+    else:
+        chunks = [
+            chunk.tolist()
+            for chunk in np.array_split(signal_lengths, n_jobs)
+            if len(chunk)
+        ]
+        # Forking after Numba started its parallel threads can leave the
+        # process unable to exit, so the workers are spawned instead.
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            blocks = executor.map(
+                _signal_block,
+                [macd_values] * len(chunks),
+                chunks,
+                [signal_method] * len(chunks),
+            )
+            signal_values = np.concatenate(list(blocks), axis=2)
+
+    if diff_method == "absolute":
+        histogram_values = macd_values[:, :, np.newaxis] - signal_values
+    else:
+        histogram_values = macd_values[:, :, np.newaxis] / signal_values
+
+    combinations = pd.MultiIndex.from_tuples(
+        [
+            (fast, slow, signal)
+            for fast, slow in pairs
+            for signal in signal_lengths
+        ],
+        names=["fast_length", "slow_length", "signal_length"],
+    )
+    n_rows = len(source)
+    return {
+        "macd": pd.DataFrame(
+            macd_values,
+            index=source.index,
+            columns=pd.MultiIndex.from_tuples(
+                pairs, names=["fast_length", "slow_length"]
+            ),
+        ),
+        "signal": pd.DataFrame(
+            signal_values.reshape(n_rows, -1),
+            index=source.index,
+            columns=combinations,
+        ),
+        "histogram": pd.DataFrame(
+            histogram_values.reshape(n_rows, -1),
+            index=source.index,
+            columns=combinations,
+        ),
+    }
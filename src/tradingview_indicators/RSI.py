@@ -1,20 +1,129 @@
+from functools import lru_cache
 from typing import Literal
 import numpy as np
 import pandas as pd
-from .moving_average import sma, ema, sema, rma
+from numba import njit, prange
+from .moving_average import (
+    MA_METHOD_CODES,
+    MA_STATE_SIZE,
+    _ma_update,
+    _first_valid,
+)
+
+@lru_cache(maxsize=None)
+def _rsi_kernel(method: int):
+    """
+    Build the RSI loop for the given moving average code. The code is
+    a compile-time constant of the loop, so the moving average steps
+    are compiled for its method only.
+    """
+    @njit(error_model="numpy")
+    def rsi_loop(source, periods):
+        up_state = np.zeros(MA_STATE_SIZE)
+        down_state = np.zeros(MA_STATE_SIZE)
+        up_buffer = np.zeros(periods)
+        down_buffer = np.zeros(periods)
+
+        if method == 2:  # MA_METHOD_CODES["rma"]
+            up_sum = np.zeros(periods)
+            down_sum = np.zeros(periods)
+            down_sum[0] = -0.0
+            for i in range(1, periods):
+                change = source[i] - source[i - 1]
+                up_sum[i] = change if change > 0 else 0.0
+                down_sum[i] = -change if change < 0 else -0.0
+            up_state[1] = np.mean(up_sum)
+            down_state[1] = np.mean(down_sum)
+
+        rsi_values = np.full(len(source), np.nan)
+        for i in range(len(source)):
+            # Matches `diff().clip(...).fillna(0)`: NaN changes count
+            # as 0.
+            change = source[i] - source[i - 1] if i > 0 else np.nan
+            upward_diff = change if change > 0 else 0.0
+            downward_diff = -change if change < 0 else -0.0
+
+            up_ma = _ma_update(
+                method, periods, up_state, up_buffer, upward_diff
+            )
+            down_ma = _ma_update(
+                method, periods, down_state, down_buffer, downward_diff
+            )
+            rsi_values[i] = 100 - (100 / (1 + up_ma / down_ma))
+        return rsi_values
+
+    @njit(error_model="numpy", parallel=True)
+    def rsi_2d_loop(source, periods):
+        n_rows, n_cols = source.shape
+        rsi_values = np.full((n_rows, n_cols), np.nan)
+        for col in prange(n_cols):
+            start = _first_valid(source[:, col])
+            if n_rows - start >= periods:
+                rsi_values[start:, col] = rsi_loop(
+                    source[start:, col], periods
+                )
+        return rsi_values
+
+    return rsi_loop, rsi_2d_loop
+
+def rsi_numba(source: np.ndarray, periods: int, method: int) -> np.ndarray:
+    """
+    Calculate the Relative Strength Index (RSI) using Numba.
+
+    The gains, the losses, both moving averages and the final ratio
+    are calculated in a single loop with constant scratch memory.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    periods : int
+        The number of periods to use for RSI calculation.
+    method : int
+        The moving average code, from `MA_METHOD_CODES`.
+
+    Returns:
+    --------
+    np.ndarray
+        The calculated RSI values. The first `periods - 1` values are
+        NaN for the "sma" method.
+    """
+    return _rsi_kernel(method)[0](source, periods)
+
+def rsi_2d_numba(source: np.ndarray, periods: int, method: int) -> np.ndarray:
+    """
+    Calculate the RSI of every column of a 2-D array using Numba,
+    starting each column at its first valid value.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input 2-D array of values.
+    periods : int
+        The number of periods to use for RSI calculation.
+    method : int
+        The moving average code, from `MA_METHOD_CODES`.
+
+    Returns:
+    --------
+    np.ndarray
+        The calculated RSI values of each column.
+    """
+    return _rsi_kernel(method)[1](source, periods)
 
 def RSI(
-    source: pd.Series,
+    source: pd.Series | pd.DataFrame,
     periods: int = 14,
     ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "rma",
-) -> pd.Series:
+) -> pd.Series | pd.DataFrame:
     """
     Calculate the Relative Strength Index (RSI) for a given time series data.
 
     Parameters:
     -----------
-    source : pd.Series
-        The input time series data for which to calculate RSI.
+    source : pd.Series or pd.DataFrame
+        The input time series data for which to calculate RSI. A
+        DataFrame is treated as one time series per column.
     periods : int, optional
         The number of periods to use for RSI calculation.
         (default: 14)
@@ -23,28 +132,29 @@ def RSI(
 
     Returns:
     --------
-    pd.Series
+    pd.Series or pd.DataFrame
         The calculated RSI values for the input data.
     """
+    if ma_method not in MA_METHOD_CODES:
+        raise ValueError("Invalid moving average method")
+    method = MA_METHOD_CODES[ma_method]
+
+    if isinstance(source, pd.DataFrame):
+        values = np.asfortranarray(source.to_numpy(dtype=np.float64))
+        return pd.DataFrame(
+            rsi_2d_numba(values, periods, method),
+            index=source.index,
+            columns=source.columns,
+        )
+
     if len(source) < periods:
         return pd.Series([], dtype=np.float64)
 
-    upward_diff = source.diff().clip(lower=0).fillna(0)
-    downward_diff = -source.diff().clip(upper=0).fillna(0)
-
-    match ma_method:
-        case "sma":
-            relative_strength = sma(upward_diff, periods) / sma(downward_diff, periods)
-        case "ema":
-            relative_strength = ema(upward_diff, periods) / ema(downward_diff, periods)
-        case "dema":
-            relative_strength = sema(upward_diff, periods, 2) / sema(downward_diff, periods, 2)
-        case "tema":
-            relative_strength = sema(upward_diff, periods, 3) / sema(downward_diff, periods, 3)
-        case "rma":
-            relative_strength = rma(upward_diff, periods) / rma(downward_diff, periods)
-        case _:
-            raise ValueError("Invalid moving average method")
-
-    rsi = 100 - (100 / (1 + relative_strength))
-    return rsi.rename("RSI")
\ No newline at end of file
+    rsi_values = rsi_numba(source.to_numpy(dtype=np.float64), periods, method)
+
+    start = periods - 1 if ma_method == "sma" else 0
+    return pd.Series(
+        rsi_values[start:],
+        index=source.index[start:],
+        name="RSI",
+    )
@@ -1,8 +1,9 @@
 from typing import Literal
+import numpy as np
 import pandas as pd
 
-from .moving_average import sma, ema, sema, rma
-from .tsi import tsi
+from .moving_average import MA_METHOD_CODES
+from .tsi import tsi_numba
 
 from .errors_exceptions import InvalidArgumentError
 
@@ -49,21 +50,22 @@ def smi_osc(
     if isinstance(source, pd.DataFrame):
         raise TypeError("source can't be a DataFrame")
 
-    erg = tsi(source, short_length, long_length)
+    if ma_method not in MA_METHOD_CODES:
+        raise InvalidArgumentError(f"'{ma_method}' is not a valid method.")
 
-    match ma_method:
-        case "sma":
-            sig = sma(erg, signal_length)
-        case "ema":
-            sig = ema(erg, signal_length)
-        case "dema":
-            sig = sema(erg, signal_length, 2)
-        case "tema":
-            sig = sema(erg, signal_length, 3)
-        case "rma":
-            sig = rma(erg, signal_length)
-        case _:
-            raise InvalidArgumentError(f"'{ma_method}' is not a valid method.")
+    erg, sig, is_output = tsi_numba(
+        source.to_numpy(dtype=np.float64),
+        short_length,
+        long_length,
+        MA_METHOD_CODES["ema"],
+        signal_length,
+        MA_METHOD_CODES[ma_method],
+    )
+    if not is_output.any():
+        return pd.Series([], dtype=np.float64, name="SMIO")
 
-    smio = (erg - sig).rename("SMIO")
-    return smio
+    return pd.Series(
+        erg[is_output] - sig[is_output],
+        index=source.index[is_output],
+        name="SMIO",
+    )
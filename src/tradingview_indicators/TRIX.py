@@ -1,25 +1,178 @@
+from functools import lru_cache
 from typing import Literal
 import pandas as pd
 import numpy as np
+from numba import njit, prange
 
-from .moving_average import sma, ema, sema, rma
+from .moving_average import (
+    MA_METHOD_CODES,
+    MA_STATE_SIZE,
+    _ma_update,
+    _rma_seeds,
+    _first_valid,
+)
 from .errors_exceptions import InvalidArgumentError
 
 
+@lru_cache(maxsize=None)
+def _trix_kernel(method: int):
+    """
+    Build the TRIX loops for the given moving average code. The code is
+    a compile-time constant of the loops, so the moving average steps
+    are compiled for its method only.
+    """
+    @njit(error_model="numpy")
+    def trix_loop(source, length, signal_length):
+        n_rows = len(source)
+        trix_values = np.full(n_rows, np.nan)
+        is_output = np.zeros(n_rows, dtype=np.bool_)
+        if n_rows < length:
+            return trix_values, is_output
+
+        # One array per moving average, as views would be created on
+        # every iteration.
+        first_state = np.zeros(MA_STATE_SIZE)
+        second_state = np.zeros(MA_STATE_SIZE)
+        third_state = np.zeros(MA_STATE_SIZE)
+        first_buffer = np.zeros(length)
+        second_buffer = np.zeros(length)
+        third_buffer = np.zeros(length)
+        if method == 2:  # MA_METHOD_CODES["rma"]
+            seeds = _rma_seeds(source[:length], np.full(3, length))
+            first_state[1], second_state[1], third_state[1] = seeds
+
+        # Nested calls drop the NaN values of each moving average.
+        stage_counts = np.zeros(3, dtype=np.int64)
+        lagged = np.empty(signal_length)
+        n_outputs = 0
+        for i in range(n_rows):
+            value = _ma_update(
+                method, length, first_state, first_buffer, source[i]
+            )
+            if np.isnan(value):
+                continue
+            stage_counts[0] += 1
+
+            value = _ma_update(
+                method, length, second_state, second_buffer, value
+            )
+            if np.isnan(value):
+                continue
+            stage_counts[1] += 1
+
+            value = _ma_update(
+                method, length, third_state, third_buffer, value
+            )
+            if np.isnan(value):
+                continue
+            stage_counts[2] += 1
+
+            position = n_outputs % signal_length
+            if n_outputs >= signal_length:
+                trix_values[i] = (value - lagged[position]) * 10000
+            lagged[position] = value
+            is_output[i] = True
+            n_outputs += 1
+
+        # Each nested call returns nothing when it gets fewer than
+        # `length` values, and so does `sema` when it returns fewer than
+        # `length`.
+        min_count = stage_counts[:2].min()
+        if method >= 3:  # "dema" and "tema"
+            min_count = stage_counts.min()
+        if min_count < length:
+            trix_values[:] = np.nan
+            is_output[:] = False
+        return trix_values, is_output
+
+    @njit(error_model="numpy", parallel=True)
+    def trix_2d_loop(source, length, signal_length):
+        n_rows, n_cols = source.shape
+        trix_values = np.full((n_rows, n_cols), np.nan)
+        for col in prange(n_cols):
+            start = _first_valid(source[:, col])
+            trix_values[start:, col] = trix_loop(
+                source[start:, col], length, signal_length
+            )[0]
+        return trix_values
+
+    return trix_loop, trix_2d_loop
+
+def trix_numba(
+    source: np.ndarray,
+    length: int,
+    signal_length: int,
+    method: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the TRIX of log values using Numba.
+
+    The three cascaded moving averages and the lagged difference are
+    calculated in a single loop, keeping the last `signal_length`
+    smoothed values in a ring buffer.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The log of the input values.
+    length : int
+        The number of periods for the TRIX moving average.
+    signal_length : int
+        The number of periods of the lagged difference.
+    method : int
+        The moving average code, from `MA_METHOD_CODES`.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The TRIX values and a mask of the values kept by the nested
+        moving average calls, which drop their NaN values.
+    """
+    return _trix_kernel(method)[0](source, length, signal_length)
+
+def trix_2d_numba(
+    source: np.ndarray,
+    length: int,
+    signal_length: int,
+    method: int,
+) -> np.ndarray:
+    """
+    Calculate the TRIX of every column of a 2-D array of log values
+    using Numba, starting each column at its first valid value.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The log of the input 2-D array of values.
+    length : int
+        The number of periods for the TRIX moving average.
+    signal_length : int
+        The number of periods of the lagged difference.
+    method : int
+        The moving average code, from `MA_METHOD_CODES`.
+
+    Returns:
+    --------
+    np.ndarray
+        The TRIX values of each column.
+    """
+    return _trix_kernel(method)[1](source, length, signal_length)
+
 def TRIX(
-    source: pd.Series,
+    source: pd.Series | pd.DataFrame,
     length: int = 18,
     signal_length: int = 1,
     ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
-) -> pd.DataFrame:
+) -> pd.Series | pd.DataFrame:
     """
-    Calculate the Triple Exponential Moving Average (TRIX) momentum 
+    Calculate the Triple Exponential Moving Average (TRIX) momentum
     oscillator indicator.
 
     Parameters:
     -----------
-    source : pd.Series
-        The input time series data for calculating TRIX.
+    source : pd.Series or pd.DataFrame
+        The input time series data for calculating TRIX. A DataFrame
+        is treated as one time series per column.
     length : int
         The number of periods for the TRIX moving average.
         (default: 18)
@@ -32,48 +185,42 @@ def TRIX(
         Average.
         (default: "ema")
 
+    Returns:
+    --------
+    pd.Series or pd.DataFrame
+        The calculated TRIX values. Multi-column inputs keep their
+        shape, with NaN where a column has no value yet.
+
     Raises:
     -------
     ValueError
         If an invalid method is provided.
     """
+    if ma_method not in MA_METHOD_CODES:
+        raise InvalidArgumentError(f"'{ma_method}' is not a valid method.")
+    if signal_length < 1:
+        raise ValueError("signal_length must be a positive integer")
+    method = MA_METHOD_CODES[ma_method]
+
     if isinstance(source, pd.DataFrame):
-        raise TypeError("source can't be a DataFrame")
-
-    trix_source = np.log(source)
-
-    match ma_method:
-        case "sma":
-            trix = (
-                sma(sma(sma(trix_source, length), length), length)
-                .diff(signal_length)
-            ) * 10000
-
-        case "ema":
-            trix = (
-                ema(ema(ema(trix_source, length), length), length)
-                .diff(signal_length)
-            ) * 10000
-
-        case "dema":
-            trix = (
-                sema(sema(sema(trix_source, length, 2), length, 2), length, 2)
-                .diff(signal_length)
-            ) * 10000
-
-        case "tema":
-            trix = (
-                sema(sema(sema(trix_source, length, 3), length, 3), length, 3)
-                .diff(signal_length)
-            ) * 10000
-
-        case "rma":
-            trix = (
-                rma(rma(rma(trix_source, length), length), length)
-                .diff(signal_length)
-            ) * 10000
-
-        case _:
-            raise InvalidArgumentError(f"'{ma_method}' is not a valid method.")
-
-    return trix.rename("TRIX")
+        values = np.asfortranarray(np.log(source.to_numpy(dtype=np.float64)))
+        return pd.DataFrame(
+            trix_2d_numba(values, length, signal_length, method),
+            index=source.index,
+            columns=source.columns,
+        )
+
+    trix_values, is_output = trix_numba(
+        np.log(source.to_numpy(dtype=np.float64)),
+        length,
+        signal_length,
+        method,
+    )
+    if not is_output.any():
+        return pd.Series([], dtype=np.float64, name="TRIX")
+
+    return pd.Series(
+        trix_values[is_output],
+        index=source.index[is_output],
+        name="TRIX",
+    )
@@ -1,33 +1,50 @@
-from .moving_average import sma, rma, ema, sema
-from .cci import ccc
-from .MACD import MACD
+from .moving_average import (
+    sma,
+    rma,
+    ema,
+    sema,
+    sma_grid,
+    ema_grid,
+    rma_grid,
+    sema_grid,
+    SmaState,
+    EmaState,
+    RmaState,
+    SemaState,
+)
+from .CCI import ccc, CciState
+from .MACD import MACD, macd_grid
 from .RSI import RSI
 from .DMI import DMI
 from .TRIX import TRIX
 from .SMIO import smi_osc
 from .slow_stoch import slow_stoch
 from .stoch import stoch
-from .ichimoku import ichimoku
-from .didi_index import didi_index
+from .ichimoku import ichimoku, IchimokuState
+from .didi_index import didi_index, didi_index_grid
 from .tsi import tsi
-from .percent_rank import percentrank
+from .percent_rank import percentrank, PercentRankState
 from .crossover import crossover
 from .crossunder import crossunder
+from .cross import cross
 from .zscore_ema import zscore_ema
-from .zscore import zscore
+from .zscore import zscore, rolling_zscore, zscore_chunked
 from .wma import wma
-from .linreg import linreg
+from .linreg import linreg, linreg_stats
 from .math_sin import math_sin
 from .array_sum import array_sum
 from .array_set import array_set
 from .array_new_float import array_new_float
 from .tame_poly_lsma import tame_poly_lsma
-from .bb import bb
+from .bb import bb, bollinger_bands, BollingerState
 from .abs import abs_val
-from .atr import atr
+from .atr import atr, AtrState
 from .hma import hma
 from .nz import nz
 from .na import na
 from .cum import cum
 from .fixnan import fixnan
-from .correlation import correlation
\ No newline at end of file
+from .correlation import correlation, correlation_matrix
+from .rolling_sum import rolling_sum, rolling_mean
+from .rolling_extremum import highest, lowest, RollingExtremumState
+from .dtw import dtw
@@ -1,21 +1,378 @@
+from functools import lru_cache
+from typing import Literal
+import numpy as np
 import pandas as pd
+from numba import njit, prange
+from .moving_average import (
+    MA_METHOD_CODES,
+    MA_STATE_SIZE,
+    _ma_update,
+    _first_valid,
+    SmaState,
+    EmaState,
+    SemaState,
+)
 
-def atr(high, low, close, length):
+@njit
+def true_range_numba(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the True Range (TR) using Numba.
+
+    The True Range is the greatest of the current high minus the
+    current low and the distances from the previous close to the
+    current high and low. NaN terms are skipped, so the first value is
+    the high minus the low.
+
+    Parameters:
+    high (np.ndarray): The high prices.
+    low (np.ndarray): The low prices.
+    close (np.ndarray): The close prices.
+
+    Returns:
+    np.ndarray: The True Range values, NaN where every term is NaN.
+    """
+    true_range = np.full(len(high), np.nan)
+    for i in range(len(high)):
+        value = high[i] - low[i]
+        if i > 0:
+            for term in (
+                abs(high[i] - close[i - 1]),
+                abs(low[i] - close[i - 1]),
+            ):
+                if np.isnan(value) or term > value:
+                    value = term
+        true_range[i] = value
+    return true_range
+
+@lru_cache(maxsize=None)
+def _atr_kernel(method: int):
+    """
+    Build the ATR loops for the given moving average code. The code is
+    a compile-time constant of the loops, so the moving average step is
+    compiled for its method only.
+    """
+    @njit(error_model="numpy")
+    def atr_loop(high, low, close, length):
+        n_rows = len(high)
+        atr_values = np.full(n_rows, np.nan)
+        if n_rows < length:
+            return atr_values
+
+        true_range = true_range_numba(high, low, close)
+        if method == 2:  # MA_METHOD_CODES["rma"]
+            # TradingView's `ta.atr`: the RMA starts from the SMA of the
+            # last `length` true ranges whenever it has no value.
+            alpha = 1 / length
+            for i in range(length - 1, n_rows):
+                previous = atr_values[i - 1] if i > 0 else np.nan
+                if np.isnan(previous):
+                    atr_values[i] = np.mean(true_range[i - length + 1:i + 1])
+                else:
+                    atr_values[i] = (
+                        alpha * true_range[i] + (1 - alpha) * previous
+                    )
+            return atr_values
+
+        state = np.zeros(MA_STATE_SIZE)
+        buffer = np.zeros(length)
+        for i in range(n_rows):
+            atr_values[i] = _ma_update(
+                method, length, state, buffer, true_range[i]
+            )
+        return atr_values
+
+    @njit(error_model="numpy", parallel=True)
+    def atr_2d_loop(high, low, close, length):
+        n_rows, n_cols = high.shape
+        atr_values = np.full((n_rows, n_cols), np.nan)
+        for col in prange(n_cols):
+            start = _first_valid(close[:, col])
+            atr_values[start:, col] = atr_loop(
+                high[start:, col], low[start:, col], close[start:, col],
+                length,
+            )
+        return atr_values
+
+    return atr_loop, atr_2d_loop
+
+def atr_numba(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    length: int,
+    method: int,
+) -> np.ndarray:
+    """
+    Calculate the Average True Range (ATR) using Numba.
+
+    The True Range and its moving average are calculated in a single
+    compiled call, without intermediate Series.
+
+    Parameters:
+    high (np.ndarray): The high prices.
+    low (np.ndarray): The low prices.
+    close (np.ndarray): The close prices.
+    length (int): The period of the ATR.
+    method (int): The moving average code, from `MA_METHOD_CODES`.
+
+    Returns:
+    np.ndarray: The ATR values, with the moving average values of the
+    True Range and NaN where it has no value. Like the DataFrame path,
+    the calculation starts at the first valid close.
+    """
+    atr_values = np.full(len(close), np.nan)
+    start = _first_valid(close)
+    atr_values[start:] = _atr_kernel(method)[0](
+        high[start:], low[start:], close[start:], length
+    )
+    return atr_values
+
+def atr(
+    high: pd.Series | pd.DataFrame,
+    low: pd.Series | pd.DataFrame,
+    close: pd.Series | pd.DataFrame,
+    length: int,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "sma",
+) -> pd.Series | pd.DataFrame:
     """
     Calculate the Average True Range (ATR).
 
     Parameters:
-    high (pd.Series): The high prices.
-    low (pd.Series): The low prices.
-    close (pd.Series): The close prices.
+    high (pd.Series or pd.DataFrame): The high prices. DataFrames hold
+    one symbol per column, each starting at its first valid close.
+    low (pd.Series or pd.DataFrame): The low prices.
+    close (pd.Series or pd.DataFrame): The close prices.
     length (int): The period of the ATR.
+    ma_method (str): The moving average of the True Range. "rma" matches
+    TradingView's `ta.atr`: NaN until the first `length` bars, the SMA
+    of their True Range, then the RMA. (default: "sma")
 
     Returns:
-    pd.Series: The ATR values.
-    """
-    true_range = pd.DataFrame({
-        'high_low': high - low,
-        'high_close': (high - close.shift()).abs(),
-        'low_close': (low - close.shift()).abs()
-    }).max(axis=1)
-    return true_range.rolling(window=length).mean()
\ No newline at end of file
+    pd.Series or pd.DataFrame: The ATR values.
+    """
+    if ma_method not in MA_METHOD_CODES:
+        raise ValueError("Invalid moving average method")
+    if length < 1:
+        raise ValueError("length must be a positive integer")
+    method = MA_METHOD_CODES[ma_method]
+
+    if isinstance(high, pd.DataFrame):
+        values = [
+            np.asfortranarray(source.to_numpy(dtype=np.float64))
+            for source in (high, low, close)
+        ]
+        return pd.DataFrame(
+            _atr_kernel(method)[1](*values, length),
+            index=high.index,
+            columns=high.columns,
+        )
+
+    atr_values = atr_numba(
+        high.to_numpy(dtype=np.float64),
+        low.to_numpy(dtype=np.float64),
+        close.to_numpy(dtype=np.float64),
+        length,
+        method,
+    )
+    return pd.Series(atr_values, index=high.index)
+
+
+class AtrState:
+    """
+    Stateful Average True Range (ATR) updater.
+
+    Keeps the previous close next to the state of the moving average,
+    and consumes one bar at a time in O(1).
+
+    Attributes:
+    -----------
+    length : int
+        The period of the ATR.
+    ma_method : str
+        The moving average of the True Range.
+    ma_state : SmaState, EmaState or SemaState
+        The state of the moving average, or of the SMA that seeds the
+        "rma" ATR.
+    previous_close : float
+        The close of the last bar (NaN before the first update).
+    value : float
+        The last calculated ATR value (NaN during the warm-up).
+    """
+    def __init__(
+        self,
+        length: int,
+        ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "sma",
+    ) -> None:
+        """
+        Initialize an empty ATR state.
+
+        Parameters:
+        -----------
+        length : int
+            The period of the ATR.
+        ma_method : str, optional
+            The moving average of the True Range.
+            (default: "sma")
+        """
+        match ma_method:
+            case "sma":
+                self.ma_state = SmaState(length)
+            case "ema":
+                self.ma_state = EmaState(length)
+            case "dema":
+                self.ma_state = SemaState(length, 2)
+            case "tema":
+                self.ma_state = SemaState(length, 3)
+            case "rma":
+                # Seeds the RMA like TradingView's `ta.atr`.
+                self.ma_state = SmaState(length)
+            case _:
+                raise ValueError("Invalid moving average method")
+
+        self.length = length
+        self.ma_method = ma_method
+        self.previous_close = np.nan
+        self.value = np.nan
+
+    @classmethod
+    def from_source(
+        cls,
+        high: pd.Series,
+        low: pd.Series,
+        close: pd.Series,
+        length: int,
+        ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "sma",
+    ) -> "AtrState":
+        """
+        Create an ATR state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        high : pd.Series
+            The historical high prices.
+        low : pd.Series
+            The historical low prices.
+        close : pd.Series
+            The historical close prices.
+        length : int
+            The period of the ATR.
+        ma_method : str, optional
+            The moving average of the True Range.
+            (default: "sma")
+
+        Returns:
+        --------
+        AtrState
+            The state positioned after the last bar of the batch.
+        """
+        state = cls(length, ma_method)
+        if ma_method == "rma":
+            # The RMA itself isn't kept by a moving average state, so
+            # the last value comes from the batch calculation.
+            state.ma_state = SmaState.from_source(
+                pd.Series(
+                    true_range_numba(
+                        high.to_numpy(dtype=np.float64),
+                        low.to_numpy(dtype=np.float64),
+                        close.to_numpy(dtype=np.float64),
+                    )
+                ),
+                length,
+            )
+            if len(close):
+                state.previous_close = float(close.iloc[-1])
+                state.value = float(
+                    atr(high, low, close, length, ma_method).iloc[-1]
+                )
+            return state
+
+        true_range = pd.Series(
+            true_range_numba(
+                high.to_numpy(dtype=np.float64),
+                low.to_numpy(dtype=np.float64),
+                close.to_numpy(dtype=np.float64),
+            )
+        )
+        if isinstance(state.ma_state, SemaState):
+            state.ma_state = SemaState.from_source(
+                true_range, length, state.ma_state.smooth
+            )
+        else:
+            state.ma_state = type(state.ma_state).from_source(
+                true_range, length
+            )
+
+        if len(close):
+            state.previous_close = float(close.iloc[-1])
+            state.value = state.ma_state.value
+        return state
+
+    def update(self, high: float, low: float, close: float) -> float:
+        """
+        Consume a new bar and return the updated ATR.
+
+        Parameters:
+        -----------
+        high : float
+            The high price of the new bar.
+        low : float
+            The low price of the new bar.
+        close : float
+            The close price of the new bar.
+
+        Returns:
+        --------
+        float
+            The updated ATR value.
+        """
+        # The same steps as `true_range_numba`, skipping NaN terms.
+        true_range = high - low
+        for term in (
+            abs(high - self.previous_close),
+            abs(low - self.previous_close),
+        ):
+            if np.isnan(true_range) or term > true_range:
+                true_range = term
+        self.previous_close = float(close)
+        seed = self.ma_state.update(true_range)
+        if self.ma_method == "rma" and not np.isnan(self.value):
+            alpha = 1 / self.length
+            self.value = alpha * true_range + (1 - alpha) * self.value
+        else:
+            self.value = seed
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "ma_method": self.ma_method,
+            "ma_state": self.ma_state.snapshot(),
+            "previous_close": self.previous_close,
+            "value": self.value,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"], snapshot["ma_method"])
+        self.ma_state.restore(snapshot["ma_state"])
+        self.previous_close = snapshot["previous_close"]
+        self.value = snapshot["value"]
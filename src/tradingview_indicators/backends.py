@@ -0,0 +1,256 @@
+"""
+Backend Registry Module
+
+This module keeps track of the interchangeable implementations
+(backends) of the indicators and picks the fastest one for a given
+input length.
+
+Each backend of an indicator must return the same values. A one-time
+`calibrate` call times every backend on this machine and stores the
+input sizes where the fastest backend changes, which `select_backend`
+then uses for `method="auto"`.
+
+Functions
+---------
+register_backend(indicator, name)
+    Decorator that registers a backend of an indicator.
+
+available_backends(indicator)
+    Get the registered backends of an indicator.
+
+select_backend(indicator, size)
+    Get the name of the fastest backend for an input size.
+
+calibrate(indicators=None, sizes=..., repeat=5, path=None)
+    Time every backend and store the crossover sizes.
+
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from .errors_exceptions import InvalidArgumentError
+
+CALIBRATION_ENV_VAR = "TRADINGVIEW_INDICATORS_BACKENDS"
+DEFAULT_CALIBRATION_PATH = (
+    Path.home() / ".tradingview_indicators" / "backends.json"
+)
+DEFAULT_SIZES = (50, 200, 1_000, 5_000, 20_000, 100_000, 1_000_000)
+
+_BACKENDS: dict[str, dict[str, Callable]] = {}
+_CALIBRATION: dict[str, list[tuple[int, str]]] | None = None
+
+
+def calibration_path() -> Path:
+    """
+    Get the path of the calibration file.
+
+    The path can be changed with the
+    `TRADINGVIEW_INDICATORS_BACKENDS` environment variable.
+
+    Returns
+    -------
+    Path
+        The path of the calibration file.
+    """
+    return Path(os.environ.get(CALIBRATION_ENV_VAR, DEFAULT_CALIBRATION_PATH))
+
+
+def register_backend(indicator: str, name: str) -> Callable:
+    """
+    Decorator that registers a backend of an indicator.
+
+    The first registered backend is the default one when there is no
+    calibration for the indicator.
+
+    Parameters
+    ----------
+    indicator : str
+        The name of the indicator.
+    name : str
+        The name of the backend.
+
+    Returns
+    -------
+    Callable
+        The decorator, which returns the function unchanged.
+    """
+    def decorator(function: Callable) -> Callable:
+        _BACKENDS.setdefault(indicator, {})[name] = function
+        return function
+    return decorator
+
+
+def available_backends(indicator: str) -> dict[str, Callable]:
+    """
+    Get the registered backends of an indicator.
+
+    Parameters
+    ----------
+    indicator : str
+        The name of the indicator.
+
+    Returns
+    -------
+    dict[str, Callable]
+        The backends of the indicator, by name.
+
+    Raises
+    ------
+    InvalidArgumentError
+        If the indicator has no registered backends.
+    """
+    if indicator not in _BACKENDS:
+        raise InvalidArgumentError(
+            f"'{indicator}' has no registered backends."
+        )
+    return _BACKENDS[indicator]
+
+
+def load_calibration(
+    path: str | Path | None = None,
+) -> dict[str, list[tuple[int, str]]]:
+    """
+    Load the calibration file, keeping it in memory for the next calls.
+
+    Parameters
+    ----------
+    path : str or Path, optional
+        The path of the calibration file. If not provided,
+        `calibration_path()` is used.
+
+    Returns
+    -------
+    dict[str, list[tuple[int, str]]]
+        The crossover sizes of each indicator, as sorted
+        (minimum size, backend name) pairs. Empty if the file doesn't
+        exist.
+    """
+    global _CALIBRATION
+
+    path = Path(path) if path is not None else calibration_path()
+    if path.exists():
+        with open(path, encoding="utf-8") as file:
+            raw_calibration = json.load(file)
+        _CALIBRATION = {
+            indicator: [(int(size), name) for size, name in crossovers]
+            for indicator, crossovers in raw_calibration.items()
+        }
+    else:
+        _CALIBRATION = {}
+    return _CALIBRATION
+
+
+def select_backend(indicator: str, size: int) -> str:
+    """
+    Get the name of the fastest backend of an indicator for an input
+    size.
+
+    Parameters
+    ----------
+    indicator : str
+        The name of the indicator.
+    size : int
+        The length of the input data.
+
+    Returns
+    -------
+    str
+        The name of the backend. The first registered backend is
+        returned if the indicator wasn't calibrated.
+    """
+    backends = available_backends(indicator)
+    calibration = _CALIBRATION if _CALIBRATION is not None else load_calibration()
+
+    selected = next(iter(backends))
+    for min_size, name in calibration.get(indicator, []):
+        if size < min_size:
+            break
+        if name in backends:
+            selected = name
+    return selected
+
+
+def _time_backend(
+    function: Callable,
+    source: pd.Series,
+    repeat: int,
+) -> float:
+    """
+    Get the best run time of a backend, after a warm-up call.
+    """
+    function(source, 14)
+    best_time = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(source, 14)
+        best_time = min(best_time, time.perf_counter() - start)
+    return best_time
+
+
+def calibrate(
+    indicators: list[str] | None = None,
+    sizes: tuple[int, ...] = DEFAULT_SIZES,
+    repeat: int = 5,
+    path: str | Path | None = None,
+) -> dict[str, list[tuple[int, str]]]:
+    """
+    Time every backend of the indicators and store the sizes where the
+    fastest backend changes.
+
+    Parameters
+    ----------
+    indicators : list[str], optional
+        The indicators to calibrate. If not provided, every registered
+        indicator is calibrated.
+    sizes : tuple[int, ...], optional
+        The input sizes to time.
+        (default: DEFAULT_SIZES)
+    repeat : int, optional
+        The number of timed runs per backend and size.
+        (default: 5)
+    path : str or Path, optional
+        The path of the calibration file. If not provided,
+        `calibration_path()` is used.
+
+    Returns
+    -------
+    dict[str, list[tuple[int, str]]]
+        The crossover sizes of each calibrated indicator.
+    """
+    global _CALIBRATION
+
+    path = Path(path) if path is not None else calibration_path()
+    calibration = dict(load_calibration(path))
+    indicators = list(_BACKENDS) if indicators is None else indicators
+
+    random_state = np.random.default_rng(42)
+    for indicator in indicators:
+        backends = available_backends(indicator)
+        crossovers = []
+        for size in sorted(sizes):
+            source = pd.Series(
+                random_state.standard_normal(size).cumsum() + 1000
+            )
+            timings = {
+                name: _time_backend(function, source, repeat)
+                for name, function in backends.items()
+            }
+            fastest = min(timings, key=timings.get)
+            if not crossovers or crossovers[-1][1] != fastest:
+                crossovers.append((size, fastest))
+
+        crossovers[0] = (0, crossovers[0][1])
+        calibration[indicator] = crossovers
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(calibration, file, indent=4)
+
+    _CALIBRATION = calibration
+    return calibration
@@ -1,4 +1,88 @@
+from typing import Sequence
+import numpy as np
 import pandas as pd
+from numba import njit
+from .zscore import _welford_add, _welford_remove
+
+@njit(error_model="numpy")
+def rolling_mean_std_numba(
+    source: np.ndarray,
+    lengths: np.ndarray,
+    ddof: int = 1,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling mean and standard deviation of the input
+    array for several window lengths in a single pass using Numba.
+
+    The mean and the variance of each length are updated together in
+    O(1) per value with Welford's algorithm, and recalculated from
+    scratch every `length` values, so the rounding error can't build
+    up over long series.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    lengths : np.ndarray
+        The number of periods of each window.
+    ddof : int, optional
+        Degrees of freedom correction in the calculation of the
+        standard deviation.
+        (default: 1)
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The rolling means and standard deviations, with one column per
+        length. The first `length - 1` values and the windows
+        containing a NaN value are NaN.
+    """
+    n_rows = len(source)
+    n_lengths = len(lengths)
+    means = np.full((n_rows, n_lengths), np.nan)
+    stds = np.full((n_rows, n_lengths), np.nan)
+    counts = np.zeros(n_lengths, dtype=np.int64)
+    window_means = np.zeros(n_lengths)
+    m2s = np.zeros(n_lengths)
+    nan_counts = np.zeros(n_lengths, dtype=np.int64)
+    for i in range(n_rows):
+        value = source[i]
+        for j in range(n_lengths):
+            length = lengths[j]
+            count = counts[j]
+            mean = window_means[j]
+            m2 = m2s[j]
+            if i >= length:
+                old_value = source[i - length]
+                if np.isnan(old_value):
+                    nan_counts[j] -= 1
+                else:
+                    count, mean, m2 = _welford_remove(
+                        count, mean, m2, old_value
+                    )
+
+            if np.isnan(value):
+                nan_counts[j] += 1
+            else:
+                count, mean, m2 = _welford_add(count, mean, m2, value)
+
+            if (i + 1) % length == 0:
+                count = 0
+                mean = 0.0
+                m2 = 0.0
+                for k in range(i - length + 1, i + 1):
+                    if not np.isnan(source[k]):
+                        count, mean, m2 = _welford_add(
+                            count, mean, m2, source[k]
+                        )
+
+            counts[j] = count
+            window_means[j] = mean
+            m2s[j] = m2
+            if i >= length - 1 and nan_counts[j] == 0:
+                means[i, j] = mean
+                stds[i, j] = np.sqrt(m2 / (count - ddof))
+    return means, stds
 
 def bb(source, length, mult):
     """
@@ -12,8 +96,309 @@ def bb(source, length, mult):
     Returns:
     tuple: A tuple containing the middle band, upper band, and lower band.
     """
-    basis = source.rolling(window=length).mean()
-    dev = mult * source.rolling(window=length).std()
+    means, stds = rolling_mean_std_numba(
+        source.to_numpy(dtype=np.float64), np.array([length])
+    )
+    basis = pd.Series(means[:, 0], index=source.index, name=source.name)
+    dev = mult * stds[:, 0]
     upper_band = basis + dev
     lower_band = basis - dev
-    return basis, upper_band, lower_band
\ No newline at end of file
+    return basis, upper_band, lower_band
+
+def bollinger_bands(
+    source: pd.Series,
+    lengths: int | Sequence[int] = 20,
+    mults: float | Sequence[float] = 2.0,
+    ddof: int = 1,
+) -> dict[str, pd.DataFrame]:
+    """
+    Calculate the Bollinger Bands for every combination of lengths and
+    multipliers, with their %B and bandwidth.
+
+    The mean and standard deviation of every length are calculated in
+    a single pass and shared by all of its multipliers.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The input time series data.
+    lengths : int or Sequence[int], optional
+        The periods of the bands.
+        (default: 20)
+    mults : float or Sequence[float], optional
+        The multipliers for the standard deviation.
+        (default: 2.0)
+    ddof : int, optional
+        Degrees of freedom correction in the calculation of the
+        standard deviation.
+        (default: 1)
+
+    Returns:
+    --------
+    dict[str, pd.DataFrame]
+        A dict with the "basis" block, with one column per length, and
+        the "upper", "lower", "percent_b" and "bandwidth" blocks, with
+        (length, mult) columns. %B is the position of the source between
+        the bands, and the bandwidth is the distance between the bands
+        relative to the basis.
+
+    Raises:
+    -------
+    ValueError
+        If a length is not a positive integer.
+    """
+    lengths = [int(length) for length in np.atleast_1d(lengths)]
+    mults = [float(mult) for mult in np.atleast_1d(mults)]
+    if len(lengths) == 0 or any(length < 1 for length in lengths):
+        raise ValueError("lengths must be positive integers")
+
+    values = source.to_numpy(dtype=np.float64)
+    means, stds = rolling_mean_std_numba(
+        values, np.array(lengths, dtype=np.int64), ddof
+    )
+
+    columns = pd.MultiIndex.from_product(
+        [lengths, mults], names=["length", "mult"]
+    )
+    devs = (stds[:, :, None] * np.array(mults)).reshape(len(values), -1)
+    basis = np.repeat(means, len(mults), axis=1)
+    upper = basis + devs
+    lower = basis - devs
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_b = (values[:, None] - lower) / (upper - lower)
+        bandwidth = (upper - lower) / basis
+
+    return {
+        "basis": pd.DataFrame(means, index=source.index, columns=lengths),
+        "upper": pd.DataFrame(upper, index=source.index, columns=columns),
+        "lower": pd.DataFrame(lower, index=source.index, columns=columns),
+        "percent_b": pd.DataFrame(
+            percent_b, index=source.index, columns=columns
+        ),
+        "bandwidth": pd.DataFrame(
+            bandwidth, index=source.index, columns=columns
+        ),
+    }
+
+
+class BollingerState:
+    """
+    Stateful Bollinger Bands updater.
+
+    Keeps the last `length` values in a ring buffer next to the Welford
+    mean and variance of the window, so each update costs O(1)
+    amortized for every multiplier and matches `bollinger_bands`.
+
+    Attributes:
+    -----------
+    length : int
+        The period of the bands.
+    mults : np.ndarray
+        The multipliers for the standard deviation.
+    ddof : int
+        Degrees of freedom correction in the calculation of the
+        standard deviation.
+    n_values : int
+        The number of values consumed.
+    values : dict
+        The last calculated "basis", and the "upper", "lower",
+        "percent_b" and "bandwidth" arrays with one value per
+        multiplier.
+    """
+    def __init__(
+        self,
+        length: int = 20,
+        mults: float | Sequence[float] = 2.0,
+        ddof: int = 1,
+    ) -> None:
+        """
+        Initialize an empty Bollinger Bands state.
+
+        Parameters:
+        -----------
+        length : int, optional
+            The period of the bands.
+            (default: 20)
+        mults : float or Sequence[float], optional
+            The multipliers for the standard deviation.
+            (default: 2.0)
+        ddof : int, optional
+            Degrees of freedom correction in the calculation of the
+            standard deviation.
+            (default: 1)
+        """
+        if length < 1:
+            raise ValueError("length must be a positive integer")
+
+        self.length = length
+        self.mults = np.atleast_1d(np.asarray(mults, dtype=np.float64))
+        self.ddof = ddof
+        self.window = np.zeros(length)
+        self.n_values = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.nan_count = 0
+        nan_values = np.full(len(self.mults), np.nan)
+        self.values = {
+            "basis": np.nan,
+            "upper": nan_values,
+            "lower": nan_values.copy(),
+            "percent_b": nan_values.copy(),
+            "bandwidth": nan_values.copy(),
+        }
+
+    @classmethod
+    def from_source(
+        cls,
+        source: pd.Series,
+        length: int = 20,
+        mults: float | Sequence[float] = 2.0,
+        ddof: int = 1,
+    ) -> "BollingerState":
+        """
+        Create a Bollinger Bands state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int, optional
+            The period of the bands.
+            (default: 20)
+        mults : float or Sequence[float], optional
+            The multipliers for the standard deviation.
+            (default: 2.0)
+        ddof : int, optional
+            Degrees of freedom correction in the calculation of the
+            standard deviation.
+            (default: 1)
+
+        Returns:
+        --------
+        BollingerState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length, mults, ddof)
+        # Replay from the start of the window before the last
+        # recalculated one, so the Welford state follows the same steps
+        # as the batch calculation. The start is a multiple of `length`,
+        # which keeps the ring buffer positions.
+        start = max(len(source) // length - 2, 0) * length
+        for value in source.to_numpy(dtype=np.float64)[start:]:
+            state.update(value)
+        state.n_values += start
+        return state
+
+    def update(self, value: float) -> dict:
+        """
+        Consume a new value and return the updated bands.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        dict
+            The updated "basis", and the "upper", "lower", "percent_b"
+            and "bandwidth" arrays with one value per multiplier.
+        """
+        value = float(value)
+        position = self.n_values % self.length
+        if self.n_values >= self.length:
+            old_value = self.window[position]
+            if np.isnan(old_value):
+                self.nan_count -= 1
+            else:
+                self.count, self.mean, self.m2 = _welford_remove(
+                    self.count, self.mean, self.m2, old_value
+                )
+
+        if np.isnan(value):
+            self.nan_count += 1
+        else:
+            self.count, self.mean, self.m2 = _welford_add(
+                self.count, self.mean, self.m2, value
+            )
+        self.window[position] = value
+        self.n_values += 1
+
+        if self.n_values % self.length == 0:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            for window_value in self.window:
+                if not np.isnan(window_value):
+                    self.count, self.mean, self.m2 = _welford_add(
+                        self.count, self.mean, self.m2, window_value
+                    )
+
+        if self.n_values < self.length or self.nan_count:
+            basis = np.nan
+            std = np.nan
+        else:
+            basis = self.mean
+            with np.errstate(divide="ignore", invalid="ignore"):
+                std = np.sqrt(
+                    np.float64(self.m2) / (self.count - self.ddof)
+                )
+
+        dev = std * self.mults
+        upper = basis + dev
+        lower = basis - dev
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.values = {
+                "basis": basis,
+                "upper": upper,
+                "lower": lower,
+                "percent_b": (value - lower) / (upper - lower),
+                "bandwidth": (upper - lower) / basis,
+            }
+        return self.values
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "mults": self.mults.copy(),
+            "ddof": self.ddof,
+            "window": self.window.copy(),
+            "n_values": self.n_values,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "nan_count": self.nan_count,
+            "values": {
+                key: np.copy(value) if isinstance(value, np.ndarray)
+                else value
+                for key, value in self.values.items()
+            },
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"], snapshot["mults"], snapshot["ddof"])
+        self.window = snapshot["window"].copy()
+        self.n_values = snapshot["n_values"]
+        self.count = snapshot["count"]
+        self.mean = snapshot["mean"]
+        self.m2 = snapshot["m2"]
+        self.nan_count = snapshot["nan_count"]
+        self.values = {
+            key: np.copy(value) if isinstance(value, np.ndarray) else value
+            for key, value in snapshot["values"].items()
+        }
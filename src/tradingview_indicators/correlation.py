@@ -1,4 +1,8 @@
+from typing import Hashable, Sequence
+import numpy as np
 import pandas as pd
+from numba import njit, prange
+from .bb import rolling_mean_std_numba
 
 def correlation(source1, source2, length):
     """
@@ -12,4 +16,238 @@ def correlation(source1, source2, length):
     Returns:
     pd.Series: The correlation values.
     """
-    return source1.rolling(window=length).corr(source2)
\ No newline at end of file
+    return source1.rolling(window=length).corr(source2)
+
+@njit
+def _comoment_add(
+    count: int,
+    mean_x: float,
+    mean_y: float,
+    comoment: float,
+    x: float,
+    y: float,
+) -> tuple[int, float, float, float]:
+    """
+    Add a pair of values to a Welford co-moment: the sum of the
+    products of the deviations from the means.
+    """
+    count += 1
+    delta_x = x - mean_x
+    mean_x += delta_x / count
+    mean_y += (y - mean_y) / count
+    comoment += delta_x * (y - mean_y)
+    return count, mean_x, mean_y, comoment
+
+@njit
+def _comoment_remove(
+    count: int,
+    mean_x: float,
+    mean_y: float,
+    comoment: float,
+    x: float,
+    y: float,
+) -> tuple[int, float, float, float]:
+    """
+    Remove a pair of values from a Welford co-moment.
+    """
+    count -= 1
+    if count == 0:
+        return 0, 0.0, 0.0, 0.0
+    delta_x = x - mean_x
+    mean_x -= delta_x / count
+    mean_y -= (y - mean_y) / count
+    comoment -= delta_x * (y - mean_y)
+    return count, mean_x, mean_y, comoment
+
+@njit(error_model="numpy")
+def rolling_comoment_numba(
+    source1: np.ndarray,
+    source2: np.ndarray,
+    length: int,
+) -> np.ndarray:
+    """
+    Calculate the rolling co-moment of two arrays using Numba.
+
+    The means and the co-moment of the window are updated together in
+    O(1) per value with Welford's algorithm, and recalculated from
+    scratch every `length` values, so the rounding error can't build
+    up over long series.
+
+    Parameters:
+    source1 (np.ndarray): The first input array.
+    source2 (np.ndarray): The second input array.
+    length (int): The number of periods of the window.
+
+    Returns:
+    np.ndarray: The sums of the products of the deviations from the
+    window means. The first `length - 1` values and the windows
+    containing a NaN value are NaN.
+    """
+    n_rows = len(source1)
+    comoments = np.full(n_rows, np.nan)
+    count = 0
+    mean_x = 0.0
+    mean_y = 0.0
+    comoment = 0.0
+    nan_count = 0
+    for i in range(n_rows):
+        if i >= length:
+            old_x = source1[i - length]
+            old_y = source2[i - length]
+            if np.isnan(old_x) or np.isnan(old_y):
+                nan_count -= 1
+            else:
+                count, mean_x, mean_y, comoment = _comoment_remove(
+                    count, mean_x, mean_y, comoment, old_x, old_y
+                )
+
+        if np.isnan(source1[i]) or np.isnan(source2[i]):
+            nan_count += 1
+        else:
+            count, mean_x, mean_y, comoment = _comoment_add(
+                count, mean_x, mean_y, comoment, source1[i], source2[i]
+            )
+
+        if (i + 1) % length == 0:
+            count = 0
+            mean_x = 0.0
+            mean_y = 0.0
+            comoment = 0.0
+            for j in range(i - length + 1, i + 1):
+                if not (np.isnan(source1[j]) or np.isnan(source2[j])):
+                    count, mean_x, mean_y, comoment = _comoment_add(
+                        count, mean_x, mean_y, comoment,
+                        source1[j], source2[j],
+                    )
+
+        if i >= length - 1 and nan_count == 0:
+            comoments[i] = comoment
+    return comoments
+
+@njit(parallel=True, error_model="numpy")
+def rolling_correlation_numba(
+    source: np.ndarray,
+    length: int,
+    first: np.ndarray,
+    second: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the rolling correlation of pairs of columns of a 2-D
+    array using Numba.
+
+    The rolling standard deviation of every column is calculated once
+    and shared by all of its pairs, so each pair only adds its rolling
+    co-moment. The columns and then the pairs are split across threads.
+
+    Parameters:
+    source (np.ndarray): The input values, one time series per column.
+    length (int): The number of periods of the window.
+    first (np.ndarray): The column position of the first series of
+    each pair.
+    second (np.ndarray): The column position of the second series of
+    each pair.
+
+    Returns:
+    np.ndarray: The correlation values, with one column per pair. The
+    first `length - 1` values, the windows containing a NaN value and
+    the windows of a constant series are NaN.
+    """
+    n_rows, n_cols = source.shape
+    lengths = np.array([length])
+    stds = np.empty((n_rows, n_cols))
+    for col in prange(n_cols):
+        column_stds = rolling_mean_std_numba(source[:, col], lengths, 0)[1]
+        stds[:, col] = column_stds[:, 0]
+
+    n_pairs = len(first)
+    correlations = np.full((n_rows, n_pairs), np.nan)
+    for pair in prange(n_pairs):
+        a = first[pair]
+        b = second[pair]
+        comoments = rolling_comoment_numba(source[:, a], source[:, b], length)
+        for i in range(length - 1, n_rows):
+            denominator = length * stds[i, a] * stds[i, b]
+            if not denominator > 0:
+                continue
+            correlation = comoments[i] / denominator
+            correlations[i, pair] = min(max(correlation, -1.0), 1.0)
+    return correlations
+
+def correlation_matrix(
+    source: pd.DataFrame,
+    length: int,
+    pairs: Sequence[tuple[Hashable, Hashable]] | None = None,
+    latest: bool = False,
+) -> pd.DataFrame | pd.Series:
+    """
+    Calculate the rolling correlation of every pair of columns, or of
+    the given pairs, of a wide DataFrame.
+
+    Parameters:
+    source (pd.DataFrame): The input data, one symbol per column.
+    length (int): The period over which to calculate the correlation.
+    pairs (Sequence[tuple], optional): The (column, column) pairs to
+    calculate. If not provided, every pair of distinct columns is
+    calculated. (default: None)
+    latest (bool, optional): Whether to calculate only the correlation
+    of the last window. (default: False)
+
+    Returns:
+    pd.DataFrame or pd.Series: With `latest`, the correlation matrix of
+    the last window, or a Series with one value per pair when `pairs`
+    is provided. Otherwise, the rolling correlation with one column per
+    pair, under a (first, second) MultiIndex.
+
+    Raises:
+    ValueError: If the length is not a positive integer or a pair
+    doesn't refer to columns of `source`.
+    """
+    if length < 1:
+        raise ValueError("length must be a positive integer")
+
+    values = source.to_numpy(dtype=np.float64)
+    if pairs is None:
+        first, second = np.triu_indices(values.shape[1], k=1)
+    else:
+        pairs = list(pairs)
+        first = source.columns.get_indexer([pair[0] for pair in pairs])
+        second = source.columns.get_indexer([pair[1] for pair in pairs])
+        if np.any(first < 0) or np.any(second < 0):
+            raise ValueError("pairs must refer to columns of source")
+    pair_index = pd.MultiIndex.from_arrays(
+        [source.columns[first], source.columns[second]],
+        names=["first", "second"],
+    )
+
+    if latest:
+        window = values[-length:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            deviations = window - window.mean(axis=0)
+            stds = np.sqrt(np.sum(deviations * deviations, axis=0))
+            if len(window) < length:
+                stds[:] = np.nan
+            stds[stds == 0] = np.nan
+
+            if pairs is None:
+                matrix = deviations.T @ deviations / np.outer(stds, stds)
+                return pd.DataFrame(
+                    np.clip(matrix, -1, 1),
+                    index=source.columns,
+                    columns=source.columns,
+                )
+
+            covariances = np.sum(
+                deviations[:, first] * deviations[:, second], axis=0
+            )
+            return pd.Series(
+                np.clip(covariances / (stds[first] * stds[second]), -1, 1),
+                index=pair_index,
+            )
+
+    correlations = rolling_correlation_numba(
+        np.asfortranarray(values),
+        length,
+        first.astype(np.int64),
+        second.astype(np.int64),
+    )
+    return pd.DataFrame(correlations, index=source.index, columns=pair_index)
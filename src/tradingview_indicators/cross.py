@@ -0,0 +1,176 @@
+from typing import Literal
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+
+CROSS_OUTPUTS = ("dense", "events", "packed")
+
+@njit
+def cross_numba(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """
+    Detect the crossovers and crossunders between two arrays in a
+    single pass using Numba.
+
+    Parameters:
+    -----------
+    series1 : np.ndarray
+        The first array of values.
+    series2 : np.ndarray
+        The second array of values.
+
+    Returns:
+    --------
+    np.ndarray
+        The int8 cross directions: 1 where `series1` crosses over
+        `series2`, -1 where it crosses under it and 0 elsewhere.
+        Comparisons with NaN values are False, like pandas.
+    """
+    n_rows = len(series1)
+    directions = np.zeros(n_rows, dtype=np.int8)
+    for i in range(1, n_rows):
+        if series1[i - 1] < series2[i - 1] and series1[i] > series2[i]:
+            directions[i] = 1
+        elif series1[i - 1] > series2[i - 1] and series1[i] < series2[i]:
+            directions[i] = -1
+    return directions
+
+@njit
+def cross_events_numba(
+    series1: np.ndarray,
+    series2: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Detect the crossovers and crossunders between two arrays using
+    Numba, returning only the positions where they occur.
+
+    Parameters:
+    -----------
+    series1 : np.ndarray
+        The first array of values.
+    series2 : np.ndarray
+        The second array of values.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The int64 positions of the crosses and their int8 directions,
+        1 for crossovers and -1 for crossunders.
+    """
+    directions = cross_numba(series1, series2)
+    positions = np.flatnonzero(directions)
+    return positions, directions[positions]
+
+@njit(parallel=True)
+def _cross_2d_numba(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """
+    Detect the crosses between the matching columns of two 2-D arrays,
+    with the columns in parallel.
+    """
+    n_rows, n_cols = series1.shape
+    directions = np.empty((n_rows, n_cols), dtype=np.int8)
+    for col in prange(n_cols):
+        directions[:, col] = cross_numba(series1[:, col], series2[:, col])
+    return directions
+
+def _validate_cross_sources(series1, series2) -> None:
+    """
+    Check that both sources are Series, or DataFrames, of the same
+    shape.
+    """
+    if isinstance(series1, pd.DataFrame) or isinstance(series2, pd.DataFrame):
+        if not isinstance(series1, pd.DataFrame):
+            raise ValueError("series1 must be a pandas DataFrame")
+        if not isinstance(series2, pd.DataFrame):
+            raise ValueError("series2 must be a pandas DataFrame")
+        if series1.shape != series2.shape:
+            raise ValueError("series1 and series2 must be of the same shape")
+        return
+
+    if not isinstance(series1, pd.Series):
+        raise ValueError("series1 must be a pandas Series")
+    if not isinstance(series2, pd.Series):
+        raise ValueError("series2 must be a pandas Series")
+    if len(series1) != len(series2):
+        raise ValueError("series1 and series2 must be of the same length")
+
+def cross(
+    series1: pd.Series | pd.DataFrame,
+    series2: pd.Series | pd.DataFrame,
+    output: Literal["dense", "events", "packed"] = "dense",
+) -> pd.Series | pd.DataFrame | dict[str, np.ndarray]:
+    """
+    Detect the crossovers and crossunders between two series at once.
+
+    Parameters:
+    -----------
+    series1 : pd.Series or pd.DataFrame
+        The first series of values. A DataFrame holds one series per
+        column, compared with the column at the same position of
+        `series2`.
+    series2 : pd.Series or pd.DataFrame
+        The second series of values, with the shape of `series1`.
+    output : {"dense", "events", "packed"}, optional
+        "dense" returns the int8 direction of every value, 1 for
+        crossovers, -1 for crossunders and 0 elsewhere. "events" returns
+        only the crosses, with their "position" and int8 "direction"
+        columns, indexed by the index of `series1`, and the "column"
+        position of the pair for DataFrames. "packed" returns the
+        "crossover" and "crossunder" masks packed into bits along the
+        rows with `np.packbits`, to be unpacked with
+        `np.unpackbits(mask, axis=0, count=len(series1))`.
+        (default: "dense")
+
+    Returns:
+    --------
+    pd.Series, pd.DataFrame or dict[str, np.ndarray]
+        The crosses, in the requested output.
+
+    Raises:
+    -------
+    ValueError
+        If the sources are not Series or DataFrames of the same shape,
+        or the output is invalid.
+    """
+    _validate_cross_sources(series1, series2)
+    if output not in CROSS_OUTPUTS:
+        raise ValueError("output must be 'dense', 'events' or 'packed'")
+
+    is_batch = isinstance(series1, pd.DataFrame)
+    values1 = series1.to_numpy(dtype=np.float64)
+    values2 = series2.to_numpy(dtype=np.float64)
+    if is_batch:
+        directions = _cross_2d_numba(
+            np.asfortranarray(values1), np.asfortranarray(values2)
+        )
+    elif output == "events":
+        positions, event_directions = cross_events_numba(values1, values2)
+        return pd.DataFrame(
+            {"position": positions, "direction": event_directions},
+            index=series1.index[positions],
+        )
+    else:
+        directions = cross_numba(values1, values2)
+
+    match output:
+        case "dense":
+            if is_batch:
+                return pd.DataFrame(
+                    directions, index=series1.index, columns=series1.columns
+                )
+            return pd.Series(directions, index=series1.index, name="Cross")
+        case "packed":
+            return {
+                "crossover": np.packbits(directions == 1, axis=0),
+                "crossunder": np.packbits(directions == -1, axis=0),
+            }
+
+    # Row-major order keeps the events of a DataFrame sorted by time.
+    rows, columns = np.nonzero(directions)
+    return pd.DataFrame(
+        {
+            "position": rows,
+            "column": columns,
+            "direction": directions[rows, columns],
+        },
+        index=series1.index[rows],
+    )
@@ -1,4 +1,6 @@
+import numpy as np
 import pandas as pd
+from .cross import cross_numba
 
 def crossunder(series1: pd.Series, series2: pd.Series) -> pd.Series:
     """
@@ -23,5 +25,9 @@ def crossunder(series1: pd.Series, series2: pd.Series) -> pd.Series:
     if len(series1) != len(series2):
         raise ValueError("series1 and series2 must be of the same length")
 
-    crossunder = (series1.shift(1) > series2.shift(1)) & (series1 < series2)
-    return crossunder.astype(int).rename("Crossunder")
\ No newline at end of file
+    directions = cross_numba(
+        series1.to_numpy(dtype=np.float64), series2.to_numpy(dtype=np.float64)
+    )
+    return pd.Series(
+        (directions == -1).astype(int), index=series1.index, name="Crossunder"
+    )
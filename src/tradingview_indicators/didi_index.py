@@ -1,4 +1,7 @@
-from typing import Literal
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Literal, Sequence
+import numpy as np
 import pandas as pd
 from .moving_average import sma, ema, sema, rma
 from .utils import DynamicTimeWarping
@@ -36,57 +39,181 @@ def didi_index(
         The method to use for the distances calculation.
         (default: "absolute")
     """
+    short_ma = _moving_average(source, short_length, ma_method)
+    mid_ma = _moving_average(source, mid_length, ma_method)
+    long_ma = _moving_average(source, long_length, ma_method)
+
+    if use_dtw:
+        short_didi = _dtw_distance(short_ma, mid_ma, method)
+        long_didi = _dtw_distance(long_ma, mid_ma, method)
+
+    elif method == "absolute":
+        short_didi = short_ma - mid_ma
+        long_didi = long_ma - mid_ma
+
+    elif method == "ratio":
+        short_didi = short_ma / mid_ma
+        long_didi = long_ma / mid_ma
+    else:
+        raise ValueError("Invalid method provided. Use 'absolute' or 'ratio'.")
+
+    return long_didi - short_didi
+
+
+def _moving_average(
+    source: pd.Series,
+    length: int,
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"],
+) -> pd.Series:
+    """
+    Calculate one of the Didi Index moving averages.
+    """
     match ma_method:
         case "sma":
-            short_ma = sma(source, short_length)
-            mid_ma = sma(source, mid_length)
-            long_ma = sma(source, long_length)
-
+            return sma(source, length)
         case "ema":
-            short_ma = ema(source, short_length)
-            mid_ma = ema(source, mid_length)
-            long_ma = ema(source, long_length)
-
+            return ema(source, length)
         case "dema":
-            short_ma = sema(source, short_length, 2)
-            mid_ma = sema(source, mid_length, 2)
-            long_ma = sema(source, long_length, 2)
-
+            return sema(source, length, 2)
         case "tema":
-            short_ma = sema(source, short_length, 3)
-            mid_ma = sema(source, mid_length, 3)
-            long_ma = sema(source, long_length, 3)
-
+            return sema(source, length, 3)
         case "rma":
-            short_ma = rma(source, short_length)
-            mid_ma = rma(source, mid_length)
-            long_ma = rma(source, long_length)
-
+            return rma(source, length)
         case _:
             raise ValueError(
                 "Invalid method provided."
                 "Use 'sma', 'ema', 'dema', 'tema' or 'rma'."
             )
 
-    if use_dtw:
-        short_didi = (
-            DynamicTimeWarping(short_ma, mid_ma)
-            .calculate_dtw_distance(method, True)
-        )
 
-        long_didi = (
-            DynamicTimeWarping(long_ma, mid_ma)
-            .calculate_dtw_distance(method, True)
-        )
+def _dtw_distance(
+    input_x: pd.Series,
+    input_y: pd.Series,
+    method: Literal["absolute", "ratio"],
+) -> pd.Series:
+    """
+    Calculate the distance between two moving averages aligned with
+    Dynamic Time Warping.
+    """
+    return (
+        DynamicTimeWarping(input_x, input_y)
+        .calculate_dtw_distance(method, True)
+    )
 
-    elif method == "absolute":
-        short_didi = short_ma - mid_ma
-        long_didi = long_ma - mid_ma
 
-    elif method == "ratio":
-        short_didi = short_ma / mid_ma
-        long_didi = long_ma / mid_ma
-    else:
+def didi_index_grid(
+    source: pd.Series,
+    lengths: Sequence[tuple[int, int, int]],
+    ma_method: Literal["sma", "ema", "dema", "tema", "rma"] = "ema",
+    method: Literal["absolute", "ratio"] = "absolute",
+    use_dtw: bool = False,
+    n_jobs: int | None = None,
+) -> pd.DataFrame:
+    """
+    Calculate the Didi Index for every (short, mid, long) triple of
+    lengths.
+
+    Each distinct moving average is calculated once and shared by every
+    triple that uses it. The values of each triple match `didi_index`
+    with the same parameters.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The time series data to calculate the Didi Index for.
+    lengths : Sequence[tuple[int, int, int]]
+        The (short_length, mid_length, long_length) triples.
+    ma_method : Literal["sma", "ema", "dema", "tema", "rma"], optional
+        The method to use for the moving average calculation.
+        (default: "ema")
+    method : Literal["absolute", "ratio"], optional
+        The method to use for the distances calculation.
+        (default: "absolute")
+    use_dtw : bool, optional
+        Whether to align the moving averages with Dynamic Time Warping
+        before calculating the distances.
+        (default: False)
+    n_jobs : int, optional
+        The number of worker processes to split the DTW alignments
+        across. If not provided, everything runs in this process.
+        The workers are spawned, so scripts using them need an
+        `if __name__ == "__main__":` guard.
+
+    Returns:
+    --------
+    pd.DataFrame
+        The Didi Index values, with one column per triple under a
+        (short_length, mid_length, long_length) MultiIndex, aligned to
+        the source index.
+
+    Raises:
+    -------
+    ValueError
+        If a triple or a method is invalid.
+    """
+    if isinstance(source, pd.DataFrame):
+        raise TypeError("source can't be a DataFrame")
+    if method not in ("absolute", "ratio"):
         raise ValueError("Invalid method provided. Use 'absolute' or 'ratio'.")
 
-    return long_didi - short_didi
+    triples = [tuple(int(length) for length in triple) for triple in lengths]
+    if not triples or any(
+        len(triple) != 3 or min(triple) < 1 for triple in triples
+    ):
+        raise ValueError("lengths must be triples of positive integers")
+
+    columns = pd.MultiIndex.from_tuples(
+        triples, names=["short_length", "mid_length", "long_length"]
+    )
+    distinct_lengths = sorted(set().union(*triples))
+    moving_averages = {
+        length: _moving_average(source, length, ma_method)
+        for length in distinct_lengths
+    }
+
+    if not use_dtw:
+        ma_values = np.column_stack([
+            moving_averages[length]
+            .reindex(source.index)
+            .to_numpy(dtype=np.float64)
+            for length in distinct_lengths
+        ])
+        positions = np.searchsorted(distinct_lengths, triples)
+        short_ma = ma_values[:, positions[:, 0]]
+        mid_ma = ma_values[:, positions[:, 1]]
+        long_ma = ma_values[:, positions[:, 2]]
+        if method == "absolute":
+            didi_values = (long_ma - mid_ma) - (short_ma - mid_ma)
+        else:
+            didi_values = long_ma / mid_ma - short_ma / mid_ma
+        return pd.DataFrame(didi_values, index=source.index, columns=columns)
+
+    # Each (short or long, mid) alignment is calculated once.
+    pairs = sorted(
+        {(short, mid) for short, mid, _ in triples}
+        | {(long, mid) for _, mid, long in triples}
+    )
+    inputs_x = [moving_averages[length] for length, _ in pairs]
+    inputs_y = [moving_averages[mid] for _, mid in pairs]
+    methods = [method] * len(pairs)
+    if n_jobs is None or n_jobs < 2 or len(pairs) < 2:
+        distances = list(map(_dtw_distance, inputs_x, inputs_y, methods))
+    else:
+        # Forking after Numba started its parallel threads can leave the
+        # process unable to exit, so the workers are spawned instead.
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            distances = list(
+                executor.map(_dtw_distance, inputs_x, inputs_y, methods)
+            )
+    distances = dict(zip(pairs, distances))
+
+    didi_values = np.empty((len(source), len(triples)))
+    for idx, (short, mid, long) in enumerate(triples):
+        didi = distances[(long, mid)] - distances[(short, mid)]
+        didi_values[:, idx] = didi.reindex(source.index).to_numpy(
+            dtype=np.float64
+        )
+    return pd.DataFrame(didi_values, index=source.index, columns=columns)
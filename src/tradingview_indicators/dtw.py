@@ -0,0 +1,384 @@
+from typing import Literal
+
+import numpy as np
+import pandas as pd
+from numba import njit
+
+from .errors_exceptions import InvalidArgumentError
+
+@njit
+def dtw_numba(
+    input_x: np.ndarray,
+    input_y: np.ndarray,
+    row_start: np.ndarray,
+    row_end: np.ndarray,
+) -> tuple[float, np.ndarray, np.ndarray]:
+    """
+    Calculate the Dynamic Time Warping (DTW) between two sequences
+    inside a window using Numba.
+
+    The window keeps, for each index `i` of `input_x`, the range
+    [row_start[i], row_end[i]) of indexes of `input_y` that can be
+    matched with it. Cells outside the window are never allocated.
+
+    Parameters:
+    -----------
+    input_x : np.ndarray
+        The first input sequence.
+    input_y : np.ndarray
+        The second input sequence.
+    row_start : np.ndarray
+        The first `input_y` index of each row of the window.
+    row_end : np.ndarray
+        The end (exclusive) `input_y` index of each row of the window.
+
+    Returns:
+    --------
+    tuple[float, np.ndarray, np.ndarray]
+        The DTW distance and the warping path, as the int32 indexes of
+        `input_x` and `input_y`.
+    """
+    len_x = len(input_x)
+    offsets = np.zeros(len_x + 1, dtype=np.int64)
+    for i in range(len_x):
+        offsets[i + 1] = offsets[i] + row_end[i] - row_start[i]
+
+    cost = np.empty(offsets[len_x])
+    # 0: from (i - 1, j), 1: from (i, j - 1), 2: from (i - 1, j - 1)
+    step = np.empty(offsets[len_x], dtype=np.int8)
+
+    for i in range(len_x):
+        for j in range(row_start[i], row_end[i]):
+            distance = abs(input_x[i] - input_y[j])
+
+            up_cost = np.inf
+            diag_cost = np.inf
+            if i > 0:
+                if row_start[i - 1] <= j < row_end[i - 1]:
+                    up_cost = cost[offsets[i - 1] + j - row_start[i - 1]]
+                if row_start[i - 1] <= j - 1 < row_end[i - 1]:
+                    diag_cost = cost[
+                        offsets[i - 1] + j - 1 - row_start[i - 1]
+                    ]
+            elif j == 0:
+                diag_cost = 0.0
+
+            left_cost = np.inf
+            if j > row_start[i]:
+                left_cost = cost[offsets[i] + j - 1 - row_start[i]]
+
+            # Ties keep the first option, in the (up, left, diag) order.
+            best_cost = up_cost + distance
+            best_step = 0
+            if left_cost + distance < best_cost:
+                best_cost = left_cost + distance
+                best_step = 1
+            if diag_cost + distance < best_cost:
+                best_cost = diag_cost + distance
+                best_step = 2
+
+            cost[offsets[i] + j - row_start[i]] = best_cost
+            step[offsets[i] + j - row_start[i]] = best_step
+
+    i = len_x - 1
+    j = len(input_y) - 1
+    path_x = np.empty(len_x + len(input_y), dtype=np.int32)
+    path_y = np.empty(len_x + len(input_y), dtype=np.int32)
+    path_length = 0
+    while True:
+        path_x[path_length] = i
+        path_y[path_length] = j
+        path_length += 1
+        if i == 0 and j == 0:
+            break
+        cell_step = step[offsets[i] + j - row_start[i]]
+        if cell_step == 0:
+            i -= 1
+        elif cell_step == 1:
+            j -= 1
+        else:
+            i -= 1
+            j -= 1
+
+    last_row = len_x - 1
+    distance = cost[offsets[last_row] + len(input_y) - 1 - row_start[last_row]]
+    return (
+        distance,
+        path_x[:path_length][::-1].copy(),
+        path_y[:path_length][::-1].copy(),
+    )
+
+@njit
+def _connect_rows(
+    row_start: np.ndarray,
+    row_end: np.ndarray,
+    len_y: int,
+) -> None:
+    """
+    Make sure that the window contains both corners and a path between
+    them.
+    """
+    len_x = len(row_start)
+    row_start[0] = 0
+    row_end[len_x - 1] = len_y
+    for i in range(len_x):
+        row_start[i] = max(0, min(row_start[i], len_y - 1))
+        row_end[i] = min(len_y, max(row_end[i], row_start[i] + 1))
+        if i > 0:
+            row_start[i] = min(row_start[i], row_end[i - 1])
+            row_end[i] = max(row_end[i], row_start[i - 1] + 1)
+
+@njit
+def sakoe_chiba_window(
+    len_x: int,
+    len_y: int,
+    radius: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the Sakoe-Chiba band: the cells within `radius` of the
+    diagonal between both corners.
+
+    Parameters:
+    -----------
+    len_x : int
+        The length of the first sequence.
+    len_y : int
+        The length of the second sequence.
+    radius : int
+        The half-width of the band.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The first and the end (exclusive) `input_y` index of each row.
+    """
+    row_start = np.empty(len_x, dtype=np.int64)
+    row_end = np.empty(len_x, dtype=np.int64)
+    slope = (len_y - 1) / (len_x - 1) if len_x > 1 else 0.0
+    for i in range(len_x):
+        center = i * slope
+        row_start[i] = int(np.ceil(center - radius))
+        row_end[i] = int(np.floor(center + radius)) + 1
+    _connect_rows(row_start, row_end, len_y)
+    return row_start, row_end
+
+@njit
+def itakura_window(
+    len_x: int,
+    len_y: int,
+    max_slope: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the Itakura parallelogram: the cells reachable from both
+    corners with a local slope between 1 / `max_slope` and `max_slope`.
+
+    Parameters:
+    -----------
+    len_x : int
+        The length of the first sequence.
+    len_y : int
+        The length of the second sequence.
+    max_slope : float
+        The maximum slope of the parallelogram sides.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The first and the end (exclusive) `input_y` index of each row.
+    """
+    row_start = np.empty(len_x, dtype=np.int64)
+    row_end = np.empty(len_x, dtype=np.int64)
+    scale = (len_y - 1) / (len_x - 1) if len_x > 1 else 0.0
+    last_x = len_x - 1
+    last_y = len_y - 1
+    for i in range(len_x):
+        lower = max(
+            i * scale / max_slope,
+            last_y - (last_x - i) * scale * max_slope,
+        )
+        upper = min(
+            i * scale * max_slope,
+            last_y - (last_x - i) * scale / max_slope,
+        )
+        row_start[i] = int(np.ceil(lower - 1e-9))
+        row_end[i] = int(np.floor(upper + 1e-9)) + 1
+    _connect_rows(row_start, row_end, len_y)
+    return row_start, row_end
+
+@njit
+def _expand_window(
+    path_x: np.ndarray,
+    path_y: np.ndarray,
+    len_x: int,
+    len_y: int,
+    radius: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Project a coarse warping path, widened by `radius`, to the window
+    of the sequences at twice the resolution, like FastDTW.
+    """
+    n_coarse = len_x // 2 + radius + 2
+    coarse_start = np.full(n_coarse, np.iinfo(np.int64).max)
+    coarse_end = np.full(n_coarse, np.iinfo(np.int64).min)
+    for k in range(len(path_x)):
+        for row in range(path_x[k] - radius, path_x[k] + radius + 1):
+            if 0 <= row < n_coarse:
+                coarse_start[row] = min(coarse_start[row], path_y[k] - radius)
+                coarse_end[row] = max(coarse_end[row], path_y[k] + radius)
+
+    row_start = np.empty(len_x, dtype=np.int64)
+    row_end = np.empty(len_x, dtype=np.int64)
+    start_j = 0
+    for i in range(len_x):
+        first_j = max(2 * coarse_start[i // 2], start_j)
+        last_j = min(2 * coarse_end[i // 2] + 1, len_y - 1)
+        row_start[i] = first_j
+        row_end[i] = max(last_j + 1, first_j)
+        start_j = first_j
+    return row_start, row_end
+
+@njit
+def _reduce_by_half(values: np.ndarray) -> np.ndarray:
+    """
+    Average each pair of values, dropping the last odd value.
+    """
+    reduced = np.empty(len(values) // 2)
+    for i in range(len(reduced)):
+        reduced[i] = (values[2 * i] + values[2 * i + 1]) / 2
+    return reduced
+
+@njit
+def fastdtw_numba(
+    input_x: np.ndarray,
+    input_y: np.ndarray,
+    radius: int,
+) -> tuple[float, np.ndarray, np.ndarray]:
+    """
+    Calculate the approximate Dynamic Time Warping (DTW) between two
+    sequences with the FastDTW algorithm using Numba.
+
+    The sequences are halved until they are shorter than `radius + 2`,
+    and the path found at each resolution, widened by `radius`, limits
+    the window of the next resolution. The result is the same as the
+    `fastdtw` package with the absolute difference distance.
+
+    Parameters:
+    -----------
+    input_x : np.ndarray
+        The first input sequence.
+    input_y : np.ndarray
+        The second input sequence.
+    radius : int
+        The number of cells to widen the coarse path by.
+
+    Returns:
+    --------
+    tuple[float, np.ndarray, np.ndarray]
+        The DTW distance and the warping path, as the int32 indexes of
+        `input_x` and `input_y`.
+    """
+    levels_x = [input_x]
+    levels_y = [input_y]
+    while len(levels_x[-1]) >= radius + 2 and len(levels_y[-1]) >= radius + 2:
+        levels_x.append(_reduce_by_half(levels_x[-1]))
+        levels_y.append(_reduce_by_half(levels_y[-1]))
+
+    coarse_x = levels_x[-1]
+    coarse_y = levels_y[-1]
+    distance, path_x, path_y = dtw_numba(
+        coarse_x,
+        coarse_y,
+        np.zeros(len(coarse_x), dtype=np.int64),
+        np.full(len(coarse_x), len(coarse_y), dtype=np.int64),
+    )
+
+    for level in range(len(levels_x) - 2, -1, -1):
+        level_x = levels_x[level]
+        level_y = levels_y[level]
+        row_start, row_end = _expand_window(
+            path_x, path_y, len(level_x), len(level_y), radius
+        )
+        distance, path_x, path_y = dtw_numba(
+            level_x, level_y, row_start, row_end
+        )
+    return distance, path_x, path_y
+
+def dtw(
+    input_x: np.ndarray | pd.Series,
+    input_y: np.ndarray | pd.Series,
+    method: Literal["approximate", "exact"] = "approximate",
+    radius: int = 1,
+    band: Literal["sakoe_chiba", "itakura"] | None = None,
+    max_slope: float = 2.0,
+) -> tuple[float, np.ndarray, np.ndarray]:
+    """
+    Calculate the Dynamic Time Warping (DTW) between two sequences,
+    using the absolute difference as the distance.
+
+    Parameters:
+    -----------
+    input_x : np.ndarray or pd.Series
+        The first input sequence.
+    input_y : np.ndarray or pd.Series
+        The second input sequence.
+    method : Literal["approximate", "exact"], optional
+        "approximate" uses the FastDTW algorithm, and "exact" fills the
+        whole cost matrix, or the `band` when one is provided.
+        (default: "approximate")
+    radius : int, optional
+        The FastDTW radius for the "approximate" method, or the
+        half-width of the "sakoe_chiba" band.
+        (default: 1)
+    band : Literal["sakoe_chiba", "itakura"], optional
+        The global constraint for the "exact" method.
+        (default: None)
+    max_slope : float, optional
+        The maximum slope of the "itakura" parallelogram.
+        (default: 2.0)
+
+    Returns:
+    --------
+    tuple[float, np.ndarray, np.ndarray]
+        The DTW distance and the warping path, as the int32 indexes of
+        `input_x` and `input_y`.
+
+    Raises:
+    -------
+    InvalidArgumentError
+        If an invalid method or band is provided.
+    """
+    input_x = np.ascontiguousarray(input_x, dtype=np.float64)
+    input_y = np.ascontiguousarray(input_y, dtype=np.float64)
+    len_x = len(input_x)
+    len_y = len(input_y)
+
+    if len_x == 0 or len_y == 0:
+        raise InvalidArgumentError("input sequences can't be empty")
+    if radius < 0:
+        raise InvalidArgumentError("radius can't be negative")
+
+    match method:
+        case "approximate":
+            return fastdtw_numba(input_x, input_y, radius)
+        case "exact":
+            pass
+        case _:
+            raise InvalidArgumentError(
+                "method must be either 'approximate' or 'exact'"
+            )
+
+    match band:
+        case None:
+            row_start = np.zeros(len_x, dtype=np.int64)
+            row_end = np.full(len_x, len_y, dtype=np.int64)
+        case "sakoe_chiba":
+            row_start, row_end = sakoe_chiba_window(len_x, len_y, radius)
+        case "itakura":
+            if max_slope < 1:
+                raise InvalidArgumentError("max_slope must be at least 1")
+            row_start, row_end = itakura_window(len_x, len_y, max_slope)
+        case _:
+            raise InvalidArgumentError(
+                "band must be None, 'sakoe_chiba' or 'itakura'"
+            )
+    return dtw_numba(input_x, input_y, row_start, row_end)
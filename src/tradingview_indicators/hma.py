@@ -1,27 +1,7 @@
 import numpy as np
 import pandas as pd
 from numba import njit
-
-@njit
-def wma_numba(values, length):
-    """
-    Calculate the Weighted Moving Average (WMA) using Numba.
-
-    Parameters:
-    values (np.ndarray): The input data array.
-    length (int): The period of the WMA.
-
-    Returns:
-    np.ndarray: The WMA values.
-    """
-    weights = np.arange(1, length + 1)
-    wma_values = np.empty_like(values)
-    wma_values[:] = np.nan
-
-    for i in range(length - 1, len(values)):
-        wma_values[i] = np.dot(values[i-length+1:i+1], weights) / weights.sum()
-    
-    return wma_values
+from .wma import wma_numba
 
 @njit
 def hma_numba(values, length):
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 from .utils import OHLC_finder
+from .rolling_extremum import highest, lowest, RollingExtremumState
 
 def ichimoku(
     dataframe: pd.DataFrame,
@@ -41,42 +43,21 @@ def ichimoku(
         dataframe,
     )
 
-    def _donchian(length) -> pd.Series:
-        """
-        Calculate the Donchian line.
-
-        This method calculates the Donchian line based on the given
-        'length' for rolling highest high and lowest low values.
-
-        Parameters:
-        -----------
-        length : int
-            The number of periods for Donchian line calculation.
-
-        Returns:
-        --------
-        pd.Series
-            A Series representing the Donchian line.
-        """
-        max_rolling = high.rolling(length).max()
-        min_rolling = low.rolling(length).min()
-        return (max_rolling + min_rolling) / 2
+    # The highs and lows of the three periods are calculated in one pass.
+    lengths = [conversion_periods, base_periods, lagging_span_2_periods]
+    max_rolling = highest(high, lengths).to_numpy()
+    min_rolling = lowest(low, lengths).to_numpy()
+    donchian = (max_rolling + min_rolling) / 2
 
-    conversion_line = (
-        _donchian(conversion_periods)
-        .rename("conversion_line")
-    )
-
-    base_line = (
-        _donchian(base_periods)
-        .rename("base_line")
+    conversion_line = pd.Series(
+        donchian[:, 0], index=high.index, name="conversion_line"
     )
+    base_line = pd.Series(donchian[:, 1], index=high.index, name="base_line")
 
     lead_line1 = (conversion_line + base_line) / 2
 
-    lead_line2 = (
-        _donchian(lagging_span_2_periods)
-        .rename("kumo_cloud_lower_line")
+    lead_line2 = pd.Series(
+        donchian[:, 2], index=high.index, name="kumo_cloud_lower_line"
     )
 
     leading_span_a = lead_line1.shift(displacement - 1)
@@ -88,15 +69,235 @@ def ichimoku(
         .rename('lagging_span')
     )
 
-    ichimoku_clouds = pd.DataFrame()
+    return pd.DataFrame(
+        {
+            "conversion_line": conversion_line,
+            "base_line": base_line,
+            "lagging_span": lagging_span,
+            "lead_line1": lead_line1,
+            "lead_line2": lead_line2,
+            "leading_span_a": leading_span_a,
+            "leading_span_b": leading_span_b,
+        }
+    )
+
 
-    ichimoku_clouds["conversion_line"] = conversion_line
-    ichimoku_clouds["base_line"] = base_line
-    ichimoku_clouds["lagging_span"] = lagging_span
+class IchimokuState:
+    """
+    Stateful Ichimoku Cloud updater.
+
+    Keeps monotonic deques for the highs and lows of the conversion,
+    base and lagging span 2 periods, and a ring buffer of the last
+    `displacement` lead lines for the leading spans, so each bar costs
+    O(1) amortized.
 
-    ichimoku_clouds["lead_line1"] = lead_line1
-    ichimoku_clouds["lead_line2"] = lead_line2
+    The lagging span of a bar is its close `displacement - 1` bars
+    back, so each update returns the lagging span completed by the new
+    close, which belongs to the bar `displacement - 1` bars back.
 
-    ichimoku_clouds["leading_span_a"] = leading_span_a
-    ichimoku_clouds["leading_span_b"] = leading_span_b
-    return ichimoku_clouds
+    Attributes:
+    -----------
+    conversion_periods : int
+        The number of periods to calculate the Conversion Line.
+    base_periods : int
+        The number of periods to calculate the Base Line.
+    lagging_span_2_periods : int
+        The number of periods to calculate Lagging Span 2.
+    displacement : int
+        The displacement of the indicator lines into the future.
+    n_values : int
+        The number of bars consumed.
+    values : dict
+        The last calculated components, with the same names as the
+        `ichimoku` columns.
+    """
+    def __init__(
+        self,
+        conversion_periods: int,
+        base_periods: int,
+        lagging_span_2_periods: int,
+        displacement: int,
+    ) -> None:
+        """
+        Initialize an empty Ichimoku Cloud state.
+
+        Parameters:
+        -----------
+        conversion_periods : int
+            The number of periods to calculate the Conversion Line.
+        base_periods : int
+            The number of periods to calculate the Base Line.
+        lagging_span_2_periods : int
+            The number of periods to calculate Lagging Span 2.
+        displacement : int
+            The displacement of the indicator lines into the future.
+        """
+        if displacement < 1:
+            raise ValueError("displacement must be a positive integer")
+
+        self.conversion_periods = conversion_periods
+        self.base_periods = base_periods
+        self.lagging_span_2_periods = lagging_span_2_periods
+        self.displacement = displacement
+        lengths = [conversion_periods, base_periods, lagging_span_2_periods]
+        self.highs = RollingExtremumState(lengths, 1)
+        self.lows = RollingExtremumState(lengths, -1)
+        self.lead_lines = np.full((displacement, 2), np.nan)
+        self.n_values = 0
+        self.values = dict.fromkeys(
+            [
+                "conversion_line",
+                "base_line",
+                "lagging_span",
+                "lead_line1",
+                "lead_line2",
+                "leading_span_a",
+                "leading_span_b",
+            ],
+            np.nan,
+        )
+
+    @classmethod
+    def from_source(
+        cls,
+        dataframe: pd.DataFrame,
+        conversion_periods: int,
+        base_periods: int,
+        lagging_span_2_periods: int,
+        displacement: int,
+    ) -> "IchimokuState":
+        """
+        Create an Ichimoku Cloud state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        dataframe : pd.DataFrame
+            The DataFrame containing the high, low and close prices.
+        conversion_periods : int
+            The number of periods to calculate the Conversion Line.
+        base_periods : int
+            The number of periods to calculate the Base Line.
+        lagging_span_2_periods : int
+            The number of periods to calculate Lagging Span 2.
+        displacement : int
+            The displacement of the indicator lines into the future.
+
+        Returns:
+        --------
+        IchimokuState
+            The state positioned after the last bar of `dataframe`.
+        """
+        state = cls(
+            conversion_periods,
+            base_periods,
+            lagging_span_2_periods,
+            displacement,
+        )
+        _, high, low, close = OHLC_finder(dataframe)
+        lengths = state.highs.lengths
+        state.highs = RollingExtremumState.from_source(high, lengths, 1)
+        state.lows = RollingExtremumState.from_source(low, lengths, -1)
+
+        clouds = ichimoku(
+            dataframe,
+            conversion_periods,
+            base_periods,
+            lagging_span_2_periods,
+            displacement,
+        )
+        state.n_values = len(clouds)
+        lead_lines = clouds[["lead_line1", "lead_line2"]].to_numpy()
+        for offset in range(min(displacement, state.n_values)):
+            position = state.n_values - 1 - offset
+            state.lead_lines[position % displacement] = lead_lines[position]
+
+        if state.n_values:
+            state.values.update(clouds.iloc[-1].to_dict())
+            state.values["lagging_span"] = float(close.iloc[-1])
+        return state
+
+    def update(self, high: float, low: float, close: float) -> dict:
+        """
+        Consume a new bar and return the updated components.
+
+        Parameters:
+        -----------
+        high : float
+            The high price of the new bar.
+        low : float
+            The low price of the new bar.
+        close : float
+            The close price of the new bar.
+
+        Returns:
+        --------
+        dict
+            The components of the new bar, with the same names as the
+            `ichimoku` columns. "lagging_span" is the close of the new
+            bar, which is the lagging span of the bar
+            `displacement - 1` bars back.
+        """
+        conversion_line, base_line, lead_line2 = (
+            self.highs.update(high) + self.lows.update(low)
+        ) / 2
+        lead_line1 = (conversion_line + base_line) / 2
+
+        position = self.n_values % self.displacement
+        self.lead_lines[position] = lead_line1, lead_line2
+        self.n_values += 1
+        leading_span_a, leading_span_b = (
+            self.lead_lines[self.n_values % self.displacement]
+        )
+
+        self.values = {
+            "conversion_line": conversion_line,
+            "base_line": base_line,
+            "lagging_span": float(close),
+            "lead_line1": lead_line1,
+            "lead_line2": lead_line2,
+            "leading_span_a": leading_span_a,
+            "leading_span_b": leading_span_b,
+        }
+        return self.values
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "conversion_periods": self.conversion_periods,
+            "base_periods": self.base_periods,
+            "lagging_span_2_periods": self.lagging_span_2_periods,
+            "displacement": self.displacement,
+            "highs": self.highs.snapshot(),
+            "lows": self.lows.snapshot(),
+            "lead_lines": self.lead_lines.copy(),
+            "n_values": self.n_values,
+            "values": dict(self.values),
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(
+            snapshot["conversion_periods"],
+            snapshot["base_periods"],
+            snapshot["lagging_span_2_periods"],
+            snapshot["displacement"],
+        )
+        self.highs.restore(snapshot["highs"])
+        self.lows.restore(snapshot["lows"])
+        self.lead_lines = snapshot["lead_lines"].copy()
+        self.n_values = snapshot["n_values"]
+        self.values = dict(snapshot["values"])
@@ -1,10 +1,181 @@
 import pandas as pd
 import numpy as np
+from numba import njit, prange
 
-def linreg(source: pd.Series, length: int, offset: int = 0) -> pd.Series:
+@njit
+def linreg_numba(
+    source: np.ndarray,
+    length: int,
+    offset: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling least squares regression of the input array
+    using Numba.
+
+    The window sums Σy, Σxy and Σy² are updated in O(1) per value and
+    recalculated from scratch every `length` values, and after NaN
+    values leave the window.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The period for calculating the Linear Regression.
+    offset : int, optional
+        The offset to be applied in the formula (default is 0).
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+        The slope, the intercept at the start of the window, the
+        Linear Regression curve, the coefficient of determination (r²)
+        and the standard error of the regression of each window.
+    """
+    n_rows = len(source)
+    slope = np.full(n_rows, np.nan)
+    intercept = np.full(n_rows, np.nan)
+    linreg_values = np.full(n_rows, np.nan)
+    r_squared = np.full(n_rows, np.nan)
+    std_error = np.full(n_rows, np.nan)
+
+    x_mean = (length - 1) / 2
+    x_var_sum = length * (length * length - 1) / 12
+
+    sum_y = 0.0
+    sum_xy = 0.0
+    sum_yy = 0.0
+    last_nan = -1
+    is_valid = False
+    for i in range(n_rows):
+        if np.isnan(source[i]):
+            last_nan = i
+
+        if i < length - 1 or last_nan > i - length:
+            is_valid = False
+            continue
+
+        if is_valid and i % length != 0:
+            old_value = source[i - length]
+            sum_xy += old_value - sum_y + (length - 1) * source[i]
+            sum_y += source[i] - old_value
+            sum_yy += source[i] * source[i] - old_value * old_value
+        else:
+            sum_y = 0.0
+            sum_xy = 0.0
+            sum_yy = 0.0
+            for j in range(length):
+                value = source[i - length + 1 + j]
+                sum_y += value
+                sum_xy += j * value
+                sum_yy += value * value
+            is_valid = True
+
+        covariance_sum = sum_xy - x_mean * sum_y
+        y_var_sum = max(sum_yy - sum_y * sum_y / length, 0.0)
+        if x_var_sum == 0:
+            continue
+
+        slope[i] = covariance_sum / x_var_sum
+        intercept[i] = sum_y / length - slope[i] * x_mean
+        linreg_values[i] = intercept[i] + slope[i] * (length - 1 - offset)
+
+        if y_var_sum > 0:
+            r_squared[i] = min(
+                covariance_sum * covariance_sum / (x_var_sum * y_var_sum),
+                1.0,
+            )
+        if length > 2:
+            residual_sum = max(y_var_sum - slope[i] * covariance_sum, 0.0)
+            std_error[i] = np.sqrt(residual_sum / (length - 2))
+
+    return slope, intercept, linreg_values, r_squared, std_error
+
+@njit(parallel=True)
+def linreg_2d_numba(
+    source: np.ndarray,
+    length: int,
+    offset: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the Linear Regression curve of every column of a 2-D
+    array using Numba.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input 2-D array of values.
+    length : int
+        The period for calculating the Linear Regression.
+    offset : int, optional
+        The offset to be applied in the formula (default is 0).
+
+    Returns:
+    --------
+    np.ndarray
+        The Linear Regression curve values of each column.
+    """
+    linreg_values = np.empty(source.shape)
+    for col in prange(source.shape[1]):
+        linreg_values[:, col] = linreg_numba(source[:, col], length, offset)[2]
+    return linreg_values
+
+def linreg(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+    offset: int = 0,
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Linear Regression curve for the given series.
 
+    Parameters:
+    -----------
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The input series of values. A DataFrame or a 2-D array is
+        treated as one series per column.
+    length : int
+        The period for calculating the Linear Regression.
+    offset : int, optional
+        The offset to be applied in the formula (default is 0).
+
+    Returns:
+    --------
+    pd.Series, pd.DataFrame or np.ndarray
+        The Linear Regression curve values.
+    """
+    if length < 1:
+        raise ValueError("length must be a positive integer")
+
+    if isinstance(source, pd.Series):
+        linreg_values = linreg_numba(
+            source.to_numpy(dtype=np.float64), length, offset
+        )[2]
+        return pd.Series(linreg_values, index=source.index, name="LinReg")
+
+    if isinstance(source, pd.DataFrame):
+        values = np.asfortranarray(source.to_numpy(dtype=np.float64))
+        return pd.DataFrame(
+            linreg_2d_numba(values, length, offset),
+            index=source.index,
+            columns=source.columns,
+        )
+
+    if isinstance(source, np.ndarray) and source.ndim == 2:
+        values = np.asfortranarray(source, dtype=np.float64)
+        return linreg_2d_numba(values, length, offset)
+
+    raise ValueError("source must be a pandas Series or DataFrame")
+
+def linreg_stats(
+    source: pd.Series,
+    length: int,
+    offset: int = 0,
+    fit_stats: bool = False,
+) -> pd.DataFrame:
+    """
+    Calculate the rolling Linear Regression slope, intercept and curve
+    for the given series in a single pass.
+
     Parameters:
     -----------
     source : pd.Series
@@ -13,29 +184,30 @@ def linreg(source: pd.Series, length: int, offset: int = 0) -> pd.Series:
         The period for calculating the Linear Regression.
     offset : int, optional
         The offset to be applied in the formula (default is 0).
+    fit_stats : bool, optional
+        Whether to include the coefficient of determination ("r2") and
+        the standard error of the regression ("stderr") columns.
+        (default: False)
 
     Returns:
     --------
-    pd.Series
-        The Linear Regression curve values.
+    pd.DataFrame
+        A DataFrame with the "slope", "intercept" and "LinReg" columns.
     """
     if not isinstance(source, pd.Series):
         raise ValueError("source must be a pandas Series")
     if length < 1:
         raise ValueError("length must be a positive integer")
-    
-    x = np.arange(length)
-    x_mean = np.mean(x)
-    
-    def calc_slope(y):
-        y_mean = np.mean(y)
-        return np.dot(y - y_mean, x - x_mean) / np.dot(x - x_mean, x - x_mean)
-
-    def calc_intercept(y):
-        return np.mean(y) - calc_slope(y) * x_mean
-
-    slope = source.rolling(window=length).apply(calc_slope, raw=False)
-    intercept = source.rolling(window=length).apply(calc_intercept, raw=False)
-    
-    linreg = intercept + slope * (length - 1 - offset)
-    return linreg.rename("LinReg")
+
+    slope, intercept, linreg_values, r_squared, std_error = linreg_numba(
+        source.to_numpy(dtype=np.float64), length, offset
+    )
+
+    linreg_df = pd.DataFrame(
+        {"slope": slope, "intercept": intercept, "LinReg": linreg_values},
+        index=source.index,
+    )
+    if fit_stats:
+        linreg_df["r2"] = r_squared
+        linreg_df["stderr"] = std_error
+    return linreg_df
@@ -1,31 +1,97 @@
 from typing import Literal
 import pandas as pd
 import numpy as np
-from numba import njit
+from numba import njit, prange
+
+from .backends import available_backends, register_backend, select_backend
+from .rolling_sum import neumaier_add, rolling_mean, rolling_mean_numba
 
 # Simple Moving Average
-def sma(source: pd.Series, length: int) -> pd.Series:
+@register_backend("sma", "numba")
+def _sma_numba(source: pd.Series, length: int) -> pd.Series:
+    """
+    Calculate the SMA with the compensated Numba rolling mean.
+    """
+    return rolling_mean(source, length).dropna()
+
+@register_backend("sma", "pandas")
+def _sma_pandas(source: pd.Series, length: int) -> pd.Series:
+    """
+    Calculate the SMA with the pandas rolling mean.
+    """
+    return source.rolling(length).mean().dropna()
+
+@register_backend("sma", "numpy")
+def _sma_numpy(source: pd.Series, length: int) -> pd.Series:
+    """
+    Calculate the SMA with NumPy, as a difference of prefix sums.
+    """
+    values = source.to_numpy(dtype=np.float64)
+    is_nan = np.isnan(values)
+    n_blocks = -(-len(values) // length)
+    blocks = np.zeros(n_blocks * length)
+    blocks[:len(values)] = np.where(is_nan, 0.0, values)
+    blocks = blocks.reshape(n_blocks, length)
+
+    # The prefix sums restart at every block of `length` values, so
+    # their rounding error stays that of a single window. A window is
+    # the end of one block and the start of the next.
+    prefix_sums = blocks.cumsum(axis=1)
+    window_sums = prefix_sums.copy()
+    window_sums[1:, :-1] += prefix_sums[:-1, -1:] - prefix_sums[:-1, :-1]
+    sma_values = window_sums.ravel()[:len(values)] / length
+
+    nan_counts = np.cumsum(is_nan)
+    nan_counts[length:] -= nan_counts[:-length]
+    sma_values[nan_counts > 0] = np.nan
+    sma_values[:length - 1] = np.nan
+    return pd.Series(sma_values, index=source.index).dropna()
+
+def sma(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+    method: Literal["numba", "pandas", "numpy", "auto"] = "numba",
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Simple Moving Average (SMA)
     of the input time series data.
 
     Parameters:
     -----------
-    source : pd.Series
-        The time series data to calculate the SMA for.
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The time series data to calculate the SMA for. A DataFrame or
+        a 2-D array is treated as one time series per column.
     length : int
         The number of periods to include in the SMA calculation.
+    method : {"numba", "pandas", "numpy", "auto"}, optional
+        The backend to use for calculating the SMA. "auto" picks the
+        fastest backend for the input length, as measured by
+        `backends.calibrate`.
+        (default: "numba")
 
     Returns:
     --------
-    pd.Series
-        The calculated SMA time series data.
+    pd.Series, pd.DataFrame or np.ndarray
+        The calculated SMA time series data. Multi-column inputs keep
+        their shape, with NaN where a column has no value yet. A 1-D
+        array returns the values of the Series result.
     """
+    if _is_multi_column(source):
+        return _apply_2d(_sma_2d_numba, source, length)
+    if isinstance(source, np.ndarray):
+        return sma(pd.Series(source), length, method).to_numpy()
+
     if len(source) < length:
         return pd.Series([], dtype=np.float64)
-    
-    sma_series = source.rolling(length).mean()
-    return sma_series.dropna()
+
+    backends = available_backends("sma")
+    if method == "auto":
+        method = select_backend("sma", len(source))
+    if method not in backends:
+        raise TypeError(
+            "method must be 'numba', 'pandas', 'numpy' or 'auto'"
+        )
+    return backends[method](source, length)
 
 # Exponential Moving Average using Numba
 @njit
@@ -52,30 +118,81 @@ def ema_numba(source: np.ndarray, length: int) -> np.ndarray:
         ema_values[i] = alpha * source[i] + (1 - alpha) * ema_values[i - 1]
     return ema_values
 
-def ema(source: pd.Series, length: int) -> pd.Series:
+def ema(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Exponential Moving Average (EMA)
     of the input time series data.
 
     Parameters:
     -----------
-    source : pd.Series
-        The time series data to calculate the EMA for.
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The time series data to calculate the EMA for. A DataFrame or
+        a 2-D array is treated as one time series per column.
     length : int
         The number of periods to include in the EMA calculation.
 
     Returns:
     --------
-    pd.Series
-        The calculated EMA time series data.
+    pd.Series, pd.DataFrame or np.ndarray
+        The calculated EMA time series data. Multi-column inputs keep
+        their shape, with NaN where a column has no value yet. A 1-D
+        array returns the values of the Series result.
     """
+    if _is_multi_column(source):
+        return _apply_2d(_ema_2d_numba, source, length)
+    if isinstance(source, np.ndarray):
+        return ema(pd.Series(source), length).to_numpy()
+
     if len(source) < length:
         return pd.Series([], dtype=np.float64)
     
     ema_values = ema_numba(source.to_numpy(), length)
     return pd.Series(ema_values, index=source.index).dropna()
 
-# Smoothed Exponential Moving Average
+# Smoothed Exponential Moving Average using Numba
+@njit
+def _sema_numba(source: np.ndarray, length: int, smooth: int) -> np.ndarray:
+    """
+    Calculate the Smoothed Exponential Moving Average (SEMA) using
+    Numba, running the `smooth` cascaded EMAs and their combination in
+    a single loop.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The number of periods to include in the SEMA calculation.
+    smooth : int
+        The number of EMAs to smooth.
+
+    Returns:
+    --------
+    np.ndarray
+        The calculated SEMA values.
+    """
+    alpha = 2 / (length + 1)
+    # The EMAs keep the source dtype, like chained `ema_numba` calls.
+    emas = np.empty(smooth, dtype=source.dtype)
+    sema_values = np.empty(len(source))
+    for i in range(len(source)):
+        value = source[i]
+        for k in range(smooth):
+            if i == 0:
+                emas[k] = value
+            else:
+                emas[k] = alpha * value + (1 - alpha) * emas[k]
+            value = emas[k]
+
+        diff_sum = 0.0
+        for k in range(1, smooth - 1):
+            diff_sum += emas[k] - emas[k - 1]
+        sema_values[i] = diff_sum * -1 * smooth + emas[smooth - 1]
+    return sema_values
+
 def sema(source: pd.Series, length: int, smooth: int) -> pd.Series:
     """
     Calculate the Smoothed Exponential Moving Average (SEMA)
@@ -97,22 +214,23 @@ def sema(source: pd.Series, length: int, smooth: int) -> pd.Series:
     """
     if len(source) < length:
         return pd.Series([], dtype=np.float64)
-    
-    emas_dict = {}
-    emas_dict["source_1"] = ema(source, length)
-    for value in range(2, smooth + 1):
-        emas_dict[f"source_{value}"] = ema(
-            emas_dict[f"source_{value-1}"],
-            length,
-        )
-    emas_df = pd.DataFrame(emas_dict)
-    emas_df["sema"] = (
-        emas_df[emas_df.columns[:-1]].diff(axis=1).sum(axis=1) * -1
-        * smooth
-        + emas_df[emas_df.columns[-1]]
+
+    source_arr = source.to_numpy()
+    sema_values = _sema_numba(source_arr, length, smooth)
+
+    # A NaN source value turns every later EMA value into NaN, and the
+    # inner EMAs return nothing when fewer than `length` values remain.
+    valid_length = np.argmax(np.isnan(sema_values))
+    if not np.isnan(sema_values[valid_length]):
+        valid_length = len(sema_values)
+    if smooth > 1 and valid_length < length:
+        valid_length = 0
+
+    return pd.Series(
+        sema_values[:valid_length],
+        index=source.index[:valid_length],
+        name="sema",
     )
-    sema_series = emas_df["sema"]
-    return sema_series.dropna()
 
 # Relative Moving Average using Pandas
 def _rma_pandas(
@@ -186,37 +304,1120 @@ def _rma_numba(source: np.ndarray, length: int) -> np.ndarray:
         rma_values[i] = alpha * source[i] + (1 - alpha) * rma_values[i - 1]
     return rma_values
 
+@register_backend("rma", "numba")
+def _rma_numba_series(source: pd.Series, length: int) -> pd.Series:
+    """
+    Calculate the TradingView RMA of a Series with Numba.
+    """
+    rma_values = _rma_numba(source.to_numpy(), length)
+    return pd.Series(rma_values, index=source.index).dropna()
+
+@register_backend("rma", "pandas_ewm")
+def _rma_pandas_ewm(source: pd.Series, length: int) -> pd.Series:
+    """
+    Calculate the TradingView RMA of a Series with the pandas EWM,
+    seeding it and propagating NaN values like `_rma_numba`.
+    """
+    values = source.to_numpy()
+    if not np.issubdtype(values.dtype, np.floating):
+        # The Numba loop truncates every step to the integer dtype of
+        # the source, which the EWM can't do.
+        return _rma_numba_series(source, length)
+
+    # A NaN value turns every later RMA value into NaN.
+    nan_positions = np.flatnonzero(np.isnan(values))
+    end = nan_positions[0] if len(nan_positions) else len(values)
+    if end < length:
+        end = 0
+
+    seeded_source = source.iloc[:end].astype(np.float64)
+    if end:
+        seeded_source.iloc[0] = np.mean(values[:length])
+    return (
+        seeded_source
+        .ewm(alpha=1 / length, adjust=False)
+        .mean()
+        .astype(values.dtype)
+        .rename(None)
+    )
+
+def _rma_numpy(source: pd.Series, length: int) -> pd.Series:
+    """
+    Calculate the Relative Moving Average (RMA) of the input time series
+    data using NumPy.
+
+    The RMA is seeded with the SMA of the first `length` values, like
+    TradingView's `ta.rma`. The recursion is solved for blocks of values
+    at once with a matrix product, carrying the last value of each block
+    into the next one.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The time series data to calculate the RMA for.
+    length : int
+        The number of periods to include in the RMA calculation.
+
+    Returns:
+    --------
+    pd.Series
+        The calculated RMA time series data, from the seed onwards. A
+        NaN value turns every later RMA value into NaN.
+    """
+    values = source.to_numpy(dtype=np.float64)
+    rma_values = np.full(len(values) - length + 1, np.nan)
+
+    nan_positions = np.flatnonzero(np.isnan(values))
+    end = nan_positions[0] if len(nan_positions) else len(values)
+    if end >= length:
+        alpha = 1 / length
+        # Larger blocks make the Python loop shorter, but the matrix
+        # product grows with the square of the block size.
+        block_size = 64
+        lags = np.subtract.outer(np.arange(block_size), np.arange(block_size))
+        weights = np.where(
+            lags >= 0, alpha * (1 - alpha) ** np.maximum(lags, 0), 0.0
+        )
+        carry_weights = (1 - alpha) ** np.arange(1, block_size + 1)
+
+        n_values = end - length
+        n_blocks = -(-n_values // block_size)
+        blocks = np.zeros(n_blocks * block_size)
+        blocks[:n_values] = values[length:end]
+        blocks = blocks.reshape(n_blocks, block_size) @ weights.T
+
+        previous = np.mean(values[:length])
+        rma_values[0] = previous
+        for block in blocks:
+            block += previous * carry_weights
+            previous = block[-1]
+        rma_values[1:n_values + 1] = blocks.ravel()[:n_values]
+
+    return pd.Series(rma_values, index=source.index[length - 1:], name="RMA")
+
 def rma(
-    source: pd.Series,
+    source: pd.Series | pd.DataFrame | np.ndarray,
     length: int,
-    method: Literal["numba", "pandas"] = "numba"
-) -> pd.Series:
+    method: Literal["numba", "pandas", "pandas_ewm", "numpy", "auto"] = (
+        "numba"
+    ),
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Relative Moving Average (RMA) of the input time series
     data.
 
     Parameters:
     -----------
-    source : pd.Series
-        The time series data to calculate the RMA for.
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The time series data to calculate the RMA for. A DataFrame or
+        a 2-D array is treated as one time series per column and is
+        always calculated with Numba.
     length : int
         The number of periods to include in the RMA calculation.
-    method : {"numba", "pandas"}, optional
+    method : {"numba", "pandas", "pandas_ewm", "numpy", "auto"}, optional
         The method to use for calculating the RMA, by default "numba".
+        "pandas" keeps the pandas EWM warm-up, which differs from
+        TradingView on the first values. "numpy" starts at the SMA
+        seed of TradingView's `ta.rma` and returns float values.
+        "pandas_ewm" matches the "numba" values, including their NaN
+        values and integer truncation, and "auto" picks the fastest of
+        these two for the input length, as measured by
+        `backends.calibrate`.
 
     Returns:
     --------
-    pd.Series
-        The calculated RMA time series data.
+    pd.Series, pd.DataFrame or np.ndarray
+        The calculated RMA time series data. Multi-column inputs keep
+        their shape, with NaN where a column has no value yet. A 1-D
+        array returns the values of the Series result.
     """
+    backends = available_backends("rma")
+    if method not in ("pandas", "numpy", "auto", *backends):
+        raise TypeError(
+            "method must be 'numba', 'pandas', 'pandas_ewm', 'numpy' or "
+            "'auto'"
+        )
+
+    if _is_multi_column(source):
+        return _apply_2d(_rma_2d_numba, source, length)
+    if isinstance(source, np.ndarray):
+        return rma(pd.Series(source), length, method).to_numpy()
+
     if len(source) < length:
         return pd.Series([], dtype=np.float64)
-    
-    match method:
-        case "numba":
-            rma_values = _rma_numba(source.to_numpy(), length)
-            return pd.Series(rma_values, index=source.index).dropna()
-        case "pandas":
-            return _rma_pandas(source, length)
-        case _:
-            raise TypeError("method must be 'numba' or 'pandas'")
+
+    if method == "pandas":
+        return _rma_pandas(source, length)
+    if method == "numpy":
+        return _rma_numpy(source, length)
+    if method == "auto":
+        method = select_backend("rma", len(source))
+    return backends[method](source, length)
+
+
+# Multi-column Moving Averages using Numba
+def _is_multi_column(source) -> bool:
+    """
+    Check if the source holds one time series per column.
+    """
+    return (
+        isinstance(source, pd.DataFrame)
+        or isinstance(source, np.ndarray) and source.ndim == 2
+    )
+
+def _apply_2d(kernel, source, *args) -> pd.DataFrame | np.ndarray:
+    """
+    Run a column-wise kernel over a DataFrame or 2-D array and wrap
+    the result like the input.
+    """
+    values = np.asfortranarray(np.asarray(source, dtype=np.float64))
+    result = kernel(values, *args)
+
+    if isinstance(source, pd.DataFrame):
+        return pd.DataFrame(result, index=source.index, columns=source.columns)
+    return result
+
+@njit
+def _first_valid(values: np.ndarray) -> int:
+    """
+    Return the position of the first non-NaN value of an array, or its
+    length if every value is NaN.
+    """
+    for i in range(len(values)):
+        if not np.isnan(values[i]):
+            return i
+    return len(values)
+
+@njit(parallel=True)
+def _ema_2d_numba(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the EMA of every column of a 2-D array, starting each
+    column at its first valid value.
+    """
+    n_rows, n_cols = source.shape
+    ema_values = np.full((n_rows, n_cols), np.nan)
+    for col in prange(n_cols):
+        start = _first_valid(source[:, col])
+        if n_rows - start >= length:
+            ema_values[start:, col] = ema_numba(source[start:, col], length)
+    return ema_values
+
+@njit(parallel=True)
+def _rma_2d_numba(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the RMA of every column of a 2-D array, starting each
+    column at its first valid value.
+    """
+    n_rows, n_cols = source.shape
+    rma_values = np.full((n_rows, n_cols), np.nan)
+    for col in prange(n_cols):
+        start = _first_valid(source[:, col])
+        if n_rows - start >= length:
+            rma_values[start:, col] = _rma_numba(source[start:, col], length)
+    return rma_values
+
+@njit(parallel=True)
+def _sma_2d_numba(source: np.ndarray, length: int) -> np.ndarray:
+    """
+    Calculate the SMA of every column of a 2-D array. Windows that
+    contain a NaN value produce NaN, like pandas rolling mean.
+    """
+    n_rows, n_cols = source.shape
+    sma_values = np.full((n_rows, n_cols), np.nan)
+    for col in prange(n_cols):
+        sma_values[:, col] = rolling_mean_numba(source[:, col], length)
+    return sma_values
+
+# Length Grid Moving Averages
+def _apply_grid(kernel, source, lengths, *args) -> pd.DataFrame | np.ndarray:
+    """
+    Run a length grid kernel over a Series or 1-D array and wrap the
+    result like the input, with one column per length.
+    """
+    lengths_arr = np.asarray(lengths, dtype=np.int64)
+    if lengths_arr.ndim != 1 or np.any(lengths_arr < 1):
+        raise ValueError("lengths must be a sequence of positive integers")
+
+    values = np.asarray(source, dtype=np.float64)
+    result = kernel(values, lengths_arr, *args)
+
+    if isinstance(source, pd.Series):
+        return pd.DataFrame(result, index=source.index, columns=list(lengths))
+    return result
+
+@njit
+def _sma_grid_numba(source: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Calculate the SMA for every length of the grid from one shared
+    prefix sum.
+
+    The prefix sum is compensated, and its running total and rounding
+    error are differenced separately, so a window sum doesn't lose the
+    precision of the whole series, like the compensated `sma`.
+    """
+    n_rows = len(source)
+    n_lengths = len(lengths)
+    prefix_sum = np.zeros(n_rows + 1)
+    prefix_compensation = np.zeros(n_rows + 1)
+    nan_count = np.zeros(n_rows + 1, dtype=np.int64)
+    total = 0.0
+    compensation = 0.0
+    for i in range(n_rows):
+        if np.isnan(source[i]):
+            nan_count[i + 1] = nan_count[i] + 1
+        else:
+            total, compensation = neumaier_add(
+                total, compensation, source[i]
+            )
+            nan_count[i + 1] = nan_count[i]
+        prefix_sum[i + 1] = total
+        prefix_compensation[i + 1] = compensation
+
+    sma_values = np.full((n_rows, n_lengths), np.nan)
+    for i in range(n_rows):
+        for j in range(n_lengths):
+            length = lengths[j]
+            start = i + 1 - length
+            if start >= 0 and nan_count[i + 1] == nan_count[start]:
+                window_sum = (prefix_sum[i + 1] - prefix_sum[start]) + (
+                    prefix_compensation[i + 1] - prefix_compensation[start]
+                )
+                sma_values[i, j] = window_sum / length
+    return sma_values
+
+@njit
+def _ema_grid_numba(source: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Calculate the EMA for every length of the grid in one pass.
+    """
+    n_rows = len(source)
+    n_lengths = len(lengths)
+    alphas = np.empty(n_lengths)
+    for j in range(n_lengths):
+        alphas[j] = 2 / (lengths[j] + 1)
+
+    ema_values = np.full((n_rows, n_lengths), np.nan)
+    if n_rows == 0:
+        return ema_values
+
+    ema_values[0, :] = source[0]
+    for i in range(1, n_rows):
+        for j in range(n_lengths):
+            alpha = alphas[j]
+            ema_values[i, j] = (
+                alpha * source[i] + (1 - alpha) * ema_values[i - 1, j]
+            )
+
+    for j in range(n_lengths):
+        if n_rows < lengths[j]:
+            ema_values[:, j] = np.nan
+    return ema_values
+
+@njit
+def _rma_grid_numba(source: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Calculate the RMA for every length of the grid in one pass.
+    """
+    n_rows = len(source)
+    n_lengths = len(lengths)
+    alphas = np.empty(n_lengths)
+    for j in range(n_lengths):
+        alphas[j] = 1 / lengths[j]
+
+    rma_values = np.full((n_rows, n_lengths), np.nan)
+    if n_rows == 0:
+        return rma_values
+
+    for j in range(n_lengths):
+        rma_values[0, j] = np.mean(source[:lengths[j]])
+    for i in range(1, n_rows):
+        for j in range(n_lengths):
+            alpha = alphas[j]
+            rma_values[i, j] = (
+                alpha * source[i] + (1 - alpha) * rma_values[i - 1, j]
+            )
+
+    for j in range(n_lengths):
+        if n_rows < lengths[j]:
+            rma_values[:, j] = np.nan
+    return rma_values
+
+@njit
+def _sema_grid_numba(
+    source: np.ndarray,
+    lengths: np.ndarray,
+    smooth: int,
+) -> np.ndarray:
+    """
+    Calculate the SEMA for every length of the grid in one pass,
+    keeping the `smooth` cascaded EMAs of each length in scratch state.
+    """
+    n_rows = len(source)
+    n_lengths = len(lengths)
+    alphas = np.empty(n_lengths)
+    for j in range(n_lengths):
+        alphas[j] = 2 / (lengths[j] + 1)
+
+    sema_values = np.full((n_rows, n_lengths), np.nan)
+    emas = np.empty((n_lengths, smooth))
+    for i in range(n_rows):
+        for j in range(n_lengths):
+            alpha = alphas[j]
+            value = source[i]
+            for k in range(smooth):
+                if i == 0:
+                    emas[j, k] = value
+                else:
+                    emas[j, k] = alpha * value + (1 - alpha) * emas[j, k]
+                value = emas[j, k]
+
+            diff_sum = 0.0
+            for k in range(1, smooth - 1):
+                diff_sum += emas[j, k] - emas[j, k - 1]
+            sema_values[i, j] = diff_sum * -1 * smooth + emas[j, smooth - 1]
+
+    for j in range(n_lengths):
+        if n_rows < lengths[j]:
+            sema_values[:, j] = np.nan
+    return sema_values
+
+def sma_grid(
+    source: pd.Series | np.ndarray,
+    lengths: list[int],
+) -> pd.DataFrame | np.ndarray:
+    """
+    Calculate the Simple Moving Average (SMA) for many lengths in a
+    single pass over the input time series data.
+
+    Parameters:
+    -----------
+    source : pd.Series or np.ndarray
+        The time series data to calculate the SMAs for.
+    lengths : list[int]
+        The lengths to calculate the SMA for.
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        A (n_bars x n_lengths) matrix with one SMA per column, with NaN
+        where `sma` has no value.
+    """
+    return _apply_grid(_sma_grid_numba, source, lengths)
+
+def ema_grid(
+    source: pd.Series | np.ndarray,
+    lengths: list[int],
+) -> pd.DataFrame | np.ndarray:
+    """
+    Calculate the Exponential Moving Average (EMA) for many lengths in
+    a single pass over the input time series data.
+
+    Parameters:
+    -----------
+    source : pd.Series or np.ndarray
+        The time series data to calculate the EMAs for.
+    lengths : list[int]
+        The lengths to calculate the EMA for.
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        A (n_bars x n_lengths) matrix with one EMA per column, with NaN
+        where `ema` has no value.
+    """
+    return _apply_grid(_ema_grid_numba, source, lengths)
+
+def rma_grid(
+    source: pd.Series | np.ndarray,
+    lengths: list[int],
+) -> pd.DataFrame | np.ndarray:
+    """
+    Calculate the Relative Moving Average (RMA) for many lengths in a
+    single pass over the input time series data.
+
+    Parameters:
+    -----------
+    source : pd.Series or np.ndarray
+        The time series data to calculate the RMAs for.
+    lengths : list[int]
+        The lengths to calculate the RMA for.
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        A (n_bars x n_lengths) matrix with one RMA per column, with NaN
+        where `rma` has no value.
+    """
+    return _apply_grid(_rma_grid_numba, source, lengths)
+
+def sema_grid(
+    source: pd.Series | np.ndarray,
+    lengths: list[int],
+    smooth: int,
+) -> pd.DataFrame | np.ndarray:
+    """
+    Calculate the Smoothed Exponential Moving Average (SEMA) for many
+    lengths in a single pass over the input time series data.
+
+    Parameters:
+    -----------
+    source : pd.Series or np.ndarray
+        The time series data to calculate the SEMAs for.
+    lengths : list[int]
+        The lengths to calculate the SEMA for.
+    smooth : int
+        The number of EMAs to smooth.
+
+    Returns:
+    --------
+    pd.DataFrame or np.ndarray
+        A (n_bars x n_lengths) matrix with one SEMA per column, with NaN
+        where `sema` has no value.
+    """
+    if smooth < 1:
+        raise ValueError("smooth must be a positive integer")
+    return _apply_grid(_sema_grid_numba, source, lengths, smooth)
+
+
+# Fused Moving Average Steps using Numba
+MA_METHOD_CODES = {"sma": 0, "ema": 1, "rma": 2, "dema": 3, "tema": 4}
+MA_STATE_SIZE = 5
+
+@njit
+def _ma_update(
+    method: int,
+    length: int,
+    state: np.ndarray,
+    buffer: np.ndarray,
+    value: float,
+) -> float:
+    """
+    Feed one value to a moving average kept in scratch arrays and return
+    its new value, following the same steps as the batch functions.
+
+    Parameters:
+    -----------
+    method : int
+        The moving average code, from `MA_METHOD_CODES`.
+    length : int
+        The number of periods to include in the moving average.
+    state : np.ndarray
+        A zeroed array of `MA_STATE_SIZE` values. state[0] counts the
+        values seen. For "rma", state[1] must be set to the seed (the
+        mean of the first `length` values) before the first update.
+    buffer : np.ndarray
+        A zeroed array of `length` values, used by "sma".
+    value : float
+        The new source value.
+
+    Returns:
+    --------
+    float
+        The new moving average value. NaN where the batch function
+        drops the value.
+
+    Note:
+    -----
+    Hot loops should get `method` as a compile-time constant, by
+    building them per method, and pass whole 1-D arrays rather than
+    views, so each call compiles down to the steps of one method.
+    """
+    count = int(state[0])
+    state[0] = count + 1
+
+    if method == 0:
+        total = state[1]
+        compensation = state[2]
+        nan_count = int(state[3])
+        position = count % length
+        if count >= length:
+            old_value = buffer[position]
+            if np.isnan(old_value):
+                nan_count -= 1
+            else:
+                total, compensation = neumaier_add(
+                    total, compensation, -old_value
+                )
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total, compensation = neumaier_add(total, compensation, value)
+        buffer[position] = value
+
+        if (count + 1) % length == 0:
+            total = 0.0
+            compensation = 0.0
+            nan_count = 0
+            for j in range(length):
+                if np.isnan(buffer[j]):
+                    nan_count += 1
+                else:
+                    total, compensation = neumaier_add(
+                        total, compensation, buffer[j]
+                    )
+
+        state[1] = total
+        state[2] = compensation
+        state[3] = nan_count
+        if count < length - 1 or nan_count > 0:
+            return np.nan
+        return (total + compensation) / length
+
+    if method == 1:
+        alpha = 2 / (length + 1)
+        if count == 0:
+            state[1] = value
+        else:
+            state[1] = alpha * value + (1 - alpha) * state[1]
+        return state[1]
+
+    if method == 2:
+        alpha = 1 / length
+        if count > 0:
+            state[1] = alpha * value + (1 - alpha) * state[1]
+        return state[1]
+
+    smooth = method - 1
+    alpha = 2 / (length + 1)
+    for k in range(1, smooth + 1):
+        if count == 0:
+            state[k] = value
+        else:
+            state[k] = alpha * value + (1 - alpha) * state[k]
+        value = state[k]
+
+    diff_sum = 0.0
+    for k in range(2, smooth):
+        diff_sum += state[k] - state[k - 1]
+    return diff_sum * -1 * smooth + state[smooth]
+
+@njit
+def _rma_seeds(first_values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Calculate the seeds of cascaded RMAs, like nested `rma` calls.
+
+    Parameters:
+    -----------
+    first_values : np.ndarray
+        The first `max(lengths)` input values of the first RMA.
+    lengths : np.ndarray
+        The number of periods of each cascaded RMA.
+
+    Returns:
+    --------
+    np.ndarray
+        The seed of each RMA.
+    """
+    seeds = np.empty(len(lengths))
+    stage_values = first_values.copy()
+    for stage in range(len(lengths)):
+        stage_values = _rma_numba(stage_values, lengths[stage])
+        seeds[stage] = stage_values[0]
+    return seeds
+
+
+# Streaming Moving Averages
+class EmaState:
+    """
+    Stateful Exponential Moving Average (EMA) updater.
+
+    Consumes one value at a time in O(1) and produces the same values
+    as the batch `ema` function.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the EMA calculation.
+    alpha : float
+        The smoothing factor of the EMA.
+    value : float
+        The last calculated EMA value (NaN before the first update).
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize an empty EMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the EMA calculation.
+        """
+        if length < 1:
+            raise ValueError("length must be a positive integer")
+
+        self.length = length
+        self.alpha = 2 / (length + 1)
+        self.value = np.nan
+
+    @classmethod
+    def from_source(cls, source: pd.Series, length: int) -> "EmaState":
+        """
+        Create an EMA state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int
+            The number of periods to include in the EMA calculation.
+
+        Returns:
+        --------
+        EmaState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length)
+        if len(source) < length:
+            # `ema` returns nothing yet, so the values are replayed.
+            for value in source.to_numpy(dtype=np.float64):
+                state.update(value)
+            return state
+
+        state.value = float(ema(source, length).iloc[-1])
+        return state
+
+    def update(self, value: float) -> float:
+        """
+        Consume a new value and return the updated EMA.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        float
+            The updated EMA value.
+        """
+        if np.isnan(self.value):
+            self.value = float(value)
+        else:
+            self.value = (
+                self.alpha * value + (1 - self.alpha) * self.value
+            )
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {"length": self.length, "value": self.value}
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"])
+        self.value = snapshot["value"]
+
+
+class RmaState:
+    """
+    Stateful Relative Moving Average (RMA) updater.
+
+    Consumes one value at a time in O(1) and produces the same values
+    as the batch `rma` function with the "numba" method.
+
+    The batch RMA is seeded with the mean of the first `length` values,
+    so the values are buffered until `length` of them are available and
+    the earlier updates return NaN.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the RMA calculation.
+    alpha : float
+        The smoothing factor of the RMA.
+    value : float
+        The last calculated RMA value (NaN during the warm-up).
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize an empty RMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the RMA calculation.
+        """
+        if length < 1:
+            raise ValueError("length must be a positive integer")
+
+        self.length = length
+        self.alpha = 1 / length
+        self.value = np.nan
+        self.warmup = []
+
+    @classmethod
+    def from_source(cls, source: pd.Series, length: int) -> "RmaState":
+        """
+        Create an RMA state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int
+            The number of periods to include in the RMA calculation.
+
+        Returns:
+        --------
+        RmaState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length)
+        if len(source) < length:
+            state.warmup = [float(value) for value in source]
+        else:
+            state.value = float(rma(source, length).iloc[-1])
+        return state
+
+    def update(self, value: float) -> float:
+        """
+        Consume a new value and return the updated RMA.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        float
+            The updated RMA value.
+        """
+        if not np.isnan(self.value):
+            self.value = (
+                self.alpha * value + (1 - self.alpha) * self.value
+            )
+            return self.value
+
+        self.warmup.append(float(value))
+        if len(self.warmup) == self.length:
+            warmup_values = np.array(self.warmup, dtype=np.float64)
+            self.value = float(_rma_numba(warmup_values, self.length)[-1])
+            self.warmup = []
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "value": self.value,
+            "warmup": list(self.warmup),
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"])
+        self.value = snapshot["value"]
+        self.warmup = list(snapshot["warmup"])
+
+
+class SmaState:
+    """
+    Stateful Simple Moving Average (SMA) updater.
+
+    Keeps the last `length` values in a ring buffer together with the
+    same compensated running sum as `rolling_mean_numba`, so each update
+    costs O(1) amortized and matches the batch `sma` function.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the SMA calculation.
+    value : float
+        The last calculated SMA value (NaN during the warm-up).
+    """
+    def __init__(self, length: int) -> None:
+        """
+        Initialize an empty SMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the SMA calculation.
+        """
+        if length < 1:
+            raise ValueError("length must be a positive integer")
+
+        self.length = length
+        self.value = np.nan
+        self.buffer = np.zeros(length, dtype=np.float64)
+        self.n_values = 0
+        self.total = 0.0
+        self.compensation = 0.0
+        self.nan_count = 0
+
+    @classmethod
+    def from_source(cls, source: pd.Series, length: int) -> "SmaState":
+        """
+        Create an SMA state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int
+            The number of periods to include in the SMA calculation.
+
+        Returns:
+        --------
+        SmaState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length)
+        # Replay from the start of the last recalculated window so the
+        # running sum follows the same steps as the batch calculation.
+        start = max(len(source) // length - 1, 0) * length
+        state.n_values = start
+        for value in source.to_numpy()[start:]:
+            state.update(value)
+        return state
+
+    def _add(self, value: float) -> None:
+        if np.isnan(value):
+            self.nan_count += 1
+        else:
+            self.total, self.compensation = neumaier_add(
+                self.total, self.compensation, value
+            )
+
+    def _remove(self, value: float) -> None:
+        if np.isnan(value):
+            self.nan_count -= 1
+        else:
+            self.total, self.compensation = neumaier_add(
+                self.total, self.compensation, -value
+            )
+
+    def update(self, value: float) -> float:
+        """
+        Consume a new value and return the updated SMA.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        float
+            The updated SMA value.
+        """
+        value = float(value)
+        position = self.n_values % self.length
+        if self.n_values >= self.length:
+            self._remove(self.buffer[position])
+
+        self._add(value)
+        self.buffer[position] = value
+        self.n_values += 1
+
+        if self.n_values % self.length == 0:
+            self.total = 0.0
+            self.compensation = 0.0
+            self.nan_count = 0
+            for buffer_value in self.buffer:
+                self._add(buffer_value)
+
+        if self.n_values >= self.length:
+            self.value = (
+                np.nan if self.nan_count
+                else (self.total + self.compensation) / self.length
+            )
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "value": self.value,
+            "buffer": self.buffer.copy(),
+            "n_values": self.n_values,
+            "total": self.total,
+            "compensation": self.compensation,
+            "nan_count": self.nan_count,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"])
+        self.value = snapshot["value"]
+        self.buffer = snapshot["buffer"].copy()
+        self.n_values = snapshot["n_values"]
+        self.total = snapshot["total"]
+        self.compensation = snapshot["compensation"]
+        self.nan_count = snapshot["nan_count"]
+
+
+class SemaState:
+    """
+    Stateful Smoothed Exponential Moving Average (SEMA) updater.
+
+    Chains `smooth` EMA states and applies the same combination as the
+    batch `sema` function.
+
+    Attributes:
+    -----------
+    length : int
+        The number of periods to include in the SEMA calculation.
+    smooth : int
+        The number of EMAs to smooth.
+    emas : list[EmaState]
+        The chained EMA states.
+    value : float
+        The last calculated SEMA value (NaN before the first update).
+    """
+    def __init__(self, length: int, smooth: int) -> None:
+        """
+        Initialize an empty SEMA state.
+
+        Parameters:
+        -----------
+        length : int
+            The number of periods to include in the SEMA calculation.
+        smooth : int
+            The number of EMAs to smooth.
+        """
+        if smooth < 1:
+            raise ValueError("smooth must be a positive integer")
+
+        self.length = length
+        self.smooth = smooth
+        self.emas = [EmaState(length) for _ in range(smooth)]
+        self.value = np.nan
+
+    @classmethod
+    def from_source(
+        cls,
+        source: pd.Series,
+        length: int,
+        smooth: int,
+    ) -> "SemaState":
+        """
+        Create a SEMA state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int
+            The number of periods to include in the SEMA calculation.
+        smooth : int
+            The number of EMAs to smooth.
+
+        Returns:
+        --------
+        SemaState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length, smooth)
+        if len(source) < length:
+            # `ema` returns nothing yet, so the values are replayed.
+            for value in source.to_numpy(dtype=np.float64):
+                state.update(value)
+            return state
+
+        ema_values = source
+        for ema_state in state.emas:
+            ema_values = ema(ema_values, length)
+            if len(ema_values):
+                ema_state.value = float(ema_values.iloc[-1])
+
+        state.value = state._combine()
+        return state
+
+    def _combine(self) -> float:
+        diff_sum = 0.0
+        for idx in range(1, self.smooth - 1):
+            diff_sum += self.emas[idx].value - self.emas[idx - 1].value
+        return diff_sum * -1 * self.smooth + self.emas[-1].value
+
+    def update(self, value: float) -> float:
+        """
+        Consume a new value and return the updated SEMA.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        float
+            The updated SEMA value.
+        """
+        for ema_state in self.emas:
+            value = ema_state.update(value)
+        self.value = self._combine()
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "smooth": self.smooth,
+            "value": self.value,
+            "emas": [ema_state.snapshot() for ema_state in self.emas],
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"], snapshot["smooth"])
+        self.value = snapshot["value"]
+        for ema_state, ema_snapshot in zip(self.emas, snapshot["emas"]):
+            ema_state.restore(ema_snapshot)
@@ -1,22 +1,320 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Literal
+import numpy as np
 import pandas as pd
+from numba import njit, prange
 
-def percentrank(source: pd.Series, length: int) -> pd.Series:
+PERCENT_RANK_METHODS = ("average", "tradingview")
+
+@njit
+def _fenwick_add(tree: np.ndarray, position: int, delta: int) -> None:
+    """
+    Add `delta` to the count of a value rank in a Fenwick tree.
+    """
+    position += 1
+    while position < len(tree):
+        tree[position] += delta
+        position += position & -position
+
+@njit
+def _fenwick_count(tree: np.ndarray, position: int) -> int:
+    """
+    Return the number of values of a Fenwick tree with a rank lower
+    than `position`.
+    """
+    total = 0
+    while position > 0:
+        total += tree[position]
+        position -= position & -position
+    return total
+
+@njit
+def percent_rank_numba(
+    source: np.ndarray,
+    length: int,
+    tradingview: bool = False,
+) -> np.ndarray:
+    """
+    Calculate the rolling percent rank of the input array using Numba.
+
+    The values are replaced by their rank among the distinct values of
+    the array, and a Fenwick tree counts the ranks of the values in the
+    window, so each value costs O(log n).
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The period over which to calculate the percent rank.
+    tradingview : bool, optional
+        Whether to compare the value with the previous `length` values,
+        like TradingView, instead of the window of the last `length`
+        values with the average rank of ties.
+        (default: False)
+
+    Returns:
+    --------
+    np.ndarray
+        The percent rank values, with NaN until the window is full and
+        for windows containing a NaN value.
+    """
+    n_rows = len(source)
+    percent_ranks = np.full(n_rows, np.nan)
+
+    is_valid = ~np.isnan(source)
+    distinct_values = np.unique(source[is_valid])
+    ranks = np.searchsorted(distinct_values, source)
+    tree = np.zeros(len(distinct_values) + 1, dtype=np.int64)
+
+    window = length + 1 if tradingview else length
+    last_nan = -1
+    for i in range(n_rows):
+        if is_valid[i]:
+            _fenwick_add(tree, ranks[i], 1)
+        else:
+            last_nan = i
+
+        if i >= window and is_valid[i - window]:
+            _fenwick_add(tree, ranks[i - window], -1)
+
+        if i - window + 1 < 0 or last_nan > i - window:
+            continue
+
+        less = _fenwick_count(tree, ranks[i])
+        equal = _fenwick_count(tree, ranks[i] + 1) - less
+        if tradingview:
+            # The current value is in the tree and isn't counted.
+            percent_ranks[i] = (less + equal - 1) / length * 100
+        else:
+            percent_ranks[i] = (less + (equal + 1) / 2) / length * 100
+    return percent_ranks
+
+@njit(parallel=True)
+def _percent_rank_2d_numba(
+    source: np.ndarray,
+    length: int,
+    tradingview: bool,
+) -> np.ndarray:
+    """
+    Calculate the rolling percent rank of every column of a 2-D array,
+    with the columns in parallel.
+    """
+    n_rows, n_cols = source.shape
+    percent_ranks = np.empty((n_rows, n_cols))
+    for col in prange(n_cols):
+        percent_ranks[:, col] = percent_rank_numba(
+            source[:, col], length, tradingview
+        )
+    return percent_ranks
+
+def percentrank(
+    source: pd.Series | pd.DataFrame,
+    length: int,
+    method: Literal["average", "tradingview"] = "average",
+) -> pd.Series | pd.DataFrame:
     """
     Calculate the percent rank.
 
     Parameters:
     ----------
-    source : pd.Series
-        The input data.
+    source : pd.Series or pd.DataFrame
+        The input data. A DataFrame is treated as one time series per
+        column.
     length : int
         The period over which to calculate the percent rank.
+    method : {"average", "tradingview"}, optional
+        "average" ranks the current value in the window of the last
+        `length` values, giving ties their average rank like pandas
+        `rank(pct=True)`. "tradingview" is the percentage of the
+        previous `length` values that are less than or equal to the
+        current value, like TradingView's `ta.percentrank`.
+        (default: "average")
 
     Returns:
     -------
-    pd.Series
+    pd.Series or pd.DataFrame
         The percent rank values.
     """
-    def rank(x):
-        return pd.Series(x).rank(pct=True).iloc[-1] * 100
-    
-    return source.rolling(window=length).apply(rank, raw=False).rename("PercentRank")
+    if length < 1:
+        raise ValueError("length must be a positive integer")
+    if method not in PERCENT_RANK_METHODS:
+        raise ValueError("method must be 'average' or 'tradingview'")
+    tradingview = method == "tradingview"
+
+    if isinstance(source, pd.DataFrame):
+        values = np.asfortranarray(source.to_numpy(dtype=np.float64))
+        return pd.DataFrame(
+            _percent_rank_2d_numba(values, length, tradingview),
+            index=source.index,
+            columns=source.columns,
+        )
+
+    percent_ranks = percent_rank_numba(
+        source.to_numpy(dtype=np.float64), length, tradingview
+    )
+    return pd.Series(percent_ranks, index=source.index, name="PercentRank")
+
+
+class PercentRankState:
+    """
+    Stateful percent rank updater.
+
+    Keeps the window in a ring buffer and its valid values in a sorted
+    list, so each update finds the rank with a binary search and
+    matches the batch `percentrank` function.
+
+    Attributes:
+    -----------
+    length : int
+        The period over which to calculate the percent rank.
+    method : str
+        The percent rank method, "average" or "tradingview".
+    n_values : int
+        The number of values consumed, counting only the last window of
+        the seeding batch.
+    value : float
+        The last calculated percent rank (NaN during the warm-up and
+        for windows containing a NaN value).
+    """
+    def __init__(
+        self,
+        length: int,
+        method: Literal["average", "tradingview"] = "average",
+    ) -> None:
+        """
+        Initialize an empty percent rank state.
+
+        Parameters:
+        -----------
+        length : int
+            The period over which to calculate the percent rank.
+        method : {"average", "tradingview"}, optional
+            The percent rank method, as in `percentrank`.
+            (default: "average")
+        """
+        if length < 1:
+            raise ValueError("length must be a positive integer")
+        if method not in PERCENT_RANK_METHODS:
+            raise ValueError("method must be 'average' or 'tradingview'")
+
+        self.length = length
+        self.method = method
+        self.window = np.full(
+            length + 1 if method == "tradingview" else length, np.nan
+        )
+        self.sorted_values = []
+        self.nan_count = 0
+        self.n_values = 0
+        self.value = np.nan
+
+    @classmethod
+    def from_source(
+        cls,
+        source: pd.Series,
+        length: int,
+        method: Literal["average", "tradingview"] = "average",
+    ) -> "PercentRankState":
+        """
+        Create a percent rank state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        length : int
+            The period over which to calculate the percent rank.
+        method : {"average", "tradingview"}, optional
+            The percent rank method, as in `percentrank`.
+            (default: "average")
+
+        Returns:
+        --------
+        PercentRankState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(length, method)
+        # Only the values of the last window are still needed.
+        start = max(len(source) - len(state.window), 0)
+        for value in source.to_numpy(dtype=np.float64)[start:]:
+            state.update(value)
+        return state
+
+    def update(self, value: float) -> float:
+        """
+        Consume a new value and return the updated percent rank.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        float
+            The updated percent rank.
+        """
+        value = float(value)
+        position = self.n_values % len(self.window)
+        if self.n_values >= len(self.window):
+            old_value = self.window[position]
+            if np.isnan(old_value):
+                self.nan_count -= 1
+            else:
+                del self.sorted_values[
+                    bisect_left(self.sorted_values, old_value)
+                ]
+
+        self.window[position] = value
+        self.n_values += 1
+        if np.isnan(value):
+            self.nan_count += 1
+        else:
+            insort(self.sorted_values, value)
+
+        if self.n_values < len(self.window) or self.nan_count:
+            self.value = np.nan
+            return self.value
+
+        less = bisect_left(self.sorted_values, value)
+        equal = bisect_right(self.sorted_values, value) - less
+        if self.method == "tradingview":
+            self.value = (less + equal - 1) / self.length * 100
+        else:
+            self.value = (less + (equal + 1) / 2) / self.length * 100
+        return self.value
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "length": self.length,
+            "method": self.method,
+            "window": self.window.copy(),
+            "sorted_values": list(self.sorted_values),
+            "nan_count": self.nan_count,
+            "n_values": self.n_values,
+            "value": self.value,
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["length"], snapshot["method"])
+        self.window = snapshot["window"].copy()
+        self.sorted_values = list(snapshot["sorted_values"])
+        self.nan_count = snapshot["nan_count"]
+        self.n_values = snapshot["n_values"]
+        self.value = snapshot["value"]
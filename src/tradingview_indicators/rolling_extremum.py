@@ -0,0 +1,344 @@
+from collections import deque
+from typing import Sequence
+import numpy as np
+import pandas as pd
+from numba import njit, prange
+
+@njit
+def rolling_max_numba(source: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Calculate the rolling maximum of the input array for several window
+    lengths in a single pass using Numba.
+
+    A monotonic deque keeps the positions of the values that are
+    greater than every later value, so the maximum of any window is its
+    first position in the deque. Each length keeps its own pointer into
+    the deque, which makes every value O(1) amortized per length.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    lengths : np.ndarray
+        The number of periods of each window.
+
+    Returns:
+    --------
+    np.ndarray
+        The rolling maximum values, with one column per length. The
+        first `length - 1` values and the windows containing a NaN
+        value are NaN, like pandas rolling max.
+    """
+    n_rows = len(source)
+    n_lengths = len(lengths)
+    max_values = np.full((n_rows, n_lengths), np.nan)
+    if n_rows == 0 or n_lengths == 0:
+        return max_values
+
+    max_length = lengths.max()
+    candidates = np.empty(n_rows, dtype=np.int64)
+    pointers = np.zeros(n_lengths, dtype=np.int64)
+    head = 0
+    tail = 0
+    last_nan = -1
+    for i in range(n_rows):
+        value = source[i]
+        # Every window holding a NaN value is NaN, so the values before
+        # it are never needed again.
+        if np.isnan(value):
+            last_nan = i
+            head = tail
+            continue
+
+        while tail > head and source[candidates[tail - 1]] <= value:
+            tail -= 1
+        candidates[tail] = i
+        tail += 1
+        if candidates[head] <= i - max_length:
+            head += 1
+
+        for j in range(n_lengths):
+            start = i - lengths[j] + 1
+            if start < 0 or last_nan >= start:
+                continue
+
+            position = min(max(pointers[j], head), tail - 1)
+            while candidates[position] < start:
+                position += 1
+            pointers[j] = position
+            max_values[i, j] = source[candidates[position]]
+    return max_values
+
+@njit(parallel=True)
+def _rolling_max_2d_numba(
+    source: np.ndarray,
+    lengths: np.ndarray,
+) -> np.ndarray:
+    """
+    Calculate the rolling maximum of every column of a 2-D array for
+    several window lengths, with the columns in parallel.
+    """
+    n_rows, n_cols = source.shape
+    max_values = np.empty((n_rows, n_cols, len(lengths)))
+    for col in prange(n_cols):
+        max_values[:, col, :] = rolling_max_numba(source[:, col], lengths)
+    return max_values
+
+def _rolling_extremum(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int | Sequence[int],
+    sign: int,
+) -> pd.Series | pd.DataFrame | np.ndarray | dict:
+    """
+    Calculate the rolling maximum of `sign * source` times `sign`,
+    which is the rolling minimum for a `sign` of -1, and wrap the
+    result like the input.
+    """
+    is_grid = not isinstance(length, (int, np.integer))
+    lengths = np.atleast_1d(np.asarray(length, dtype=np.int64))
+    if lengths.ndim != 1 or len(lengths) == 0 or np.any(lengths < 1):
+        raise ValueError("length must be a positive integer or a sequence")
+
+    values = sign * np.asarray(source, dtype=np.float64)
+    if values.ndim == 2:
+        result = sign * _rolling_max_2d_numba(
+            np.asfortranarray(values), lengths
+        )
+        if isinstance(source, pd.DataFrame):
+            blocks = [
+                pd.DataFrame(
+                    result[:, :, j],
+                    index=source.index,
+                    columns=source.columns,
+                )
+                for j in range(len(lengths))
+            ]
+        else:
+            blocks = [result[:, :, j] for j in range(len(lengths))]
+
+        if is_grid:
+            return dict(zip(lengths.tolist(), blocks))
+        return blocks[0]
+
+    result = sign * rolling_max_numba(values, lengths)
+    if isinstance(source, pd.Series):
+        if is_grid:
+            return pd.DataFrame(
+                result, index=source.index, columns=lengths.tolist()
+            )
+        return pd.Series(result[:, 0], index=source.index, name=source.name)
+
+    return result if is_grid else result[:, 0]
+
+def highest(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int | Sequence[int],
+) -> pd.Series | pd.DataFrame | np.ndarray | dict:
+    """
+    Calculate the highest value of the input time series data over the
+    last `length` periods, like TradingView's `ta.highest`.
+
+    Parameters:
+    -----------
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The input time series data. A DataFrame or a 2-D array is
+        treated as one time series per column.
+    length : int or Sequence[int]
+        The number of periods of the window, or several window lengths
+        to calculate in a single pass.
+
+    Returns:
+    --------
+    pd.Series, pd.DataFrame, np.ndarray or dict
+        The highest values, with NaN for the first `length - 1` values
+        and for windows containing a NaN value. Several lengths add one
+        column per length to 1-D inputs, and return a dict with the
+        result of each length for 2-D inputs.
+
+    Raises:
+    -------
+    ValueError
+        If a length is not a positive integer.
+    """
+    return _rolling_extremum(source, length, 1)
+
+def lowest(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int | Sequence[int],
+) -> pd.Series | pd.DataFrame | np.ndarray | dict:
+    """
+    Calculate the lowest value of the input time series data over the
+    last `length` periods, like TradingView's `ta.lowest`.
+
+    Parameters:
+    -----------
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The input time series data. A DataFrame or a 2-D array is
+        treated as one time series per column.
+    length : int or Sequence[int]
+        The number of periods of the window, or several window lengths
+        to calculate in a single pass.
+
+    Returns:
+    --------
+    pd.Series, pd.DataFrame, np.ndarray or dict
+        The lowest values, with NaN for the first `length - 1` values
+        and for windows containing a NaN value. Several lengths add one
+        column per length to 1-D inputs, and return a dict with the
+        result of each length for 2-D inputs.
+
+    Raises:
+    -------
+    ValueError
+        If a length is not a positive integer.
+    """
+    return _rolling_extremum(source, length, -1)
+
+
+class RollingExtremumState:
+    """
+    Stateful rolling highest or lowest updater.
+
+    Keeps one monotonic deque per window length, so each update costs
+    O(1) amortized per length and matches `highest` and `lowest`.
+
+    Attributes:
+    -----------
+    lengths : list[int]
+        The number of periods of each window.
+    sign : int
+        1 for the highest values, -1 for the lowest values.
+    n_values : int
+        The number of values consumed.
+    values : np.ndarray
+        The last calculated value of each window (NaN during the
+        warm-up and for windows containing a NaN value).
+    """
+    def __init__(self, lengths: Sequence[int], sign: int = 1) -> None:
+        """
+        Initialize an empty rolling extremum state.
+
+        Parameters:
+        -----------
+        lengths : Sequence[int]
+            The number of periods of each window.
+        sign : int, optional
+            1 for the highest values, -1 for the lowest values.
+            (default: 1)
+        """
+        if len(lengths) == 0 or any(length < 1 for length in lengths):
+            raise ValueError("lengths must be a sequence of positive integers")
+        if sign not in (1, -1):
+            raise ValueError("sign must be 1 or -1")
+
+        self.lengths = [int(length) for length in lengths]
+        self.sign = sign
+        self.n_values = 0
+        self.last_nan = -1
+        self.deques = [deque() for _ in self.lengths]
+        self.values = np.full(len(self.lengths), np.nan)
+
+    @classmethod
+    def from_source(
+        cls,
+        source: pd.Series,
+        lengths: Sequence[int],
+        sign: int = 1,
+    ) -> "RollingExtremumState":
+        """
+        Create a rolling extremum state seeded from a historical batch.
+
+        Parameters:
+        -----------
+        source : pd.Series
+            The historical time series data.
+        lengths : Sequence[int]
+            The number of periods of each window.
+        sign : int, optional
+            1 for the highest values, -1 for the lowest values.
+            (default: 1)
+
+        Returns:
+        --------
+        RollingExtremumState
+            The state positioned after the last value of `source`.
+        """
+        state = cls(lengths, sign)
+        # Only the values of the longest window can still be needed.
+        start = max(len(source) - max(state.lengths), 0)
+        state.n_values = start
+        for value in source.to_numpy(dtype=np.float64)[start:]:
+            state.update(value)
+        return state
+
+    def update(self, value: float) -> np.ndarray:
+        """
+        Consume a new value and return the updated extremum of each
+        window.
+
+        Parameters:
+        -----------
+        value : float
+            The new source value.
+
+        Returns:
+        --------
+        np.ndarray
+            The updated value of each window.
+        """
+        position = self.n_values
+        self.n_values += 1
+        if np.isnan(value):
+            self.last_nan = position
+            for window in self.deques:
+                window.clear()
+            self.values[:] = np.nan
+            return self.values
+
+        signed_value = self.sign * float(value)
+        for j, (length, window) in enumerate(zip(self.lengths, self.deques)):
+            while window and window[-1][1] <= signed_value:
+                window.pop()
+            window.append((position, signed_value))
+            if window[0][0] <= position - length:
+                window.popleft()
+
+            start = position - length + 1
+            if start < 0 or self.last_nan >= start:
+                self.values[j] = np.nan
+            else:
+                self.values[j] = self.sign * window[0][1]
+        return self.values
+
+    def snapshot(self) -> dict:
+        """
+        Return a copy of the current state.
+
+        Returns:
+        --------
+        dict
+            The state values needed to restore the updater.
+        """
+        return {
+            "lengths": list(self.lengths),
+            "sign": self.sign,
+            "n_values": self.n_values,
+            "last_nan": self.last_nan,
+            "deques": [list(window) for window in self.deques],
+            "values": self.values.copy(),
+        }
+
+    def restore(self, snapshot: dict) -> None:
+        """
+        Restore the state from a previous `snapshot`.
+
+        Parameters:
+        -----------
+        snapshot : dict
+            The value returned by `snapshot`.
+        """
+        self.__init__(snapshot["lengths"], snapshot["sign"])
+        self.n_values = snapshot["n_values"]
+        self.last_nan = snapshot["last_nan"]
+        self.deques = [deque(window) for window in snapshot["deques"]]
+        self.values = snapshot["values"].copy()
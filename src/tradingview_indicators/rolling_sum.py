@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+from numba import njit
+
+@njit
+def neumaier_add(
+    total: float,
+    compensation: float,
+    value: float,
+) -> tuple[float, float]:
+    """
+    Add a value to a compensated (Neumaier) sum.
+
+    Parameters:
+    -----------
+    total : float
+        The current running sum.
+    compensation : float
+        The accumulated rounding error of the running sum.
+    value : float
+        The value to add.
+
+    Returns:
+    --------
+    tuple[float, float]
+        The updated running sum and compensation.
+    """
+    new_total = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - new_total) + value
+    else:
+        compensation += (value - new_total) + total
+    return new_total, compensation
+
+@njit
+def _rolling_sum_count_numba(
+    source: np.ndarray,
+    length: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the rolling sum of the non-NaN values and the rolling
+    count of NaN values of the input array.
+
+    The sum is updated in O(1) per value with compensated summation
+    and is recalculated from scratch every `length` values, so the
+    rounding error can't build up over long series.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The number of periods to include in the window.
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray]
+        The rolling sums and the rolling NaN counts. Both are only
+        meaningful from index `length - 1` onwards.
+    """
+    n_rows = len(source)
+    sums = np.full(n_rows, np.nan)
+    nan_counts = np.zeros(n_rows, dtype=np.int64)
+
+    total = 0.0
+    compensation = 0.0
+    nan_count = 0
+    for i in range(n_rows):
+        value = source[i]
+        if i >= length:
+            old_value = source[i - length]
+            if np.isnan(old_value):
+                nan_count -= 1
+            else:
+                total, compensation = neumaier_add(
+                    total, compensation, -old_value
+                )
+
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            total, compensation = neumaier_add(total, compensation, value)
+
+        if (i + 1) % length == 0:
+            total = 0.0
+            compensation = 0.0
+            nan_count = 0
+            for j in range(i - length + 1, i + 1):
+                if np.isnan(source[j]):
+                    nan_count += 1
+                else:
+                    total, compensation = neumaier_add(
+                        total, compensation, source[j]
+                    )
+
+        if i >= length - 1:
+            sums[i] = total + compensation
+            nan_counts[i] = nan_count
+    return sums, nan_counts
+
+@njit
+def rolling_sum_numba(
+    source: np.ndarray,
+    length: int,
+    skipna: bool = False,
+) -> np.ndarray:
+    """
+    Calculate the rolling sum of the input array using Numba.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The number of periods to include in the window.
+    skipna : bool, optional
+        Whether to ignore NaN values inside the window. If False, any
+        window containing a NaN value returns NaN.
+        (default: False)
+
+    Returns:
+    --------
+    np.ndarray
+        The rolling sum values, with NaN for the first `length - 1`
+        values and for windows without any valid value.
+    """
+    sums, nan_counts = _rolling_sum_count_numba(source, length)
+    for i in range(length - 1, len(source)):
+        if nan_counts[i] == length or not skipna and nan_counts[i] > 0:
+            sums[i] = np.nan
+    return sums
+
+@njit
+def rolling_mean_numba(
+    source: np.ndarray,
+    length: int,
+    skipna: bool = False,
+) -> np.ndarray:
+    """
+    Calculate the rolling mean of the input array using Numba.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The number of periods to include in the window.
+    skipna : bool, optional
+        Whether to ignore NaN values inside the window, averaging only
+        the valid values. If False, any window containing a NaN value
+        returns NaN.
+        (default: False)
+
+    Returns:
+    --------
+    np.ndarray
+        The rolling mean values, with NaN for the first `length - 1`
+        values and for windows without any valid value.
+    """
+    sums, nan_counts = _rolling_sum_count_numba(source, length)
+    for i in range(length - 1, len(source)):
+        if nan_counts[i] == length or not skipna and nan_counts[i] > 0:
+            sums[i] = np.nan
+        else:
+            sums[i] = sums[i] / (length - nan_counts[i])
+    return sums
+
+def rolling_sum(
+    source: pd.Series,
+    length: int,
+    skipna: bool = False,
+) -> pd.Series:
+    """
+    Calculate the rolling sum of the input time series data using
+    compensated summation.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The input time series data.
+    length : int
+        The number of periods to include in the window.
+    skipna : bool, optional
+        Whether to ignore NaN values inside the window. If False, any
+        window containing a NaN value returns NaN.
+        (default: False)
+
+    Returns:
+    --------
+    pd.Series
+        The rolling sum values.
+    """
+    if length < 1:
+        raise ValueError("length must be a positive integer")
+
+    sums = rolling_sum_numba(
+        source.to_numpy(dtype=np.float64), length, skipna
+    )
+    return pd.Series(sums, index=source.index, name=source.name)
+
+def rolling_mean(
+    source: pd.Series,
+    length: int,
+    skipna: bool = False,
+) -> pd.Series:
+    """
+    Calculate the rolling mean of the input time series data using
+    compensated summation.
+
+    Parameters:
+    -----------
+    source : pd.Series
+        The input time series data.
+    length : int
+        The number of periods to include in the window.
+    skipna : bool, optional
+        Whether to ignore NaN values inside the window, averaging only
+        the valid values. If False, any window containing a NaN value
+        returns NaN.
+        (default: False)
+
+    Returns:
+    --------
+    pd.Series
+        The rolling mean values.
+    """
+    if length < 1:
+        raise ValueError("length must be a positive integer")
+
+    means = rolling_mean_numba(
+        source.to_numpy(dtype=np.float64), length, skipna
+    )
+    return pd.Series(means, index=source.index, name=source.name)
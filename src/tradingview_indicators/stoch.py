@@ -1,4 +1,5 @@
 import pandas as pd
+from .rolling_extremum import highest, lowest
 
 def stoch(source, high, low, length) -> pd.Series:
     """
@@ -15,8 +16,8 @@ def stoch(source, high, low, length) -> pd.Series:
     pd.Series
         The Fast Stochastic Oscillator values.
     """
-    lowest_low = low.rolling(length).min()
-    hightest_high = high.rolling(length).max()
+    lowest_low = lowest(low, length)
+    hightest_high = highest(high, length)
     stochastic = (
         100
         * (source - lowest_low)
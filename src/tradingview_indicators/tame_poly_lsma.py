@@ -1,16 +1,19 @@
+from functools import lru_cache
+from typing import Literal
+
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 @njit(cache=True, nogil=True)
 def precompute_s(order):
     """
     Precompute the sigma approximation values for the given order.
-    
+
     Parameters:
     -----------
     order : int
         The order for precomputing sigma values.
-    
+
     Returns:
     --------
     np.ndarray
@@ -27,7 +30,7 @@ def precompute_s(order):
 def kernel(x, order, s_values):
     """
     Compute the kernel polynomial for given x and order.
-    
+
     Parameters:
     -----------
     x : float
@@ -36,7 +39,7 @@ def kernel(x, order, s_values):
         The order for kernel computation.
     s_values : np.ndarray
         Precomputed sigma values.
-    
+
     Returns:
     --------
     float
@@ -50,41 +53,143 @@ def kernel(x, order, s_values):
     return pol
 
 @njit(cache=True, nogil=True)
-def tame_poly_lsma(src, length, order):
+def _weights_numba(length, order):
+    """
+    Compute the LSMA weight of each position of the window.
+    """
+    s_values = precompute_s(order)
+    weights = np.empty(length)
+    for j in range(length):
+        weights[j] = (
+            kernel((j + 1) / length, order, s_values)
+            - kernel(j / length, order, s_values)
+        )
+    return weights
+
+@lru_cache(maxsize=128)
+def tame_poly_weights(length, order):
+    """
+    Get the Tame Polynomial LSMA weights for the given length and
+    order. The weights are computed once per (length, order) pair.
+
+    Parameters:
+    -----------
+    length : int
+        The period length for the LSMA calculation.
+    order : int
+        The order for the polynomial estimation.
+
+    Returns:
+    --------
+    np.ndarray
+        The read-only weight of each position of the window, oldest
+        first.
+    """
+    weights = _weights_numba(length, order)
+    weights.flags.writeable = False
+    return weights
+
+@njit(cache=True, nogil=True)
+def _sliding_dot_numba(src, weights):
+    """
+    Calculate the dot product of the weights with every window of the
+    source, excluding the current value.
+    """
+    length = len(weights)
+    result = np.full(len(src), np.nan)
+    for i in range(length, len(src)):
+        sum_w = 0.0
+        for j in range(length):
+            sum_w += weights[j] * src[i - length + j]
+        result[i] = sum_w
+    return result
+
+@njit(cache=True, nogil=True, parallel=True)
+def _sliding_dot_2d_numba(src, weights):
+    """
+    Calculate the sliding dot product of every column of a 2-D array.
+    """
+    result = np.empty(src.shape)
+    for col in prange(src.shape[1]):
+        result[:, col] = _sliding_dot_numba(src[:, col], weights)
+    return result
+
+def _sliding_dot_fft(src, weights):
+    """
+    Calculate the sliding dot product along the first axis with
+    overlap-add FFT convolution.
+    """
+    length = len(weights)
+    n_rows = src.shape[0]
+    block_size = max(4 * length, 1024)
+    fft_size = 1 << int(np.ceil(np.log2(block_size + length - 1)))
+    weights_fft = np.fft.rfft(weights[::-1], fft_size)
+    if src.ndim == 2:
+        weights_fft = weights_fft[:, np.newaxis]
+
+    convolution = np.zeros((n_rows + fft_size,) + src.shape[1:])
+    for start in range(0, n_rows, block_size):
+        block = src[start : start + block_size]
+        block_fft = np.fft.rfft(block, fft_size, axis=0)
+        convolution[start : start + fft_size] += np.fft.irfft(
+            block_fft * weights_fft, fft_size, axis=0
+        )
+
+    result = np.full(src.shape, np.nan)
+    result[length:] = convolution[length - 1 : n_rows - 1]
+    return result
+
+def tame_poly_lsma(
+    src,
+    length,
+    order,
+    method: Literal["auto", "direct", "fft"] = "auto",
+):
     """
     Calculate the Tame Polynomial Least Squares Moving Average (LSMA).
-    
+
+    The weights depend only on `length` and `order`, so they are cached
+    and the LSMA is calculated as a sliding dot product.
+
     Parameters:
     -----------
     src : np.ndarray
-        Source array of values.
+        Source array of values. A 2-D array is treated as one series
+        per column.
     length : int
         The period length for the LSMA calculation.
     order : int
         The order for the polynomial estimation.
-    
+    method : Literal["auto", "direct", "fft"], optional
+        The method for the sliding dot product. "direct" loops over
+        every window, "fft" uses overlap-add FFT convolution, which is
+        faster for large lengths, and "auto" uses "fft" when `length`
+        is at least 256 and the source has no NaN values.
+        (default: "auto")
+
     Returns:
     --------
     np.ndarray
         The calculated LSMA values.
     """
+    src = np.asarray(src, dtype=np.float64)
     if length > len(src):
         raise ValueError("Length cannot be greater than length of source")
     if length < 1 or order < 1:
         raise ValueError("Length and order must be positive integers")
-    
-    s_values = precompute_s(order)
-    result = np.zeros(len(src))
-    
-    for i in range(len(src)):
-        if i < length:
-            result[i] = np.nan  # Not enough data to compute the value
-        else:
-            sum_w = 0.0
-            for j in range(length):
-                sum_w += (kernel((j + 1) / length, order, s_values) - kernel(j / length, order, s_values)) * src[i - length + j]
-            result[i] = sum_w
-    
-    return result
 
-# Example usage with inputs
\ No newline at end of file
+    weights = tame_poly_weights(length, order)
+
+    if method == "auto":
+        use_fft = length >= 256 and not np.isnan(src).any()
+        method = "fft" if use_fft else "direct"
+
+    match method:
+        case "direct":
+            if src.ndim == 2:
+                return _sliding_dot_2d_numba(np.asfortranarray(src), weights)
+            return _sliding_dot_numba(src, weights)
+        case "fft":
+            return _sliding_dot_fft(src, weights)
+        case _:
+            raise ValueError("method must be 'auto', 'direct' or 'fft'")
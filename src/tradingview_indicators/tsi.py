@@ -1,11 +1,206 @@
+from functools import lru_cache
 from typing import Literal
+import numpy as np
 import pandas as pd
+from numba import njit
 
-from .moving_average import sma, ema, sema, rma
+from .moving_average import (
+    MA_METHOD_CODES,
+    MA_STATE_SIZE,
+    _ma_update,
+    _rma_seeds,
+)
 
 from .errors_exceptions import InvalidArgumentError
 
 
+@njit
+def _is_empty(
+    method: int,
+    lengths: np.ndarray,
+    n_values: int,
+    counts: np.ndarray,
+) -> bool:
+    """
+    Check if nested moving average calls return nothing: each one
+    returns nothing when it gets fewer than its length of values, and
+    so does `sema` when it returns fewer than its length of values.
+    """
+    inputs = (n_values, counts[0])
+    for stage in range(len(lengths)):
+        if inputs[stage] < lengths[stage]:
+            return True
+        if method >= 3 and counts[stage] < lengths[stage]:
+            return True
+    return False
+
+@lru_cache(maxsize=None)
+def _tsi_kernel(method: int, signal_method: int):
+    """
+    Build the TSI loop for the given moving average codes. The codes
+    are compile-time constants of the loop, so each moving average step
+    is compiled for its method only.
+    """
+    @njit(error_model="numpy")
+    def tsi_loop(source, short_length, long_length, signal_length):
+        n_rows = len(source)
+        tsi_values = np.full(n_rows, np.nan)
+        signal_values = np.full(n_rows, np.nan)
+        signed_output = np.zeros(n_rows, dtype=np.bool_)
+        absolute_output = np.zeros(n_rows, dtype=np.bool_)
+
+        # One array per moving average, as views would be created on
+        # every iteration.
+        signed_short = np.zeros(MA_STATE_SIZE)
+        signed_long = np.zeros(MA_STATE_SIZE)
+        absolute_short = np.zeros(MA_STATE_SIZE)
+        absolute_long = np.zeros(MA_STATE_SIZE)
+        signed_short_buffer = np.zeros(short_length)
+        signed_long_buffer = np.zeros(long_length)
+        absolute_short_buffer = np.zeros(short_length)
+        absolute_long_buffer = np.zeros(long_length)
+        signed_counts = np.zeros(2, dtype=np.int64)
+        absolute_counts = np.zeros(2, dtype=np.int64)
+
+        lengths = np.array([short_length, long_length])
+        if method == 2 and n_rows > 1:  # MA_METHOD_CODES["rma"]
+            changes = np.diff(source[: lengths.max() + 1])
+            seeds = _rma_seeds(changes, lengths)
+            signed_short[1], signed_long[1] = seeds[0], seeds[1]
+            seeds = _rma_seeds(np.abs(changes), lengths)
+            absolute_short[1], absolute_long[1] = seeds[0], seeds[1]
+
+        signal_state = np.zeros(MA_STATE_SIZE)
+        signal_buffer = np.zeros(max(signal_length, 1))
+        pending_rows = np.empty(signal_length, dtype=np.int64)
+        n_tsi = 0
+        n_signal = 0
+        for i in range(1, n_rows):
+            change = source[i] - source[i - 1]
+
+            # Nested calls drop the NaN values of each moving average.
+            signed = _ma_update(
+                method, short_length, signed_short, signed_short_buffer,
+                change,
+            )
+            if not np.isnan(signed):
+                signed_counts[0] += 1
+                signed = _ma_update(
+                    method, long_length, signed_long, signed_long_buffer,
+                    signed,
+                )
+                if not np.isnan(signed):
+                    signed_counts[1] += 1
+                    signed_output[i] = True
+
+            absolute = _ma_update(
+                method, short_length, absolute_short,
+                absolute_short_buffer, abs(change),
+            )
+            if not np.isnan(absolute):
+                absolute_counts[0] += 1
+                absolute = _ma_update(
+                    method, long_length, absolute_long,
+                    absolute_long_buffer, absolute,
+                )
+                if not np.isnan(absolute):
+                    absolute_counts[1] += 1
+                    absolute_output[i] = True
+
+            if not signed_output[i] and not absolute_output[i]:
+                continue
+
+            tsi_values[i] = signed / absolute
+            n_tsi += 1
+            if signal_length == 0:
+                continue
+
+            # The RMA seed is the mean of the first `signal_length`
+            # values, so those rows wait until it is known.
+            if signal_method == 2 and n_tsi <= signal_length:
+                pending_rows[n_tsi - 1] = i
+                if n_tsi == signal_length:
+                    signal_state[1] = np.mean(tsi_values[pending_rows])
+                    for row in pending_rows:
+                        signal_values[row] = _ma_update(
+                            signal_method, signal_length, signal_state,
+                            signal_buffer, tsi_values[row],
+                        )
+                continue
+
+            signal_values[i] = _ma_update(
+                signal_method, signal_length, signal_state, signal_buffer,
+                tsi_values[i],
+            )
+            if not np.isnan(signal_values[i]):
+                n_signal += 1
+
+        n_changes = max(n_rows - 1, 0)
+        signed_empty = _is_empty(method, lengths, n_changes, signed_counts)
+        absolute_empty = _is_empty(
+            method, lengths, n_changes, absolute_counts
+        )
+        if signed_empty:
+            signed_output[:] = False
+        if absolute_empty:
+            absolute_output[:] = False
+        if signed_empty or absolute_empty:
+            tsi_values[:] = np.nan
+
+        signal_empty = n_tsi < signal_length
+        if signal_method >= 3 and n_signal < signal_length:
+            signal_empty = True
+        if signal_empty:
+            signal_values[:] = np.nan
+        return tsi_values, signal_values, signed_output | absolute_output
+
+    return tsi_loop
+
+def tsi_numba(
+    source: np.ndarray,
+    short_length: int,
+    long_length: int,
+    method: int,
+    signal_length: int = 0,
+    signal_method: int = 1,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the True Strength Index (TSI) and its signal line using
+    Numba.
+
+    The price change and its absolute value are smoothed twice in
+    lock-step, and the signal line is calculated from each new TSI
+    value, all in a single loop.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    short_length : int
+        The number of periods for the short-term moving average.
+    long_length : int
+        The number of periods for the long-term moving average.
+    method : int
+        The moving average code of the TSI, from `MA_METHOD_CODES`.
+    signal_length : int, optional
+        The number of periods for the signal line moving average, or 0
+        to skip the signal line.
+        (default: 0)
+    signal_method : int, optional
+        The moving average code of the signal line.
+        (default: 1)
+
+    Returns:
+    --------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        The TSI values, the signal line values and a mask of the values
+        kept by the nested moving average calls, which drop their NaN
+        values.
+    """
+    tsi_loop = _tsi_kernel(method, signal_method if signal_length else 1)
+    return tsi_loop(source, short_length, long_length, signal_length)
+
+
 def tsi(
     source: pd.Series,
     short_length: int = 13,
@@ -41,44 +236,20 @@ def tsi(
     """
     if isinstance(source, pd.DataFrame):
         raise TypeError("source can't be a DataFrame")
+    if ma_method not in MA_METHOD_CODES:
+        raise InvalidArgumentError(f"'{ma_method}' is not a valid method.")
 
-    PC = source.diff().iloc[1:]
-    absolute_PC = PC.abs()
-
-    match ma_method:
-        case "sma":
-            short_smoothed = sma(PC, short_length)
-            long_smoothed = sma(short_smoothed, long_length)
-            absolute_short_smoothed = sma(absolute_PC, short_length)
-            absolute_long_smoothed = sma(absolute_short_smoothed, long_length)
-
-        case "ema":
-            short_smoothed = ema(PC, short_length)
-            long_smoothed = ema(short_smoothed, long_length)
-            absolute_short_smoothed = ema(absolute_PC, short_length)
-            absolute_long_smoothed = ema(absolute_short_smoothed, long_length)
-        case "dema":
-            short_smoothed = sema(PC, short_length, 2)
-            long_smoothed = sema(short_smoothed, long_length, 2)
-            absolute_short_smoothed = sema(absolute_PC, short_length, 2)
-            absolute_long_smoothed = sema(
-                absolute_short_smoothed, long_length, 2
-            )
-        case "tema":
-            short_smoothed = sema(PC, short_length, 3)
-            long_smoothed = sema(short_smoothed, long_length, 3)
-            absolute_short_smoothed = sema(absolute_PC, short_length, 3)
-            absolute_long_smoothed = sema(
-                absolute_short_smoothed, long_length, 3
-            )
-        case "rma":
-            short_smoothed = rma(PC, short_length)
-            long_smoothed = rma(short_smoothed, long_length)
-            absolute_short_smoothed = rma(absolute_PC, short_length)
-            absolute_long_smoothed = rma(absolute_short_smoothed, long_length)
-        case _:
-            raise InvalidArgumentError(f"'{ma_method}' is not a valid method.")
-
-    TSI = (long_smoothed / absolute_long_smoothed).rename("TSI")
+    tsi_values, _, is_output = tsi_numba(
+        source.to_numpy(dtype=np.float64),
+        short_length,
+        long_length,
+        MA_METHOD_CODES[ma_method],
+    )
+    if not is_output.any():
+        return pd.Series([], dtype=np.float64, name="TSI")
 
-    return TSI
+    return pd.Series(
+        tsi_values[is_output],
+        index=source.index[is_output],
+        name="TSI",
+    )
@@ -1,7 +1,7 @@
 from typing import Literal
 import pandas as pd
 import numpy as np
-import fastdtw
+from .dtw import dtw
 from .errors_exceptions import InvalidArgumentError
 
 
@@ -17,6 +17,19 @@ class DynamicTimeWarping:
         The first input sequence.
     input_y : numpy.ndarray or pandas.Series
         The second input sequence.
+    method : str, optional
+        The DTW method, either "approximate" (FastDTW) or "exact".
+        (default: "approximate")
+    radius : int, optional
+        The FastDTW radius, or the half-width of the Sakoe-Chiba band.
+        (default: 1)
+    band : str, optional
+        The band of the "exact" method, either "sakoe_chiba" or
+        "itakura".
+        (default: None)
+    max_slope : float, optional
+        The maximum slope of the "itakura" parallelogram.
+        (default: 2.0)
 
     Attributes
     ----------
@@ -41,6 +54,10 @@ class DynamicTimeWarping:
         self,
         input_x: np.ndarray | pd.Series,
         input_y: np.ndarray | pd.Series,
+        method: Literal["approximate", "exact"] = "approximate",
+        radius: int = 1,
+        band: Literal["sakoe_chiba", "itakura"] | None = None,
+        max_slope: float = 2.0,
     ):
         """
         Initialize the DynamicTimeWarping class with the input
@@ -52,12 +69,35 @@ class DynamicTimeWarping:
             The first input sequence.
         input_y : numpy.ndarray or pandas.Series
             The second input sequence.
+        method : str, optional
+            The DTW method, either "approximate" (FastDTW) or "exact".
+            (default: "approximate")
+        radius : int, optional
+            The FastDTW radius, or the half-width of the Sakoe-Chiba
+            band.
+            (default: 1)
+        band : str, optional
+            The band of the "exact" method, either "sakoe_chiba" or
+            "itakura".
+            (default: None)
+        max_slope : float, optional
+            The maximum slope of the "itakura" parallelogram.
+            (default: 2.0)
 
         """
         self.input_x = input_x
         self.input_y = input_y
-        _, self.path = fastdtw.fastdtw(input_x, input_y)
-        self.dtw = pd.DataFrame(self.path)
+        self.dtw_params = {
+            "method": method,
+            "radius": radius,
+            "band": band,
+            "max_slope": max_slope,
+        }
+        self.distance, path_x, path_y = dtw(
+            input_x, input_y, **self.dtw_params
+        )
+        self.path = list(zip(path_x.tolist(), path_y.tolist()))
+        self.dtw = pd.DataFrame({0: path_x, 1: path_y})
 
         self.column_x = (
             input_x.name if isinstance(input_x, pd.Series)
@@ -176,7 +216,9 @@ class DynamicTimeWarping:
         elif len(self.input_x) < len(self.input_y):
             y_source = y_source.reindex(self.input_x.index)
 
-        dtw_df = DynamicTimeWarping(x_source, y_source).dtw_df
+        dtw_df = DynamicTimeWarping(
+            x_source, y_source, **self.dtw_params
+        ).dtw_df
 
         x_name = "x"
         y_name = "y"
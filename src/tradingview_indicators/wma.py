@@ -1,31 +1,109 @@
+import numpy as np
 import pandas as pd
+from numba import njit, prange
 
-def wma(series: pd.Series, length: int) -> pd.Series:
+@njit
+def wma_numba(values, length):
+    """
+    Calculate the Weighted Moving Average (WMA) using Numba.
+
+    The linear-weighted sum and the plain sum of the window are updated
+    in O(1) per value and recalculated from scratch every `length`
+    values, and after NaN values leave the window.
+
+    Parameters:
+    values (np.ndarray): The input data array.
+    length (int): The period of the WMA.
+
+    Returns:
+    np.ndarray: The WMA values, with NaN for windows containing NaN.
+    """
+    wma_values = np.full(len(values), np.nan)
+    divisor = length * (length + 1) / 2
+
+    window_sum = 0.0
+    weighted_sum = 0.0
+    last_nan = -1
+    is_valid = False
+    for i in range(len(values)):
+        if np.isnan(values[i]):
+            last_nan = i
+
+        if i < length - 1 or last_nan > i - length:
+            is_valid = False
+            continue
+
+        if is_valid and i % length != 0:
+            weighted_sum += length * values[i] - window_sum
+            window_sum += values[i] - values[i - length]
+        else:
+            window_sum = 0.0
+            weighted_sum = 0.0
+            for j in range(length):
+                value = values[i - length + 1 + j]
+                window_sum += value
+                weighted_sum += (j + 1) * value
+            is_valid = True
+
+        wma_values[i] = weighted_sum / divisor
+
+    return wma_values
+
+@njit(parallel=True)
+def wma_2d_numba(values, length):
+    """
+    Calculate the Weighted Moving Average (WMA) of every column of a
+    2-D array using Numba.
+
+    Parameters:
+    values (np.ndarray): The input 2-D data array.
+    length (int): The period of the WMA.
+
+    Returns:
+    np.ndarray: The WMA values of each column.
+    """
+    wma_values = np.empty(values.shape)
+    for col in prange(values.shape[1]):
+        wma_values[:, col] = wma_numba(values[:, col], length)
+    return wma_values
+
+def wma(
+    series: pd.Series | pd.DataFrame | np.ndarray,
+    length: int,
+) -> pd.Series | pd.DataFrame | np.ndarray:
     """
     Calculate the Weighted Moving Average (WMA) for the given series.
 
     Parameters:
     -----------
-    series : pd.Series
-        The input series of values.
+    series : pd.Series, pd.DataFrame or np.ndarray
+        The input series of values. A DataFrame or a 2-D array is
+        treated as one series per column.
     length : int
         The period for calculating the WMA.
 
     Returns:
     --------
-    pd.Series
+    pd.Series, pd.DataFrame or np.ndarray
         The Weighted Moving Average (WMA) values.
     """
-    if not isinstance(series, pd.Series):
-        raise ValueError("series must be a pandas Series")
     if length < 1:
         raise ValueError("length must be a positive integer")
 
-    # Compute weights
-    weights = pd.Series(range(1, length + 1))
-    
-    def calc_wma(window):
-        return (window * weights).sum() / weights.sum()
+    if isinstance(series, pd.Series):
+        wma_values = wma_numba(series.to_numpy(dtype=np.float64), length)
+        return pd.Series(wma_values, index=series.index, name="WMA")
+
+    if isinstance(series, pd.DataFrame):
+        values = np.asfortranarray(series.to_numpy(dtype=np.float64))
+        return pd.DataFrame(
+            wma_2d_numba(values, length),
+            index=series.index,
+            columns=series.columns,
+        )
+
+    if isinstance(series, np.ndarray) and series.ndim == 2:
+        values = np.asfortranarray(series, dtype=np.float64)
+        return wma_2d_numba(values, length)
 
-    wma = series.rolling(window=length).apply(calc_wma, raw=False)
-    return wma.rename("WMA")
\ No newline at end of file
+    raise ValueError("series must be a pandas Series or DataFrame")
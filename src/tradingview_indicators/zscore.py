@@ -1,5 +1,9 @@
+from typing import Literal
 import numpy as np
-from scipy.stats import zmap
+import pandas as pd
+from numba import njit, prange
+
+ZSCORE_MODES = {"rolling": 0, "expanding": 1, "ewm": 2}
 
 def zscore(a, axis=0, ddof=0, nan_policy='propagate'):
     """
@@ -27,4 +31,286 @@ def zscore(a, axis=0, ddof=0, nan_policy='propagate'):
         The z-scores, standardized by the mean and standard deviation of
         input array `a`.
     """
+    # scipy is only needed here, so it is kept out of the package import.
+    from scipy.stats import zmap
+
     return zmap(a, a, axis=axis, ddof=ddof, nan_policy=nan_policy)
+
+@njit
+def _welford_add(
+    count: int,
+    mean: float,
+    m2: float,
+    value: float,
+) -> tuple[int, float, float]:
+    """
+    Add a value to a Welford mean and sum of squared deviations.
+    """
+    count += 1
+    delta = value - mean
+    mean += delta / count
+    m2 += delta * (value - mean)
+    return count, mean, m2
+
+@njit
+def _welford_remove(
+    count: int,
+    mean: float,
+    m2: float,
+    value: float,
+) -> tuple[int, float, float]:
+    """
+    Remove a value from a Welford mean and sum of squared deviations.
+    """
+    count -= 1
+    if count == 0:
+        return 0, 0.0, 0.0
+    delta = value - mean
+    mean -= delta / count
+    m2 -= delta * (value - mean)
+    return count, mean, max(m2, 0.0)
+
+@njit(error_model="numpy")
+def rolling_zscore_numba(
+    source: np.ndarray,
+    length: int,
+    mode: int,
+    ddof: int = 0,
+) -> np.ndarray:
+    """
+    Calculate the z-score of each value relative to the mean and
+    standard deviation of a rolling, expanding or exponentially
+    weighted window using Numba.
+
+    The mean and the variance are updated in O(1) per value with
+    Welford's algorithm. The rolling window is recalculated from
+    scratch every `length` values, so the rounding error can't build
+    up over long series.
+
+    Parameters:
+    -----------
+    source : np.ndarray
+        The input array of values.
+    length : int
+        The number of periods of the rolling window, or the span of the
+        exponentially weighted window. Unused by the expanding window.
+    mode : int
+        The window code, from `ZSCORE_MODES`.
+    ddof : int, optional
+        Degrees of freedom correction in the calculation of the
+        standard deviation of the rolling and expanding windows.
+        (default: 0)
+
+    Returns:
+    --------
+    np.ndarray
+        The z-score values. NaN values are skipped by the expanding and
+        exponentially weighted windows and make the rolling windows that
+        contain them NaN.
+    """
+    n_rows = len(source)
+    zscores = np.full(n_rows, np.nan)
+    alpha = 2 / (length + 1)
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    nan_count = 0
+    for i in range(n_rows):
+        value = source[i]
+        if mode == 0:  # ZSCORE_MODES["rolling"]
+            if i >= length:
+                old_value = source[i - length]
+                if np.isnan(old_value):
+                    nan_count -= 1
+                else:
+                    count, mean, m2 = _welford_remove(
+                        count, mean, m2, old_value
+                    )
+
+            if np.isnan(value):
+                nan_count += 1
+            else:
+                count, mean, m2 = _welford_add(count, mean, m2, value)
+
+            if (i + 1) % length == 0:
+                count = 0
+                mean = 0.0
+                m2 = 0.0
+                for j in range(i - length + 1, i + 1):
+                    if not np.isnan(source[j]):
+                        count, mean, m2 = _welford_add(
+                            count, mean, m2, source[j]
+                        )
+
+            if i < length - 1 or nan_count > 0:
+                continue
+            zscores[i] = (value - mean) / np.sqrt(m2 / (count - ddof))
+            continue
+
+        if np.isnan(value):
+            continue
+
+        if mode == 1:  # ZSCORE_MODES["expanding"]
+            count, mean, m2 = _welford_add(count, mean, m2, value)
+            zscores[i] = (value - mean) / np.sqrt(m2 / (count - ddof))
+            continue
+
+        # The exponentially weighted variance, without bias correction.
+        if count == 0:
+            mean = value
+            count = 1
+        else:
+            delta = value - mean
+            mean += alpha * delta
+            m2 = (1 - alpha) * (m2 + alpha * delta * delta)
+        zscores[i] = (value - mean) / np.sqrt(m2)
+    return zscores
+
+@njit(parallel=True)
+def _rolling_zscore_2d_numba(
+    source: np.ndarray,
+    length: int,
+    mode: int,
+    ddof: int,
+) -> np.ndarray:
+    """
+    Calculate the rolling z-score of every column of a 2-D array, with
+    the columns in parallel.
+    """
+    n_rows, n_cols = source.shape
+    zscores = np.empty((n_rows, n_cols))
+    for col in prange(n_cols):
+        zscores[:, col] = rolling_zscore_numba(
+            source[:, col], length, mode, ddof
+        )
+    return zscores
+
+def rolling_zscore(
+    source: pd.Series | pd.DataFrame | np.ndarray,
+    length: int | None = None,
+    mode: Literal["rolling", "expanding", "ewm"] = "rolling",
+    ddof: int = 0,
+) -> pd.Series | pd.DataFrame | np.ndarray:
+    """
+    Calculate the point-in-time z-score of each value, relative to the
+    mean and standard deviation of the values up to it.
+
+    Parameters:
+    -----------
+    source : pd.Series, pd.DataFrame or np.ndarray
+        The input time series data. A DataFrame or a 2-D array is
+        treated as one time series per column.
+    length : int, optional
+        The number of periods of the "rolling" window, or the span of
+        the "ewm" window. Not used by the "expanding" window.
+    mode : {"rolling", "expanding", "ewm"}, optional
+        The window of the mean and standard deviation. "ewm" uses the
+        exponentially weighted variance without bias correction and
+        skips the NaN values, like pandas
+        `ewm(span=length, adjust=False, ignore_na=True).var(bias=True)`.
+        (default: "rolling")
+    ddof : int, optional
+        Degrees of freedom correction in the calculation of the
+        standard deviation of the "rolling" and "expanding" windows.
+        (default: 0)
+
+    Returns:
+    --------
+    pd.Series, pd.DataFrame or np.ndarray
+        The z-score values, with the shape of the input.
+
+    Raises:
+    -------
+    ValueError
+        If the mode is invalid or the length is missing or not a
+        positive integer.
+    """
+    if mode not in ZSCORE_MODES:
+        raise ValueError("mode must be 'rolling', 'expanding' or 'ewm'")
+    if mode == "expanding":
+        length = 1
+    if length is None or length < 1:
+        raise ValueError("length must be a positive integer")
+
+    values = np.asarray(source, dtype=np.float64)
+    if values.ndim == 2:
+        zscores = _rolling_zscore_2d_numba(
+            np.asfortranarray(values), length, ZSCORE_MODES[mode], ddof
+        )
+        if isinstance(source, pd.DataFrame):
+            return pd.DataFrame(
+                zscores, index=source.index, columns=source.columns
+            )
+        return zscores
+
+    zscores = rolling_zscore_numba(values, length, ZSCORE_MODES[mode], ddof)
+    if isinstance(source, pd.Series):
+        return pd.Series(zscores, index=source.index, name="ZScore")
+    return zscores
+
+def zscore_chunked(
+    a: np.ndarray,
+    ddof: int = 0,
+    chunk_size: int = 1_000_000,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Compute the z-score of each value along the first axis, like
+    `zscore`, reading the input in chunks.
+
+    The first pass merges the mean and the sum of squared deviations of
+    each chunk, and the second pass writes the z-scores, so memory-mapped
+    arrays larger than the available memory can be standardized by
+    passing a memory-mapped `out` array.
+
+    Parameters:
+    -----------
+    a : np.ndarray
+        The 1-D or 2-D sample data, such as a `np.memmap`.
+    ddof : int, optional
+        Degrees of freedom correction in the calculation of the
+        standard deviation.
+        (default: 0)
+    chunk_size : int, optional
+        The number of rows read at once.
+        (default: 1_000_000)
+    out : np.ndarray, optional
+        The array to write the z-scores to, with the shape of `a`. If
+        not provided, a new array is returned.
+
+    Returns:
+    --------
+    np.ndarray
+        The z-scores. Columns containing a NaN value are NaN, like the
+        'propagate' NaN policy of `zscore`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+    if out is None:
+        out = np.empty(a.shape, dtype=np.float64)
+    elif out.shape != a.shape:
+        raise ValueError("out must have the shape of a")
+
+    n_rows = a.shape[0]
+    count = 0
+    mean = np.zeros(a.shape[1:])
+    m2 = np.zeros(a.shape[1:])
+    for start in range(0, n_rows, chunk_size):
+        chunk = np.asarray(a[start : start + chunk_size], dtype=np.float64)
+        chunk_count = len(chunk)
+        chunk_mean = chunk.mean(axis=0)
+        chunk_m2 = np.sum((chunk - chunk_mean) ** 2, axis=0)
+
+        # Chan et al. merge of the chunk into the running statistics.
+        total = count + chunk_count
+        delta = chunk_mean - mean
+        mean = mean + delta * chunk_count / total
+        m2 = m2 + chunk_m2 + delta ** 2 * count * chunk_count / total
+        count = total
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(m2 / (count - ddof))
+        for start in range(0, n_rows, chunk_size):
+            chunk = np.asarray(a[start : start + chunk_size], dtype=np.float64)
+            out[start : start + chunk_size] = (chunk - mean) / std
+    return out
@@ -194,4 +194,25 @@ class TestRSI(unittest.TestCase):
 
         test_rsi = RSI(self.short_source['close'], self.length, 'rma')
 
-        pd.testing.assert_series_equal(test_rsi, ref_df)
\ No newline at end of file
+        pd.testing.assert_series_equal(test_rsi, ref_df)
+
+class TestRSI2D(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source[["open", "high", "low", "close"]].iloc[:200]
+        self.source.iloc[:20, 1] = np.nan
+        self.length = 14
+
+    def test_rsi_dataframe(self):
+        for ma_method in ("sma", "ema", "dema", "tema", "rma"):
+            result = RSI(self.source, self.length, ma_method)
+
+            for column in self.source.columns:
+                expected = RSI(
+                    self.source[column].dropna(), self.length, ma_method
+                )
+                pd.testing.assert_series_equal(
+                    result[column].loc[expected.index],
+                    expected,
+                    check_names=False,
+                )
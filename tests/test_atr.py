@@ -0,0 +1,157 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.atr import atr, AtrState
+from src.tradingview_indicators.moving_average import ema, sema
+
+class TestATR(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.high = source["high"].iloc[:500]
+        self.low = source["low"].iloc[:500]
+        self.close = source["close"].iloc[:500]
+        self.length = 14
+        self.true_range = pd.concat(
+            [
+                self.high - self.low,
+                (self.high - self.close.shift()).abs(),
+                (self.low - self.close.shift()).abs(),
+            ],
+            axis=1,
+        ).max(axis=1)
+
+    def test_atr(self):
+        result = atr(self.high, self.low, self.close, self.length)
+        expected = self.true_range.rolling(self.length).mean()
+
+        pd.testing.assert_series_equal(result, expected, rtol=1e-12)
+
+    def test_atr_ma_method(self):
+        expected_values = {
+            "ema": ema(self.true_range, self.length),
+            "dema": sema(self.true_range, self.length, 2),
+            "tema": sema(self.true_range, self.length, 3),
+        }
+        for ma_method, expected in expected_values.items():
+            result = atr(
+                self.high, self.low, self.close, self.length, ma_method
+            )
+            np.testing.assert_array_equal(result, expected)
+
+    def test_atr_tradingview(self):
+        # TradingView's `ta.atr`: the SMA of the first `length` true
+        # ranges, then the RMA.
+        seeded = self.true_range.copy()
+        seeded.iloc[:self.length - 1] = np.nan
+        seeded.iloc[self.length - 1] = (
+            self.true_range.iloc[:self.length].mean()
+        )
+        expected = seeded.ewm(alpha=1 / self.length, adjust=False).mean()
+
+        result = atr(self.high, self.low, self.close, self.length, "rma")
+        pd.testing.assert_series_equal(
+            result, expected, check_names=False, rtol=1e-12
+        )
+
+    def test_atr_dataframe(self):
+        high = pd.DataFrame({"a": self.high, "b": self.high})
+        low = pd.DataFrame({"a": self.low, "b": self.low})
+        close = pd.DataFrame({"a": self.close, "b": self.close})
+        for source in (high, low, close):
+            source.iloc[:50, 1] = np.nan
+
+        result = atr(high, low, close, self.length, "rma")
+        np.testing.assert_array_equal(
+            result["a"],
+            atr(self.high, self.low, self.close, self.length, "rma"),
+        )
+        np.testing.assert_array_equal(
+            result["b"].iloc[50:],
+            atr(
+                self.high.iloc[50:],
+                self.low.iloc[50:],
+                self.close.iloc[50:],
+                self.length,
+                "rma",
+            ),
+        )
+
+    def test_atr_leading_nan(self):
+        high, low, close = (
+            source.copy() for source in (self.high, self.low, self.close)
+        )
+        for source in (high, low, close):
+            source.iloc[:3] = np.nan
+
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            result = atr(high, low, close, self.length, ma_method)
+            expected = atr(
+                high.to_frame(), low.to_frame(), close.to_frame(),
+                self.length, ma_method,
+            ).iloc[:, 0]
+            pd.testing.assert_series_equal(
+                result, expected, check_names=False
+            )
+            self.assertTrue(result.iloc[self.length + 2:].notna().all())
+
+    def test_atr_state(self):
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            expected = atr(
+                self.high, self.low, self.close, self.length, ma_method
+            )
+            state = AtrState.from_source(
+                self.high.iloc[:250],
+                self.low.iloc[:250],
+                self.close.iloc[:250],
+                self.length,
+                ma_method,
+            )
+            result = [
+                state.update(high, low, close)
+                for high, low, close in zip(
+                    self.high.iloc[250:],
+                    self.low.iloc[250:],
+                    self.close.iloc[250:],
+                )
+            ]
+            np.testing.assert_allclose(
+                result, expected.iloc[250:], rtol=1e-12
+            )
+
+    def test_atr_state_from_short_source(self):
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            expected = atr(
+                self.high, self.low, self.close, self.length, ma_method
+            )
+            state = AtrState.from_source(
+                self.high.iloc[:5],
+                self.low.iloc[:5],
+                self.close.iloc[:5],
+                self.length,
+                ma_method,
+            )
+            result = [
+                state.update(high, low, close)
+                for high, low, close in zip(
+                    self.high.iloc[5:],
+                    self.low.iloc[5:],
+                    self.close.iloc[5:],
+                )
+            ]
+            np.testing.assert_allclose(
+                result[-400:], expected.iloc[-400:], rtol=1e-12
+            )
+
+    def test_atr_state_snapshot_restore(self):
+        state = AtrState.from_source(
+            self.high, self.low, self.close, self.length, "rma"
+        )
+        snapshot = state.snapshot()
+        expected = state.update(21000.0, 19000.0, 20000.0)
+
+        state.restore(snapshot)
+        self.assertEqual(state.update(21000.0, 19000.0, 20000.0), expected)
+
+    def test_invalid_ma_method(self):
+        with self.assertRaises(ValueError):
+            atr(self.high, self.low, self.close, self.length, "wma")
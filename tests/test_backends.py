@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators import backends
+from src.tradingview_indicators.moving_average import sma, rma
+
+
+class TestBackends(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(100) * 100 + 50)
+        self.length = 14
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "backends.json")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        backends.load_calibration(self.path)
+        backends._BACKENDS.pop("test_indicator", None)
+
+    def test_backends_match(self):
+        early_nan = self.source.copy()
+        early_nan.iloc[2] = np.nan
+        late_nan = self.source.copy()
+        late_nan.iloc[20] = np.nan
+        int_source = pd.Series(np.random.randint(1, 500, 100))
+
+        for source in (self.source, early_nan, late_nan, int_source):
+            for indicator, function in (("sma", sma), ("rma", rma)):
+                expected = function(source, self.length, method="numba")
+                for name in backends.available_backends(indicator):
+                    result = function(source, self.length, method=name)
+                    pd.testing.assert_series_equal(
+                        result, expected, check_names=False
+                    )
+
+    def test_calibrate(self):
+        calibration = backends.calibrate(
+            ["rma"], sizes=(50, 500), repeat=1, path=self.path
+        )
+
+        self.assertTrue(os.path.exists(self.path))
+        self.assertEqual(calibration["rma"][0][0], 0)
+        self.assertEqual(backends.load_calibration(self.path), calibration)
+
+        result = rma(self.source, self.length, method="auto")
+        pd.testing.assert_series_equal(
+            result, rma(self.source, self.length), check_names=False
+        )
+
+    def test_select_backend(self):
+        backends.register_backend("test_indicator", "slow")(len)
+        backends.register_backend("test_indicator", "fast")(len)
+        backends.load_calibration(self.path)
+        backends._CALIBRATION["test_indicator"] = [(0, "slow"), (1000, "fast")]
+
+        self.assertEqual(backends.select_backend("test_indicator", 50), "slow")
+        self.assertEqual(backends.select_backend("test_indicator", 5000), "fast")
+
+    def test_invalid_indicator(self):
+        with self.assertRaises(backends.InvalidArgumentError):
+            backends.select_backend("invalid", 50)
@@ -0,0 +1,85 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.bb import bb, bollinger_bands, BollingerState
+
+class TestBollingerBands(unittest.TestCase):
+    def setUp(self):
+        self.source = (
+            pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)["close"]
+            .iloc[:500]
+            .copy()
+        )
+        self.source.iloc[[100, 300]] = np.nan
+        self.length = 20
+
+    def test_bb(self):
+        basis, upper, lower = bb(self.source, self.length, 2)
+        expected_basis = self.source.rolling(self.length).mean()
+        dev = 2 * self.source.rolling(self.length).std()
+
+        pd.testing.assert_series_equal(basis, expected_basis, rtol=1e-10)
+        pd.testing.assert_series_equal(
+            upper, expected_basis + dev, rtol=1e-10
+        )
+        pd.testing.assert_series_equal(
+            lower, expected_basis - dev, rtol=1e-10
+        )
+
+    def test_bollinger_bands(self):
+        result = bollinger_bands(self.source, [10, 20], [1, 2, 3])
+
+        self.assertListEqual(list(result["basis"].columns), [10, 20])
+        for length in [10, 20]:
+            for mult in [1.0, 2.0, 3.0]:
+                basis, upper, lower = bb(self.source, length, mult)
+                column = (length, mult)
+                np.testing.assert_array_equal(
+                    result["upper"][column], upper
+                )
+                np.testing.assert_array_equal(
+                    result["lower"][column], lower
+                )
+                np.testing.assert_allclose(
+                    result["percent_b"][column],
+                    (self.source - lower) / (upper - lower),
+                )
+                np.testing.assert_allclose(
+                    result["bandwidth"][column],
+                    (upper - lower) / basis,
+                )
+
+    def test_bollinger_state(self):
+        expected = bollinger_bands(self.source, self.length, [1, 2, 3])
+
+        state = BollingerState.from_source(
+            self.source.iloc[:250], self.length, [1, 2, 3]
+        )
+        result = [dict(state.update(value)) for value in self.source[250:]]
+
+        np.testing.assert_array_equal(
+            [values["basis"] for values in result],
+            expected["basis"][self.length].iloc[250:],
+        )
+        for key in ["upper", "lower", "percent_b", "bandwidth"]:
+            np.testing.assert_array_equal(
+                [values[key] for values in result],
+                expected[key].iloc[250:],
+            )
+
+    def test_bollinger_state_without_degrees_of_freedom(self):
+        source = self.source.iloc[:30]
+        expected = bollinger_bands(source, 1)
+
+        state = BollingerState(1)
+        result = [state.update(value)["upper"][0] for value in source]
+        np.testing.assert_array_equal(result, expected["upper"].iloc[:, 0])
+        self.assertTrue(np.isnan(result).all())
+
+    def test_bollinger_state_snapshot_restore(self):
+        state = BollingerState.from_source(self.source, self.length)
+        snapshot = state.snapshot()
+        expected = state.update(30000.0)["upper"].copy()
+
+        state.restore(snapshot)
+        np.testing.assert_array_equal(state.update(30000.0)["upper"], expected)
@@ -2,7 +2,7 @@ import unittest
 
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.CCI import CCI
+from src.tradingview_indicators.CCI import ccc as CCI, CciState
 
 
 class TestCCI(unittest.TestCase):
@@ -132,3 +132,73 @@ class TestCCI(unittest.TestCase):
         test_df = CCI(self.source, self.length, method='rma').astype('float64')
 
         pd.testing.assert_frame_equal(ref_df,test_df)
+
+
+class TestCCIEngine(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(200) * 100 + 50)
+        self.length = 20
+
+    def reference_mad(self, values, length):
+        window = np.lib.stride_tricks.sliding_window_view(values, length)
+        return np.mean(
+            np.abs(window - window.mean(axis=1)[:, np.newaxis]), axis=1
+        )
+
+    def test_CCI_mad(self):
+        result = CCI(self.source, self.length)
+        expected = self.reference_mad(self.source.to_numpy(), self.length)
+
+        np.testing.assert_allclose(result["mad"].to_numpy(), expected)
+
+    def test_CCI_nan_window(self):
+        source = self.source.copy()
+        source[50] = np.nan
+        result = CCI(source, self.length)["mad"]
+
+        self.assertTrue(result.loc[50:69].isna().all())
+        self.assertFalse(result.drop(range(50, 70)).isna().any())
+
+    def test_CCI_only(self):
+        for method in ("sma", "ema", "dema", "tema", "rma"):
+            result = CCI(
+                self.source, self.length, method=method, cci_only=True
+            )
+            expected = CCI(self.source, self.length, method=method)["CCI"]
+
+            pd.testing.assert_series_equal(result, expected)
+
+    def test_CCI_state(self):
+        for method in ("sma", "ema", "dema", "tema", "rma"):
+            state = CciState.from_source(
+                self.source[:100], self.length, method=method
+            )
+            result = [state.update(value) for value in self.source[100:]]
+            expected = CCI(self.source, self.length, method=method)["CCI"]
+
+            np.testing.assert_allclose(result, expected.to_numpy()[-100:])
+
+    def test_CCI_state_from_short_source(self):
+        for method in ("sma", "ema", "dema", "tema", "rma"):
+            state = CciState.from_source(
+                self.source[:7], self.length, method=method
+            )
+            result = [state.update(value) for value in self.source[7:]]
+            expected = CCI(self.source, self.length, method=method)["CCI"]
+
+            np.testing.assert_allclose(
+                result[-100:], expected.to_numpy()[-100:]
+            )
+
+    def test_CCI_state_snapshot_restore(self):
+        state = CciState(self.length)
+        for value in self.source[:100]:
+            state.update(value)
+        snapshot = state.snapshot()
+        first_run = [state.update(value) for value in self.source[100:]]
+
+        state.restore(snapshot)
+        second_run = [state.update(value) for value in self.source[100:]]
+
+        np.testing.assert_array_equal(first_run, second_run)
@@ -0,0 +1,76 @@
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.correlation import (
+    correlation,
+    correlation_matrix,
+)
+
+
+class TestCorrelation(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        market = np.random.normal(size=(400, 1)).cumsum(axis=0)
+        self.source = pd.DataFrame(
+            1000 + market * 10
+            + np.random.normal(size=(400, 6)).cumsum(axis=0) * 5,
+            columns=["A", "B", "C", "D", "E", "F"],
+        )
+        self.source.iloc[[50, 51, 200], 2] = np.nan
+        self.length = 30
+
+    def test_correlation_matrix(self):
+        result = correlation_matrix(self.source, self.length)
+        self.assertEqual(len(result.columns), 15)
+        for first, second in result.columns:
+            expected = correlation(
+                self.source[first], self.source[second], self.length
+            )
+            pd.testing.assert_series_equal(
+                result[(first, second)],
+                expected,
+                check_names=False,
+                atol=1e-9,
+            )
+
+    def test_correlation_matrix_pairs(self):
+        pairs = [("B", "A"), ("C", "F")]
+        result = correlation_matrix(self.source, self.length, pairs)
+        self.assertEqual(list(result.columns), pairs)
+        expected = correlation_matrix(self.source, self.length)
+        pd.testing.assert_series_equal(
+            result[("B", "A")], expected[("A", "B")], check_names=False
+        )
+        pd.testing.assert_series_equal(
+            result[("C", "F")], expected[("C", "F")], check_names=False
+        )
+
+    def test_latest_correlation_matrix(self):
+        result = correlation_matrix(self.source, self.length, latest=True)
+        expected = self.source.iloc[-self.length:].corr()
+        pd.testing.assert_frame_equal(result, expected, atol=1e-12)
+
+        pairs = [("A", "B"), ("D", "C")]
+        result = correlation_matrix(
+            self.source, self.length, pairs, latest=True
+        )
+        self.assertAlmostEqual(result[("A", "B")], expected.loc["A", "B"])
+        self.assertAlmostEqual(result[("D", "C")], expected.loc["D", "C"])
+
+    def test_correlation_matrix_trending_prices(self):
+        trend = np.exp(np.linspace(0, np.log(8000), 3000))[:, None]
+        noise = 1 + np.random.normal(scale=0.001, size=(3000, 2))
+        source = pd.DataFrame(trend * noise, columns=["A", "B"])
+        result = correlation_matrix(source, 20)[("A", "B")].to_numpy()
+        windows = np.lib.stride_tricks.sliding_window_view(
+            source.to_numpy(), 20, axis=0
+        )
+        expected = [np.corrcoef(window)[0, 1] for window in windows]
+        np.testing.assert_allclose(result[19:], expected, rtol=0, atol=1e-10)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            correlation_matrix(self.source, 0)
+        with self.assertRaises(ValueError):
+            correlation_matrix(self.source, self.length, [("A", "Z")])
@@ -0,0 +1,95 @@
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.cross import cross
+from src.tradingview_indicators.crossover import crossover
+from src.tradingview_indicators.crossunder import crossunder
+
+
+class TestCross(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.series1 = pd.Series(np.random.rand(300)).round(1)
+        self.series2 = pd.Series(np.random.rand(300)).round(1)
+        self.series1.iloc[[10, 11, 150]] = np.nan
+
+        shifted1 = self.series1.shift(1)
+        shifted2 = self.series2.shift(1)
+        self.crossovers = (
+            (shifted1 < shifted2) & (self.series1 > self.series2)
+        )
+        self.crossunders = (
+            (shifted1 > shifted2) & (self.series1 < self.series2)
+        )
+
+    def test_crossover_and_crossunder(self):
+        pd.testing.assert_series_equal(
+            crossover(self.series1, self.series2),
+            self.crossovers.astype(int).rename("Crossover"),
+        )
+        pd.testing.assert_series_equal(
+            crossunder(self.series1, self.series2),
+            self.crossunders.astype(int).rename("Crossunder"),
+        )
+
+    def test_dense_cross(self):
+        expected = (
+            self.crossovers.astype(np.int8) - self.crossunders.astype(np.int8)
+        ).rename("Cross")
+        result = cross(self.series1, self.series2)
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_events_cross(self):
+        result = cross(self.series1, self.series2, "events")
+        dense = cross(self.series1, self.series2)
+        events = dense[dense != 0]
+        np.testing.assert_array_equal(result.index, events.index)
+        np.testing.assert_array_equal(result["position"], events.index)
+        np.testing.assert_array_equal(result["direction"], events)
+        self.assertEqual(result["direction"].dtype, np.int8)
+
+    def test_packed_cross(self):
+        result = cross(self.series1, self.series2, "packed")
+        for key, expected in (
+            ("crossover", self.crossovers),
+            ("crossunder", self.crossunders),
+        ):
+            self.assertEqual(len(result[key]), 38)
+            np.testing.assert_array_equal(
+                np.unpackbits(result[key], count=300).astype(bool),
+                expected.to_numpy(),
+            )
+
+    def test_batch_cross(self):
+        series1 = pd.DataFrame({"a": self.series1, "b": self.series2})
+        series2 = pd.DataFrame({"a": self.series2, "b": self.series1})
+        dense = cross(series1, series2)
+        pd.testing.assert_series_equal(
+            dense["a"], cross(self.series1, self.series2), check_names=False
+        )
+        pd.testing.assert_series_equal(
+            dense["b"], -dense["a"], check_names=False
+        )
+
+        events = cross(series1, series2, "events")
+        self.assertEqual(len(events), np.count_nonzero(dense.to_numpy()))
+        self.assertTrue(events["position"].is_monotonic_increasing)
+        np.testing.assert_array_equal(
+            events["direction"],
+            dense.to_numpy()[events["position"], events["column"]],
+        )
+
+        packed = cross(series1, series2, "packed")
+        np.testing.assert_array_equal(
+            np.unpackbits(packed["crossover"], axis=0, count=300),
+            (dense == 1).to_numpy(),
+        )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            cross(self.series1, self.series2[:-1])
+        with self.assertRaises(ValueError):
+            cross(self.series1, self.series2, "sparse")
+        with self.assertRaises(ValueError):
+            cross(self.series1.to_frame(), self.series2)
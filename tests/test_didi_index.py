@@ -2,6 +2,7 @@ import unittest
 import pandas as pd
 import numpy as np
 from src.tradingview_indicators.didi_index import didi_index as DidiIndex
+from src.tradingview_indicators.didi_index import didi_index_grid
 
 
 class TestDidiIndex(unittest.TestCase):
@@ -483,3 +484,50 @@ class TestDidiIndex(unittest.TestCase):
         )
 
         pd.testing.assert_series_equal(test_values, ref_values)
+
+
+class TestDidiIndexGrid(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.randint(1, 500, 120)).astype(float)
+        self.lengths = [(5, 10, 20), (3, 10, 20), (5, 12, 30)]
+
+    def test_didi_index_grid(self):
+        for ma_method in ["sma", "ema", "dema", "tema", "rma"]:
+            for method in ["absolute", "ratio"]:
+                result = didi_index_grid(
+                    self.source, self.lengths, ma_method, method
+                )
+                self.assertEqual(list(result.columns), self.lengths)
+                for lengths in self.lengths:
+                    expected = DidiIndex(
+                        self.source, *lengths, ma_method, method
+                    ).reindex(self.source.index)
+                    np.testing.assert_array_equal(
+                        result[lengths].to_numpy(), expected.to_numpy()
+                    )
+
+    def test_didi_index_grid_dtw(self):
+        result = didi_index_grid(self.source, self.lengths, use_dtw=True)
+        for lengths in self.lengths:
+            expected = DidiIndex(
+                self.source, *lengths, use_dtw=True
+            ).reindex(self.source.index)
+            np.testing.assert_array_equal(
+                result[lengths].to_numpy(), expected.to_numpy()
+            )
+
+        parallel_result = didi_index_grid(
+            self.source, self.lengths, use_dtw=True, n_jobs=2
+        )
+        pd.testing.assert_frame_equal(parallel_result, result)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            didi_index_grid(self.source, [(5, 10)])
+        with self.assertRaises(ValueError):
+            didi_index_grid(self.source, [])
+        with self.assertRaises(ValueError):
+            didi_index_grid(self.source, self.lengths, method="dtw")
+        with self.assertRaises(ValueError):
+            didi_index_grid(self.source, self.lengths, ma_method="wma")
@@ -0,0 +1,102 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.DMI import DMI
+from src.tradingview_indicators.atr import atr
+from src.tradingview_indicators.moving_average import rma
+
+class TestDMI(unittest.TestCase):
+    def setUp(self):
+        self.source = (
+            pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+            .iloc[:200]
+        )
+        self.dmi = DMI(self.source)
+
+    def reference_adx(self, adx_smoothing, di_length):
+        high = self.source["high"]
+        low = self.source["low"]
+        close = self.source["close"]
+        true_range = pd.concat(
+            [
+                high - low,
+                (high - close.shift()).abs(),
+                (low - close.shift()).abs(),
+            ],
+            axis=1,
+        ).max(axis=1, skipna=False)
+        trur = rma(true_range.dropna(), di_length)
+
+        up = high.diff().dropna()
+        down = -low.diff().dropna()
+        plus_dm = up.where((up > down) & (up > 0), 0)
+        minus_dm = down.where((down > up) & (down > 0), 0)
+
+        plus = 100 * rma(plus_dm, di_length) / trur
+        minus = 100 * rma(minus_dm, di_length) / trur
+        di_sum = plus + minus
+        adx = 100 * rma(
+            abs(plus - minus) / di_sum.where(di_sum != 0, 1), adx_smoothing
+        )
+        return adx, plus, minus
+
+    def test_adx(self):
+        for adx_smoothing, di_length in [(14, 14), (7, 21), (21, 5)]:
+            result = self.dmi.adx(adx_smoothing, di_length)
+            expected = self.reference_adx(adx_smoothing, di_length)
+            for values, name, ref_values in zip(
+                result, ["ADX", "DI+", "DI-"], expected
+            ):
+                pd.testing.assert_series_equal(
+                    values, ref_values.rename(name), rtol=1e-12
+                )
+
+    def test_adx_short_source(self):
+        dmi = DMI(self.source.iloc[:20])
+        adx, plus, minus = dmi.adx(20, 14)
+        self.assertTrue(adx.empty)
+        self.assertEqual(len(plus), 19)
+        self.assertEqual(len(minus), 19)
+
+        adx, plus, minus = dmi.adx(14, 20)
+        self.assertTrue(adx.empty and plus.empty and minus.empty)
+
+    def test_results_are_cached(self):
+        adx, plus, minus = self.dmi.adx()
+        di_delta, di_ratio = self.dmi.di_difference()
+        self.assertIs(self.dmi.adx()[0], adx)
+        self.assertEqual(len(self.dmi._results), 1)
+        pd.testing.assert_series_equal(
+            di_delta, (plus - minus).rename("DI_Delta")
+        )
+        pd.testing.assert_series_equal(
+            di_ratio, (plus / minus).rename("DI_Ratio")
+        )
+
+    def test_dmi(self):
+        result = self.dmi.dmi(14, 14)
+        adx, plus, minus = self.dmi.adx(14, 14)
+        self.assertListEqual(
+            list(result.columns), ["ADX", "DI+", "DI-", "DI_Delta", "DI_Ratio"]
+        )
+        pd.testing.assert_series_equal(result["DI+"], plus)
+        pd.testing.assert_series_equal(result["ADX"].dropna(), adx)
+
+    def test_true_range(self):
+        high = self.source["high"]
+        low = self.source["low"]
+        previous_close = self.source["close"].shift()
+        expected = np.maximum(
+            high - low,
+            np.maximum(
+                (high - previous_close).abs(),
+                (low - previous_close).abs(),
+            ),
+        )
+        pd.testing.assert_series_equal(self.dmi.true_range(), expected)
+
+        expected.iloc[0] = high.iloc[0] - low.iloc[0]
+        pd.testing.assert_series_equal(
+            atr(high, low, self.source["close"], 14),
+            expected.rolling(14).mean(),
+        )
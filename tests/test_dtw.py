@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from src.tradingview_indicators.dtw import dtw
+from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
+from src.tradingview_indicators.utils import DynamicTimeWarping
+
+
+class TestDTW(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.input_x = np.random.rand(60).cumsum()
+        self.input_y = np.random.rand(45).cumsum()
+
+    def reference_dtw(self, input_x, input_y):
+        cost = np.full((len(input_x) + 1, len(input_y) + 1), np.inf)
+        cost[0, 0] = 0
+        for i in range(1, len(input_x) + 1):
+            for j in range(1, len(input_y) + 1):
+                cost[i, j] = abs(input_x[i - 1] - input_y[j - 1]) + min(
+                    cost[i - 1, j], cost[i, j - 1], cost[i - 1, j - 1]
+                )
+        return cost[-1, -1]
+
+    def assert_valid_path(self, path_x, path_y, len_x, len_y):
+        self.assertEqual((path_x[0], path_y[0]), (0, 0))
+        self.assertEqual((path_x[-1], path_y[-1]), (len_x - 1, len_y - 1))
+        self.assertTrue(np.isin(np.diff(path_x), [0, 1]).all())
+        self.assertTrue(np.isin(np.diff(path_y), [0, 1]).all())
+
+    def test_dtw_approximate(self):
+        distance, path_x, path_y = dtw([1, 2, 3, 4, 5], [2, 3, 4])
+
+        self.assertEqual(distance, 2.0)
+        self.assertListEqual(
+            list(zip(path_x.tolist(), path_y.tolist())),
+            [(0, 0), (1, 0), (2, 1), (3, 2), (4, 2)],
+        )
+
+    def test_dtw_exact(self):
+        distance, path_x, path_y = dtw(
+            self.input_x, self.input_y, method="exact"
+        )
+        cost = np.abs(self.input_x[path_x] - self.input_y[path_y]).sum()
+
+        self.assertAlmostEqual(
+            distance, self.reference_dtw(self.input_x, self.input_y)
+        )
+        self.assertAlmostEqual(distance, cost)
+        self.assert_valid_path(path_x, path_y, 60, 45)
+
+    def test_dtw_bands(self):
+        exact_distance = dtw(self.input_x, self.input_y, method="exact")[0]
+        for band in ("sakoe_chiba", "itakura"):
+            distance, path_x, path_y = dtw(
+                self.input_x, self.input_y, method="exact", radius=3, band=band
+            )
+            self.assertGreaterEqual(distance, exact_distance - 1e-9)
+            self.assert_valid_path(path_x, path_y, 60, 45)
+
+    def test_dtw_invalid_arguments(self):
+        with self.assertRaises(InvalidArgumentError):
+            dtw(self.input_x, self.input_y, method="invalid")
+        with self.assertRaises(InvalidArgumentError):
+            dtw(self.input_x, self.input_y, method="exact", band="invalid")
+        with self.assertRaises(InvalidArgumentError):
+            dtw([], self.input_y)
+
+    def test_dynamic_time_warping(self):
+        dtw_class = DynamicTimeWarping(
+            pd.Series(self.input_x), pd.Series(self.input_y)
+        )
+        distance, path_x, path_y = dtw(self.input_x, self.input_y)
+
+        self.assertEqual(dtw_class.distance, distance)
+        self.assertListEqual(
+            dtw_class.path, list(zip(path_x.tolist(), path_y.tolist()))
+        )
+        self.assertListEqual(dtw_class.dtw[0].tolist(), path_x.tolist())
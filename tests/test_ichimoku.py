@@ -0,0 +1,83 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.ichimoku import ichimoku, IchimokuState
+
+class TestIchimoku(unittest.TestCase):
+    def setUp(self):
+        self.source = (
+            pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+            .iloc[:300]
+        )
+        self.periods = (9, 26, 52, 26)
+
+    def test_ichimoku(self):
+        result = ichimoku(self.source, *self.periods)
+        high = self.source["high"]
+        low = self.source["low"]
+
+        def donchian(length):
+            return (
+                high.rolling(length).max() + low.rolling(length).min()
+            ) / 2
+
+        lead_line1 = (donchian(9) + donchian(26)) / 2
+        expected = pd.DataFrame(
+            {
+                "conversion_line": donchian(9),
+                "base_line": donchian(26),
+                "lagging_span": self.source["close"].shift(-25),
+                "lead_line1": lead_line1,
+                "lead_line2": donchian(52),
+                "leading_span_a": lead_line1.shift(25),
+                "leading_span_b": donchian(52).shift(25),
+            }
+        )
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_ichimoku_state(self):
+        expected = ichimoku(self.source, *self.periods)
+        expected["lagging_span"] = self.source["close"]
+
+        state = IchimokuState.from_source(
+            self.source.iloc[:200], *self.periods
+        )
+        bars = self.source[["high", "low", "close"]].iloc[200:]
+        result = pd.DataFrame(
+            [dict(state.update(*bar)) for bar in bars.to_numpy()],
+            index=bars.index,
+        )
+        pd.testing.assert_frame_equal(
+            result, expected.iloc[200:], check_names=False
+        )
+
+    def test_ichimoku_state_nan(self):
+        source = self.source.copy()
+        source.iloc[100, source.columns.get_loc("high")] = np.nan
+        expected = ichimoku(source, *self.periods)
+
+        state = IchimokuState(*self.periods)
+        bars = source[["high", "low", "close"]].to_numpy()
+        result = pd.DataFrame(
+            [dict(state.update(*bar)) for bar in bars],
+            index=source.index,
+        )
+        pd.testing.assert_frame_equal(
+            result.drop(columns="lagging_span"),
+            expected.drop(columns="lagging_span"),
+            check_names=False,
+        )
+
+    def test_ichimoku_state_snapshot_restore(self):
+        state = IchimokuState.from_source(self.source, *self.periods)
+        snapshot = state.snapshot()
+        expected = dict(state.update(20000.0, 19000.0, 19500.0))
+
+        state.restore(snapshot)
+        self.assertDictEqual(
+            dict(state.update(20000.0, 19000.0, 19500.0)), expected
+        )
+
+    def test_ichimoku_state_invalid_displacement(self):
+        with self.assertRaises(ValueError):
+            IchimokuState(9, 26, 52, 0)
@@ -0,0 +1,44 @@
+import unittest
+
+import pandas as pd
+import numpy as np
+from scipy.stats import linregress
+from src.tradingview_indicators.linreg import linreg, linreg_stats
+
+
+class TestLinReg(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(100).cumsum() + 100)
+        self.length = 14
+
+    def test_linreg(self):
+        window = self.source.to_numpy()[-self.length:]
+        fit = linregress(np.arange(self.length), window)
+
+        for offset in (0, 3):
+            result = linreg(self.source, self.length, offset)
+            expected = fit.intercept + fit.slope * (self.length - 1 - offset)
+
+            self.assertEqual(result.name, "LinReg")
+            self.assertEqual(result.isna().sum(), self.length - 1)
+            self.assertAlmostEqual(result.iloc[-1], expected)
+
+    def test_linreg_stats(self):
+        result = linreg_stats(self.source, self.length, fit_stats=True)
+        window = self.source.to_numpy()[-self.length:]
+        fit = linregress(np.arange(self.length), window)
+
+        self.assertAlmostEqual(result["slope"].iloc[-1], fit.slope)
+        self.assertAlmostEqual(result["intercept"].iloc[-1], fit.intercept)
+        self.assertAlmostEqual(result["r2"].iloc[-1], fit.rvalue ** 2)
+
+    def test_linreg_dataframe(self):
+        source = pd.DataFrame({"A": self.source, "B": self.source * 2})
+        result = linreg(source, self.length)
+
+        for column in source.columns:
+            np.testing.assert_allclose(
+                result[column].to_numpy(),
+                linreg(source[column], self.length).to_numpy(),
+            )
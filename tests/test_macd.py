@@ -2,7 +2,7 @@ import unittest
 
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators import MACD
+from src.tradingview_indicators import MACD, macd_grid
 
 
 class TestMACD(unittest.TestCase):
@@ -202,3 +202,75 @@ class TestMACD(unittest.TestCase):
         macd_df.columns = self.columns
 
         pd.testing.assert_frame_equal(ref_df, macd_df)
+
+
+class TestMACDGrid(unittest.TestCase):
+    def setUp(self):
+        self.source = (
+            pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+            ["close"].iloc[:300]
+        )
+        self.fast_lengths = [5, 12]
+        self.slow_lengths = [26, 30]
+        self.signal_lengths = [3, 9]
+
+    def test_macd_grid_matches_macd(self):
+        for ma_method in ("sma", "ema", "rma"):
+            grid = macd_grid(
+                self.source,
+                self.fast_lengths,
+                self.slow_lengths,
+                self.signal_lengths,
+                ma_method=ma_method,
+                signal_method=ma_method,
+            )
+
+            for fast in self.fast_lengths:
+                for slow in self.slow_lengths:
+                    for signal in self.signal_lengths:
+                        expected = MACD(
+                            self.source, fast, slow, signal,
+                            ma_method=ma_method, signal_method=ma_method,
+                        )
+                        result = pd.DataFrame({
+                            "macd": grid["macd"][(fast, slow)],
+                            "signal": grid["signal"][(fast, slow, signal)],
+                            "histogram": (
+                                grid["histogram"][(fast, slow, signal)]
+                            ),
+                        }).loc[expected.index]
+
+                        pd.testing.assert_frame_equal(result, expected)
+
+    def test_macd_grid_shape(self):
+        grid = macd_grid(
+            self.source,
+            self.fast_lengths,
+            self.slow_lengths,
+            self.signal_lengths,
+        )
+
+        self.assertEqual(grid["macd"].shape, (300, 4))
+        self.assertEqual(grid["signal"].shape, (300, 8))
+        self.assertEqual(grid["histogram"].shape, (300, 8))
+
+    def test_macd_grid_n_jobs(self):
+        grid = macd_grid(
+            self.source,
+            self.fast_lengths,
+            self.slow_lengths,
+            self.signal_lengths,
+            signal_method="sma",
+        )
+        parallel_grid = macd_grid(
+            self.source,
+            self.fast_lengths,
+            self.slow_lengths,
+            self.signal_lengths,
+            signal_method="sma",
+            n_jobs=2,
+        )
+
+        self.assertEqual(grid.keys(), parallel_grid.keys())
+        for key, frame in grid.items():
+            pd.testing.assert_frame_equal(parallel_grid[key], frame)
@@ -2,7 +2,20 @@ import unittest
 
 import pandas as pd
 import numpy as np
-from src.tradingview_indicators.moving_average import sma, ema, sema, rma
+from src.tradingview_indicators.moving_average import (
+    sma,
+    ema,
+    sema,
+    rma,
+    sma_grid,
+    ema_grid,
+    rma_grid,
+    sema_grid,
+    SmaState,
+    EmaState,
+    RmaState,
+    SemaState,
+)
 
 
 class TestMovingAverage(unittest.TestCase):
@@ -83,3 +96,174 @@ class TestMovingAverage(unittest.TestCase):
     def test_rma_invalid_method(self):
         with self.assertRaises(TypeError):
             rma(self.source, self.length, method="invalid")
+
+
+class TestMovingAverageState(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(100) * 100 + 50)
+        self.length = 14
+
+    def stream(self, state, values):
+        return np.array([state.update(value) for value in values])
+
+    def test_ema_state(self):
+        result = self.stream(EmaState(self.length), self.source)
+        expected = ema(self.source, self.length).to_numpy()
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_rma_state(self):
+        result = self.stream(RmaState(self.length), self.source)
+        expected = rma(self.source, self.length).to_numpy()
+
+        self.assertTrue(np.isnan(result[:self.length - 1]).all())
+        np.testing.assert_array_equal(
+            result[self.length - 1:], expected[self.length - 1:]
+        )
+
+    def test_sma_state(self):
+        result = self.stream(SmaState(self.length), self.source)
+        expected = sma(self.source, self.length).to_numpy()
+
+        self.assertTrue(np.isnan(result[:self.length - 1]).all())
+        np.testing.assert_array_equal(result[self.length - 1:], expected)
+
+    def test_sema_state(self):
+        for smooth in (1, 2, 3):
+            result = self.stream(SemaState(self.length, smooth), self.source)
+            expected = sema(self.source, self.length, smooth).to_numpy()
+
+            np.testing.assert_array_equal(result, expected)
+
+    def test_state_from_source(self):
+        states = [
+            (EmaState, ema, (self.length,)),
+            (RmaState, rma, (self.length,)),
+            (SmaState, sma, (self.length,)),
+            (SemaState, sema, (self.length, 3)),
+        ]
+        for state_class, function, args in states:
+            state = state_class.from_source(self.source[:60], *args)
+            result = self.stream(state, self.source[60:])
+            expected = function(self.source, *args).to_numpy()[-40:]
+
+            np.testing.assert_array_equal(result, expected)
+
+    def test_state_from_short_source(self):
+        states = [
+            (EmaState, ema, (self.length,)),
+            (RmaState, rma, (self.length,)),
+            (SmaState, sma, (self.length,)),
+            (SemaState, sema, (self.length, 2)),
+            (SemaState, sema, (self.length, 3)),
+        ]
+        for state_class, function, args in states:
+            for seed_length in (0, 5, self.length - 1):
+                state = state_class.from_source(
+                    self.source[:seed_length], *args
+                )
+                result = self.stream(state, self.source[seed_length:])
+                expected = function(self.source, *args).to_numpy()[-80:]
+
+                np.testing.assert_array_equal(result[-80:], expected)
+
+    def test_state_snapshot_restore(self):
+        state = SemaState(self.length, 3)
+        self.stream(state, self.source[:50])
+        snapshot = state.snapshot()
+        first_run = self.stream(state, self.source[50:])
+
+        state.restore(snapshot)
+        second_run = self.stream(state, self.source[50:])
+
+        np.testing.assert_array_equal(first_run, second_run)
+
+
+class TestMovingAverage2D(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.DataFrame(
+            np.random.rand(100, 4) * 100 + 50,
+            columns=["A", "B", "C", "D"],
+        )
+        self.source.iloc[:30, 1] = np.nan
+        self.source.iloc[:95, 2] = np.nan
+        self.length = 14
+
+    def test_columns_match_1d(self):
+        for function in (sma, ema, rma):
+            result = function(self.source, self.length)
+
+            pd.testing.assert_index_equal(result.index, self.source.index)
+            pd.testing.assert_index_equal(result.columns, self.source.columns)
+
+            for column in self.source.columns:
+                expected = function(self.source[column].dropna(), self.length)
+                pd.testing.assert_series_equal(
+                    result[column].dropna(),
+                    expected,
+                    check_names=False,
+                )
+
+    def test_ndarray_input(self):
+        values = self.source.to_numpy()
+        result = ema(values, self.length)
+
+        self.assertIsInstance(result, np.ndarray)
+        np.testing.assert_array_equal(
+            result, ema(self.source, self.length).to_numpy()
+        )
+
+    def test_1d_ndarray_input(self):
+        source = self.source["A"]
+        for function in (sma, ema, rma):
+            result = function(source.to_numpy(), self.length)
+
+            self.assertIsInstance(result, np.ndarray)
+            np.testing.assert_array_equal(
+                result, function(source, self.length).to_numpy()
+            )
+
+
+class TestMovingAverageGrid(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(100) * 100 + 50)
+        self.lengths = [2, 5, 14, 50, 200]
+
+    def test_grids_match_1d(self):
+        grids = [
+            (sma_grid, sma, ()),
+            (ema_grid, ema, ()),
+            (rma_grid, rma, ()),
+            (sema_grid, sema, (2,)),
+            (sema_grid, sema, (3,)),
+        ]
+        for grid_function, function, args in grids:
+            result = grid_function(self.source, self.lengths, *args)
+
+            self.assertEqual(list(result.columns), self.lengths)
+            for length in self.lengths:
+                expected = function(self.source, length, *args)
+                np.testing.assert_allclose(
+                    result[length].dropna().to_numpy(),
+                    expected.to_numpy(),
+                )
+
+    def test_sma_grid_long_series(self):
+        source = pd.Series(
+            1e5 + np.random.standard_normal(500_000).cumsum()
+        )
+        result = sma_grid(source, [14, 50])
+        for length in (14, 50):
+            np.testing.assert_allclose(
+                result[length].dropna().to_numpy(),
+                sma(source, length).to_numpy(),
+                rtol=0,
+                atol=1e-9,
+            )
+
+    def test_grid_invalid_lengths(self):
+        with self.assertRaises(ValueError):
+            ema_grid(self.source, [0, 5])
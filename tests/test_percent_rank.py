@@ -0,0 +1,71 @@
+import unittest
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.percent_rank import (
+    percentrank,
+    PercentRankState,
+)
+
+class TestPercentRank(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.randint(0, 20, 300).astype(float))
+        self.source.iloc[150] = np.nan
+        self.length = 14
+
+    def test_percentrank(self):
+        expected = self.source.rolling(self.length).apply(
+            lambda x: pd.Series(x).rank(pct=True).iloc[-1] * 100
+        ).rename("PercentRank")
+        result = percentrank(self.source, self.length)
+
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_percentrank_tradingview(self):
+        values = self.source.to_numpy()
+        expected = np.full(len(values), np.nan)
+        for i in range(self.length, len(values)):
+            window = values[i - self.length : i + 1]
+            if not np.isnan(window).any():
+                expected[i] = (
+                    np.sum(window[:-1] <= values[i]) / self.length * 100
+                )
+
+        result = percentrank(self.source, self.length, "tradingview")
+        np.testing.assert_allclose(result.to_numpy(), expected, rtol=1e-12)
+
+    def test_percentrank_dataframe(self):
+        source = pd.DataFrame(
+            {"a": self.source, "b": self.source[::-1].to_numpy()}
+        )
+        result = percentrank(source, self.length)
+
+        for column in source.columns:
+            pd.testing.assert_series_equal(
+                result[column],
+                percentrank(source[column], self.length).rename(column),
+            )
+
+    def test_percent_rank_state(self):
+        for method in ["average", "tradingview"]:
+            expected = percentrank(self.source, self.length, method)
+
+            state = PercentRankState.from_source(
+                self.source.iloc[:100], self.length, method
+            )
+            result = [state.update(value) for value in self.source[100:]]
+            np.testing.assert_array_equal(
+                result, expected.iloc[100:].to_numpy()
+            )
+
+    def test_percent_rank_state_snapshot_restore(self):
+        state = PercentRankState.from_source(self.source, self.length)
+        snapshot = state.snapshot()
+        expected = state.update(7.0)
+
+        state.restore(snapshot)
+        self.assertEqual(state.update(7.0), expected)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            percentrank(self.source, self.length, "dense")
@@ -0,0 +1,87 @@
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.rolling_extremum import (
+    highest,
+    lowest,
+    RollingExtremumState,
+)
+
+
+class TestRollingExtremum(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(200) * 100 + 50)
+        self.length = 14
+
+    def test_highest(self):
+        expected = self.source.rolling(self.length).max()
+        result = highest(self.source, self.length)
+
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_lowest(self):
+        expected = self.source.rolling(self.length).min()
+        result = lowest(self.source, self.length)
+
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_nan(self):
+        source = self.source.copy()
+        source.iloc[[20, 21, 100]] = np.nan
+
+        pd.testing.assert_series_equal(
+            highest(source, self.length),
+            source.rolling(self.length).max(),
+        )
+        pd.testing.assert_series_equal(
+            lowest(source, self.length),
+            source.rolling(self.length).min(),
+        )
+
+    def test_lengths(self):
+        lengths = [9, 26, 52]
+        result = highest(self.source, lengths)
+
+        self.assertListEqual(list(result.columns), lengths)
+        for length in lengths:
+            pd.testing.assert_series_equal(
+                result[length],
+                self.source.rolling(length).max().rename(length),
+            )
+
+    def test_dataframe(self):
+        source = pd.DataFrame(np.random.rand(200, 4))
+        source.iloc[:10, 1] = np.nan
+
+        pd.testing.assert_frame_equal(
+            lowest(source, self.length), source.rolling(self.length).min()
+        )
+
+        result = highest(source, [5, self.length])
+        pd.testing.assert_frame_equal(result[5], source.rolling(5).max())
+        pd.testing.assert_frame_equal(
+            result[self.length], source.rolling(self.length).max()
+        )
+
+    def test_invalid_length(self):
+        with self.assertRaises(ValueError):
+            highest(self.source, 0)
+        with self.assertRaises(ValueError):
+            lowest(self.source, [])
+
+    def test_rolling_extremum_state(self):
+        source = self.source.copy()
+        source.iloc[[120, 150]] = np.nan
+        lengths = [5, self.length]
+
+        state = RollingExtremumState.from_source(
+            source.iloc[:100], lengths, -1
+        )
+        result = np.array(
+            [state.update(value).copy() for value in source[100:]]
+        )
+
+        expected = lowest(source, lengths).iloc[100:].to_numpy()
+        np.testing.assert_array_equal(result, expected)
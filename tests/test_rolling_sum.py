@@ -0,0 +1,44 @@
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.rolling_sum import rolling_sum, rolling_mean
+
+
+class TestRollingSum(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(200) * 100 + 50)
+        self.length = 14
+
+    def test_rolling_sum(self):
+        expected = self.source.rolling(self.length).sum()
+        result = rolling_sum(self.source, self.length)
+
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_rolling_mean(self):
+        expected = self.source.rolling(self.length).mean()
+        result = rolling_mean(self.source, self.length)
+
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_rolling_mean_nan(self):
+        source = self.source.copy()
+        source.iloc[[20, 21, 100]] = np.nan
+
+        expected = source.rolling(self.length).mean()
+        result = rolling_mean(source, self.length)
+        pd.testing.assert_series_equal(result, expected)
+
+        expected = source.rolling(self.length, min_periods=1).mean()
+        expected.iloc[:self.length - 1] = np.nan
+        result = rolling_mean(source, self.length, skipna=True)
+        pd.testing.assert_series_equal(result, expected)
+
+    def test_long_series_precision(self):
+        source = pd.Series(np.random.rand(1_000_000) * 1e6 + 1e9)
+        window_sum = rolling_sum(source, 50).iloc[-1]
+        expected = np.sum(source.to_numpy()[-50:])
+
+        self.assertAlmostEqual(window_sum, expected, delta=1e-6)
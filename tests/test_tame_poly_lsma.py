@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+from src.tradingview_indicators.tame_poly_lsma import (
+    tame_poly_lsma,
+    tame_poly_weights,
+    kernel,
+    precompute_s,
+)
+
+
+class TestTamePolyLSMA(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = np.random.rand(600).cumsum() + 100
+
+    def reference_lsma(self, src, length, order):
+        s_values = precompute_s(order)
+        result = np.full(len(src), np.nan)
+        for i in range(length, len(src)):
+            result[i] = sum(
+                (
+                    kernel((j + 1) / length, order, s_values)
+                    - kernel(j / length, order, s_values)
+                ) * src[i - length + j]
+                for j in range(length)
+            )
+        return result
+
+    def test_direct(self):
+        result = tame_poly_lsma(self.source, 20, 5, "direct")
+        expected = self.reference_lsma(self.source, 20, 5)
+
+        np.testing.assert_array_equal(result, expected)
+
+    def test_fft(self):
+        result = tame_poly_lsma(self.source, 300, 10, "fft")
+        expected = self.reference_lsma(self.source, 300, 10)
+
+        np.testing.assert_allclose(result, expected)
+
+    def test_2d(self):
+        source = np.column_stack([self.source, self.source[::-1]])
+        for method in ("direct", "fft"):
+            result = tame_poly_lsma(source, 20, 5, method)
+
+            np.testing.assert_allclose(
+                result[:, 1], tame_poly_lsma(self.source[::-1], 20, 5)
+            )
+
+    def test_weights_cached(self):
+        self.assertIs(tame_poly_weights(20, 5), tame_poly_weights(20, 5))
+
+    def test_invalid_length(self):
+        with self.assertRaises(ValueError):
+            tame_poly_lsma(self.source, 1000, 5)
@@ -2,6 +2,7 @@ import unittest
 import pandas as pd
 import numpy as np
 from src.tradingview_indicators.TRIX import TRIX
+from src.tradingview_indicators.moving_average import sma, ema, sema, rma
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 
@@ -114,4 +115,65 @@ class TestTrix(unittest.TestCase):
 
     def test_trix_invalid_method(self):
         with self.assertRaises(InvalidArgumentError):
-            TRIX(self.source, self.length, self.signal_length, "invalid")
\ No newline at end of file
+            TRIX(self.source, self.length, self.signal_length, "invalid")
+
+    def test_trix_nested_moving_averages(self):
+        log_source = np.log(self.tema_source)
+        nested_ma = {
+            "sma": lambda source: sma(source, self.length),
+            "ema": lambda source: ema(source, self.length),
+            "dema": lambda source: sema(source, self.length, 2),
+            "tema": lambda source: sema(source, self.length, 3),
+            "rma": lambda source: rma(source, self.length),
+        }
+        for ma_method, moving_average in nested_ma.items():
+            expected = (
+                moving_average(moving_average(moving_average(log_source)))
+                .diff(3)
+                * 10000
+            ).rename("TRIX")
+
+            result = TRIX(self.tema_source, self.length, 3, ma_method)
+
+            pd.testing.assert_series_equal(result, expected)
+
+    def test_trix_invalid_signal_length(self):
+        with self.assertRaises(ValueError):
+            TRIX(self.source, self.length, 0, "ema")
+
+
+class TestTrix2D(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source[["open", "high", "low", "close"]].iloc[:200]
+        self.source.iloc[:20, 1] = np.nan
+        self.length = 9
+
+    def test_trix_dataframe(self):
+        for ma_method in ("sma", "ema", "dema", "tema", "rma"):
+            result = TRIX(self.source, self.length, 2, ma_method)
+
+            for column in self.source.columns:
+                expected = TRIX(
+                    self.source[column].dropna(), self.length, 2, ma_method
+                )
+                pd.testing.assert_series_equal(
+                    result[column].loc[expected.index],
+                    expected,
+                    check_names=False,
+                )
+
+    def test_trix_dataframe_keeps_source(self):
+        np.random.seed(42)
+        source = pd.DataFrame(np.random.rand(100, 3) + 1)
+        original = source.copy()
+        result = TRIX(source, self.length, 2)
+
+        pd.testing.assert_frame_equal(source, original)
+        for column in source.columns:
+            expected = TRIX(source[column], self.length, 2)
+            pd.testing.assert_series_equal(
+                result[column].loc[expected.index],
+                expected,
+                check_names=False,
+            )
@@ -2,6 +2,8 @@ import unittest
 import pandas as pd
 import numpy as np
 from src.tradingview_indicators.tsi import tsi
+from src.tradingview_indicators.SMIO import smi_osc
+from src.tradingview_indicators.moving_average import sma, ema, sema, rma
 from src.tradingview_indicators.errors_exceptions import InvalidArgumentError
 
 
@@ -116,4 +118,40 @@ class TestTsi(unittest.TestCase):
 
     def test_tsi_invalid_method(self):
         with self.assertRaises(InvalidArgumentError):
-            tsi(self.source, self.short_length, self.long_length, "invalid")
\ No newline at end of file
+            tsi(self.source, self.short_length, self.long_length, "invalid")
+
+class TestTsiNested(unittest.TestCase):
+    def setUp(self):
+        source = pd.read_csv("example/BTCUSDT_1d_spot.csv", index_col=0)
+        self.source = source["close"].iloc[:300]
+        self.nested_ma = {
+            "sma": lambda source, length: sma(source, length),
+            "ema": lambda source, length: ema(source, length),
+            "dema": lambda source, length: sema(source, length, 2),
+            "tema": lambda source, length: sema(source, length, 3),
+            "rma": lambda source, length: rma(source, length),
+        }
+
+    def test_tsi_nested_moving_averages(self):
+        price_change = self.source.diff().iloc[1:]
+        for ma_method, moving_average in self.nested_ma.items():
+            long_smoothed = moving_average(
+                moving_average(price_change, 13), 25
+            )
+            absolute_long_smoothed = moving_average(
+                moving_average(price_change.abs(), 13), 25
+            )
+            expected = (long_smoothed / absolute_long_smoothed).rename("TSI")
+
+            result = tsi(self.source, 13, 25, ma_method)
+
+            pd.testing.assert_series_equal(result, expected)
+
+    def test_smi_osc_nested_moving_averages(self):
+        erg = tsi(self.source, 5, 20)
+        for ma_method, moving_average in self.nested_ma.items():
+            expected = (erg - moving_average(erg, 5)).rename("SMIO")
+
+            result = smi_osc(self.source, 20, 5, 5, ma_method)
+
+            pd.testing.assert_series_equal(result, expected)
@@ -0,0 +1,50 @@
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.wma import wma
+
+
+class TestWMA(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(100) * 100 + 50)
+        self.length = 9
+
+    def reference_wma(self, values, length):
+        weights = np.arange(1, length + 1)
+        wma_values = np.full(len(values), np.nan)
+        for i in range(length - 1, len(values)):
+            window = values[i - length + 1 : i + 1]
+            wma_values[i] = np.dot(window, weights) / weights.sum()
+        return wma_values
+
+    def test_wma(self):
+        result = wma(self.source, self.length)
+        expected = self.reference_wma(self.source.to_numpy(), self.length)
+
+        self.assertEqual(result.name, "WMA")
+        np.testing.assert_allclose(result.to_numpy(), expected)
+
+    def test_wma_nan(self):
+        source = self.source.copy()
+        source.iloc[[30, 33]] = np.nan
+
+        result = wma(source, self.length)
+        expected = self.reference_wma(source.to_numpy(), self.length)
+
+        np.testing.assert_allclose(result.to_numpy(), expected)
+
+    def test_wma_dataframe(self):
+        source = pd.DataFrame({"A": self.source, "B": self.source * 2})
+        result = wma(source, self.length)
+
+        for column in source.columns:
+            np.testing.assert_allclose(
+                result[column].to_numpy(),
+                wma(source[column], self.length).to_numpy(),
+            )
+
+    def test_wma_invalid_length(self):
+        with self.assertRaises(ValueError):
+            wma(self.source, 0)
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import numpy as np
+from src.tradingview_indicators.zscore import (
+    zscore,
+    rolling_zscore,
+    zscore_chunked,
+)
+
+
+class TestZScore(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(42)
+        self.source = pd.Series(np.random.rand(500) * 100 + 50)
+        self.source.iloc[[20, 21, 300]] = np.nan
+        self.length = 14
+
+    def test_rolling_zscore(self):
+        for ddof in [0, 1]:
+            rolling = self.source.rolling(self.length)
+            expected = (
+                (self.source - rolling.mean()) / rolling.std(ddof=ddof)
+            ).rename("ZScore")
+            result = rolling_zscore(self.source, self.length, ddof=ddof)
+            pd.testing.assert_series_equal(result, expected, rtol=1e-10)
+
+    def test_expanding_zscore(self):
+        expanding = self.source.expanding()
+        expected = (
+            (self.source - expanding.mean()) / expanding.std(ddof=1)
+        ).rename("ZScore")
+        result = rolling_zscore(self.source, mode="expanding", ddof=1)
+        pd.testing.assert_series_equal(result, expected, rtol=1e-10)
+
+    def test_ewm_zscore(self):
+        ewm = self.source.ewm(
+            span=self.length, adjust=False, ignore_na=True
+        )
+        expected = (
+            (self.source - ewm.mean()) / np.sqrt(ewm.var(bias=True))
+        ).rename("ZScore")
+        result = rolling_zscore(self.source, self.length, mode="ewm")
+        pd.testing.assert_series_equal(result, expected, rtol=1e-10)
+
+    def test_rolling_zscore_dataframe(self):
+        source = pd.DataFrame({"a": self.source, "b": self.source * 2})
+        result = rolling_zscore(source, self.length)
+
+        for column in source.columns:
+            pd.testing.assert_series_equal(
+                result[column],
+                rolling_zscore(source[column], self.length).rename(column),
+            )
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            rolling_zscore(self.source, mode="median")
+        with self.assertRaises(ValueError):
+            rolling_zscore(self.source)
+
+    def test_zscore_chunked(self):
+        sample = np.random.rand(10_003, 3) * 10 + 5
+        np.testing.assert_allclose(
+            zscore_chunked(sample, ddof=1, chunk_size=999),
+            zscore(sample, ddof=1),
+            atol=1e-12,
+        )
+
+        sample[5, 1] = np.nan
+        result = zscore_chunked(sample, chunk_size=999)
+        self.assertTrue(np.isnan(result[:, 1]).all())
+        self.assertFalse(np.isnan(result[:, [0, 2]]).any())
+
+    def test_zscore_chunked_memmap(self):
+        sample = np.random.rand(5_000)
+        with tempfile.TemporaryDirectory() as directory:
+            source = np.lib.format.open_memmap(
+                os.path.join(directory, "source.npy"),
+                mode="w+",
+                shape=sample.shape,
+            )
+            source[:] = sample
+            out = np.lib.format.open_memmap(
+                os.path.join(directory, "out.npy"),
+                mode="w+",
+                shape=sample.shape,
+            )
+            zscore_chunked(source, chunk_size=512, out=out)
+            np.testing.assert_allclose(out, zscore(sample), atol=1e-12)
+            del source, out